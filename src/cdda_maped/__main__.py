@@ -10,7 +10,7 @@ from typing import Optional
 from PySide6.QtWidgets import QApplication, QMessageBox
 
 from . import __version__
-from .settings import AppSettings
+from .settings import get_app_settings
 from .gui.main_window import MainWindow
 from .utils.gui_log_manager import get_gui_log_manager
 from .utils.logging_config import setup_logging
@@ -40,7 +40,7 @@ def main() -> int:
     logger = logging.getLogger(f"{__name__}.main")
     try:
         # Load configuration first
-        settings = AppSettings()
+        settings = get_app_settings()
 
         # Create Qt application first (required for GUI logging)
         app = QApplication(sys.argv)
@@ -49,6 +49,12 @@ def main() -> int:
         app.setOrganizationName("vetall812")
         app.setWindowIcon(get_app_icon())
 
+        # Read stylesheets off the GUI thread while the rest of startup runs
+        style_manager.preload_async(["main", "map_view"])
+
+        # Persist settings written without an explicit sync() before exiting
+        app.aboutToQuit.connect(settings.sync)
+
         # Setup logging with GUI enabled if configured (singleton initialized automatically)
         setup_logging(settings)
 
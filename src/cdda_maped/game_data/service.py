@@ -9,7 +9,7 @@ import logging
 import re
 from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List, Optional, TYPE_CHECKING, Dict, Any, Mapping
+from typing import List, Optional, TYPE_CHECKING, Dict, Any, Mapping, Sequence, Tuple
 
 from .loaders import GameDataFileLoader
 from .managers import ObjectsManager
@@ -47,6 +47,11 @@ class GameDataService:
         # Initialize resolver (will be configured after loading)
         self._resolver: Optional[InheritanceResolver] = None
 
+        # collect_resolved_objects results keyed by (types, mod priority)
+        self._collection_cache: Dict[
+            Tuple[Tuple[str, ...], Tuple[str, ...]], GameDataCollection
+        ] = {}
+
         self.logger.info(f"Initializing GameDataService with path: {game_path}")
         self._load_data()
         self._setup_resolvers()
@@ -266,20 +271,43 @@ class GameDataService:
         """Return active mods order, core last if included."""
         if not self.settings:
             return []
-        active = self.settings.active_mods.copy()
+        active = self.settings.active_mods_tuple
         if self.settings.always_include_core:
-            active = [m for m in active if m != "dda"] + ["dda"]
-        return active
+            return [m for m in active if m != "dda"] + ["dda"]
+        return list(active)
+
+    def invalidate_cache(self) -> None:
+        """Drop cached collect_resolved_objects results (e.g., after mod changes)."""
+        self._collection_cache.clear()
 
     def collect_resolved_objects(
         self,
-        types: List[str],
+        types: Sequence[str],
         per_type_limits: Optional[Mapping[str, int]] = None,
     ) -> GameDataCollection:
         """Collect, resolve and deduplicate objects for provided types.
 
+        Unlimited collections are cached per (types, mod priority); the returned
+        list is shared between callers and must be treated as read-only.
+
         Returns list of dicts: { id, type, name, mod_id, _resolved_obj }
         """
+        if per_type_limits:
+            return self._collect_resolved_objects(types, per_type_limits)
+
+        cache_key = (tuple(types), tuple(self._compute_mod_priority()))
+        cached = self._collection_cache.get(cache_key)
+        if cached is None:
+            cached = self._collect_resolved_objects(types, None)
+            self._collection_cache[cache_key] = cached
+        return cached
+
+    def _collect_resolved_objects(
+        self,
+        types: Sequence[str],
+        per_type_limits: Optional[Mapping[str, int]],
+    ) -> GameDataCollection:
+        """Uncached implementation of collect_resolved_objects."""
         collected: GameDataCollection = []
 
         for object_type in types:
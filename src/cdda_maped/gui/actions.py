@@ -205,6 +205,9 @@ class MainWindowActions:
                 3000,
             )
 
+            # Collections cached for the previous mod order are no longer needed
+            mw.game_data_service.invalidate_cache()
+
             if hasattr(mw, "object_browser") and mw.object_browser:
                 mw.object_browser.refresh()
 
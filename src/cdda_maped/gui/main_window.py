@@ -13,7 +13,7 @@ from PySide6.QtWidgets import (
     QApplication,
 )
 
-from PySide6.QtCore import QTimer
+from PySide6.QtCore import QStandardPaths, QTimer
 from PySide6.QtGui import QAction, QCloseEvent, QShowEvent
 
 from ..settings import AppSettings
@@ -167,7 +167,12 @@ class MainWindow(QMainWindow):
                 app.processEvents()
 
             self.tileset_service = TilesetService(
-                str(self.settings.cdda_path), self.settings
+                str(self.settings.cdda_path),
+                self.settings,
+                cache_dir=QStandardPaths.writableLocation(
+                    QStandardPaths.StandardLocation.CacheLocation
+                )
+                or None,
             )
 
             if app:
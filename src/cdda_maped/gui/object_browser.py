@@ -4,7 +4,7 @@ Object browser widget for selecting game objects.
 Provides a searchable list of CDDA objects filtered by type.
 """
 
-from typing import Optional
+from typing import Any, Optional, Sequence
 import logging
 
 from PySide6.QtWidgets import (
@@ -15,10 +15,18 @@ from PySide6.QtWidgets import (
     QLabel,
     QPushButton,
     QComboBox,
-    QTreeWidget,
-    QTreeWidgetItem,
+    QTreeView,
+    QHeaderView,
+)
+from PySide6.QtCore import (
+    Qt,
+    Signal,
+    QAbstractTableModel,
+    QModelIndex,
+    QPersistentModelIndex,
+    QSortFilterProxyModel,
+    QTimer,
 )
-from PySide6.QtCore import Qt, Signal
 
 from cdda_maped.game_data.models import GameDataCollection
 
@@ -26,6 +34,110 @@ from ..game_data.service import GameDataService
 
 # Name extraction moved to game_data.collection
 
+# Delay before re-filtering after the last keystroke in the search box
+_SEARCH_DEBOUNCE_MS = 120
+
+# Maximum number of rows shown in the object list
+_DISPLAY_LIMIT = 200
+
+# UI type labels <-> actual CDDA type names
+_UI_TO_CDDA_TYPE = {
+    "monster": "MONSTER",
+    "terrain": "terrain",
+    "furniture": "furniture",
+    "item": "ITEM",
+}
+_CDDA_TYPE_TO_UI = {
+    "terrain": "terrain",
+    "furniture": "furniture",
+    "MONSTER": "monster",
+    "ITEM": "item",
+}
+
+# Column headers of the object list: [Mod] [Object ID] [Object Name]
+_HEADER_LABELS = ("Mod", "Object ID", "Object Name")
+
+
+class ObjectListModel(QAbstractTableModel):
+    """
+    Flat table model exposing (mod_id, id, name) rows of pre-resolved objects.
+
+    Rows are read straight from the backing list, so repopulating the view
+    is a single model reset instead of allocating one item per row.
+    """
+
+    def __init__(self, parent: Optional[QWidget] = None):
+        super().__init__(parent)
+        # One (mod_id, id, name) tuple per row, built by the caller in one batch
+        self._rows: list[tuple[str, str, str]] = []
+        # Object ID -> source row, for direct selection by ID
+        self._id_to_row: dict[str, int] = {}
+
+    def set_rows(self, rows: list[tuple[str, str, str]]) -> None:
+        """Replace the displayed (mod_id, id, name) rows with a single model reset."""
+        # Iterate backwards so the first row wins for duplicated IDs
+        id_to_row = {rows[row][1]: row for row in range(len(rows) - 1, -1, -1)}
+        self.beginResetModel()
+        self._rows = rows
+        self._id_to_row = id_to_row
+        self.endResetModel()
+
+    def index_for_id(self, object_id: str) -> QModelIndex:
+        """Return the first-column index of the row holding object_id.
+
+        Returns an invalid index if the object is not in the model.
+        """
+        row = self._id_to_row.get(object_id)
+        if row is None:
+            return QModelIndex()
+        return self.index(row, 0)
+
+    def rowCount(
+        self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()
+    ) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(
+        self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()
+    ) -> int:
+        return 0 if parent.isValid() else len(_HEADER_LABELS)
+
+    def data(
+        self,
+        index: QModelIndex | QPersistentModelIndex,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._rows[index.row()][index.column()]
+        if role == Qt.ItemDataRole.UserRole:
+            # Object ID for selection events
+            return self._rows[index.row()][1]
+        return None
+
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        if (
+            orientation == Qt.Orientation.Horizontal
+            and role == Qt.ItemDataRole.DisplayRole
+        ):
+            return _HEADER_LABELS[section]
+        return None
+
+
+class _ObjectTreeView(QTreeView):
+    """Tree view whose column size hints never measure item contents."""
+
+    def sizeHintForColumn(self, column: int) -> int:
+        # Column widths are fixed hints set by ObjectBrowser; skip walking the
+        # visible rows to measure text on expand/resize.
+        return self.columnWidth(column)
+
 
 class ObjectBrowser(QWidget):
     """
@@ -51,7 +163,21 @@ class ObjectBrowser(QWidget):
         self.game_data_service: Optional[GameDataService] = None
         self.app_settings = None  # Will be set when game data service is set
         self.all_objects: GameDataCollection = []
-        self.filtered_objects: GameDataCollection = []
+        # Parallel per-field lists over all_objects, rebuilt on each load, so
+        # filtering walks flat string lists instead of dicts
+        self._mod_ids: list[str] = []
+        self._ids: list[str] = []
+        self._names: list[str] = []
+        self._ids_lc: list[str] = []
+        self._names_lc: list[str] = []
+        # CDDA type -> indices into all_objects of that type
+        self._indices_by_type: dict[str, list[int]] = {}
+        # Indices into all_objects that passed the current filters
+        self.filtered_indices: Sequence[int] = []
+        # True when the search pass stopped early, so the match total is unknown
+        self._filtered_is_partial = False
+        # (type, search) of the last applied filter; None forces the next run
+        self._last_filter_key: Optional[tuple[str, str]] = None
 
         self.setup_ui()
 
@@ -78,9 +204,15 @@ class ObjectBrowser(QWidget):
         filter_layout.addWidget(QLabel("Search:"))
         self.search_edit = QLineEdit()
         self.search_edit.setPlaceholderText("Search by ID or name...")
-        self.search_edit.textChanged.connect(self.filter_objects)
         filter_layout.addWidget(self.search_edit)
 
+        # Coalesce fast typing into a single filter pass
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(_SEARCH_DEBOUNCE_MS)
+        self._filter_timer.timeout.connect(self.filter_objects)
+        self.search_edit.textChanged.connect(self._schedule_filter)
+
         # Clear button
         clear_btn = QPushButton("Clear")
         clear_btn.clicked.connect(self.clear_search)
@@ -88,26 +220,36 @@ class ObjectBrowser(QWidget):
 
         layout.addLayout(filter_layout)
 
-        # Object tree with columns
-        self.object_tree = QTreeWidget()
-        self.object_tree.setHeaderLabels(["Mod", "Object ID", "Object Name"])
+        # Object list: model -> sort proxy -> view
+        self.object_model = ObjectListModel(self)
+        self.proxy_model = QSortFilterProxyModel(self)
+        self.proxy_model.setSourceModel(self.object_model)
+
+        self.object_tree = _ObjectTreeView()
+        self.object_tree.setModel(self.proxy_model)
         self.object_tree.setSortingEnabled(True)  # Enable sorting by clicking headers
         self.object_tree.setRootIsDecorated(False)  # Hide tree expansion icons
+        self.object_tree.setUniformRowHeights(True)  # Skip per-row height queries
         self.object_tree.setAlternatingRowColors(
             True
         )  # Alternate row colors for better readability
 
-        # Set column widths
+        # Set column widths (user-resizable, never measured from contents)
+        header = self.object_tree.header()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        header.setStretchLastSection(True)
         self.object_tree.setColumnWidth(0, 120)  # Mod column
         self.object_tree.setColumnWidth(1, 200)  # Object ID column
         self.object_tree.setColumnWidth(2, 300)  # Object Name column
 
         # Connect signals (optional). MainWindow uses this widget only as a browser,
         # without any selection side-effects.
+        # currentChanged alone covers mouse, keyboard and Enter; also wiring
+        # clicked/activated would emit object_selected 2-3 times per action.
         if self._emit_selection_signals:
-            self.object_tree.itemClicked.connect(self.on_object_clicked)
-            self.object_tree.itemActivated.connect(self.on_object_activated)
-            self.object_tree.currentItemChanged.connect(self.on_current_item_changed)
+            self.object_tree.selectionModel().currentChanged.connect(
+                self.on_current_item_changed
+            )
 
         # Enable keyboard navigation
         self.object_tree.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
@@ -141,15 +283,8 @@ class ObjectBrowser(QWidget):
             self.type_combo.addItem("All")
 
             # Add mapped types with nice labels
-            type_labels = {
-                "terrain": "terrain",
-                "furniture": "furniture",
-                "MONSTER": "monster",
-                "ITEM": "item",
-            }
-
             for obj_type in sorted(set(mapped_types)):
-                label = type_labels.get(obj_type, obj_type)
+                label = _CDDA_TYPE_TO_UI.get(obj_type, obj_type)
                 self.type_combo.addItem(label)
 
             # Restore previous selection if possible
@@ -183,22 +318,50 @@ class ObjectBrowser(QWidget):
                 mapped_types = ["terrain", "furniture", "ITEM"]
 
             self.logger.debug(f"Loading objects for types: {mapped_types}")
+            # Normalized tuple so the service can reuse its cached collection
             self.all_objects = self.game_data_service.collect_resolved_objects(
-                mapped_types
+                tuple(sorted(set(mapped_types)))
             )
             self.logger.info(f"Loaded {len(self.all_objects)} objects.")
 
+            self._build_search_index()
+
             # Update type combo with loaded types
             self._update_type_combo(mapped_types)
 
+            self._last_filter_key = None
             self.filter_objects()
             self.object_tree.setFocus()
         except Exception as e:
             self.logger.error(f"Failed to load objects: {e}")
             self.status_label.setText(f"Error loading objects: {e}")
 
+    def _build_search_index(self):
+        """Split all_objects into parallel field lists and per-type index buckets.
+
+        Lowercase search keys are computed here once instead of on every
+        filter pass.
+        """
+        objects = self.all_objects
+        self._mod_ids = [obj.get("mod_id", "dda") for obj in objects]
+        self._ids = [obj.get("id", "unknown") for obj in objects]
+        self._names = [obj.get("name", "No name") for obj in objects]
+        self._ids_lc = [object_id.lower() for object_id in self._ids]
+        self._names_lc = [name.lower() for name in self._names]
+
+        self._indices_by_type = {}
+        for i, obj in enumerate(objects):
+            self._indices_by_type.setdefault(obj.get("type", ""), []).append(i)
+
+    def _schedule_filter(self):
+        """Restart the debounce timer for search-driven filtering."""
+        self._filter_timer.start()
+
     def filter_objects(self):
         """Filter objects based on current filters."""
+        # A direct call supersedes any pending debounced run
+        self._filter_timer.stop()
+
         if not self.all_objects:
             self.logger.debug("No objects to filter")
             return
@@ -206,113 +369,127 @@ class ObjectBrowser(QWidget):
         selected_type = self.type_combo.currentText()
         search_text = self.search_edit.text().lower()
 
-        self.logger.debug(
-            f"Filtering: type='{selected_type}', search='{search_text}'"
-        )  # Filter by type
+        # Signals unrelated to the filters may land here; skip identical rebuilds
+        filter_key = (selected_type, search_text)
+        if filter_key == self._last_filter_key:
+            return
+        self._last_filter_key = filter_key
+
+        self.logger.debug(f"Filtering: type='{selected_type}', search='{search_text}'")
+
+        # Filter by type. filtered_indices aliases a range or a type bucket; it is
+        # never mutated, and the search pass below builds a new list.
+        indices: Sequence[int]
         if selected_type == "All":
-            self.filtered_objects = self.all_objects[:]
+            indices = range(len(self.all_objects))
         else:
             # Map UI type names to actual CDDA type names
-            type_mapping = {
-                "monster": "MONSTER",
-                "terrain": "terrain",
-                "furniture": "furniture",
-                "item": "ITEM",
-            }
-            actual_type = type_mapping.get(selected_type.lower(), selected_type)
-
-            self.filtered_objects = [
-                obj for obj in self.all_objects if obj.get("type", "") == actual_type
-            ]
-
-        # Filter by search text (only if provided) - super fast with pre-resolved names
+            actual_type = _UI_TO_CDDA_TYPE.get(selected_type.lower(), selected_type)
+            indices = self._indices_by_type.get(actual_type, [])
+
+        # Filter by search text (only if provided) - uses pre-lowercased keys.
+        self._filtered_is_partial = False
         if search_text:
-            self.filtered_objects = [
-                obj
-                for obj in self.filtered_objects
-                if (
-                    search_text in obj.get("id", "").lower()
-                    or search_text in obj.get("name", "").lower()
-                )
-            ]
+            indices = self._search(indices, search_text)
+        self.filtered_indices = indices
 
         # Update list widget
         self.update_object_list()
 
+    def _search(self, indices: Sequence[int], search_text: str) -> list[int]:
+        """Return indices whose ID or name matches search_text.
+
+        Prefix matches are collected first: users mostly type the start of an
+        ID, and startswith rejects non-matching strings sooner than a substring
+        scan. Substring matches are only scanned for if prefix matches did not
+        fill the display. Only the first _DISPLAY_LIMIT rows are shown, so both
+        passes stop one match past it.
+        """
+        ids_lc, names_lc = self._ids_lc, self._names_lc
+        matches: list[int] = []
+        for i in indices:
+            if ids_lc[i].startswith(search_text) or names_lc[i].startswith(search_text):
+                matches.append(i)
+                if len(matches) > _DISPLAY_LIMIT:
+                    self._filtered_is_partial = True
+                    return matches
+
+        prefix_matches = set(matches)
+        for i in indices:
+            if i in prefix_matches:
+                continue
+            if search_text in ids_lc[i] or search_text in names_lc[i]:
+                matches.append(i)
+                if len(matches) > _DISPLAY_LIMIT:
+                    self._filtered_is_partial = True
+                    break
+        return matches
+
     def update_object_list(self):
-        """Update the object tree widget with pre-resolved objects (instant display)."""
-        # Avoid emitting selection signals while rebuilding the list.
-        # Otherwise QTreeWidget may emit currentItemChanged during repopulation.
-        prev_blocked = self.object_tree.blockSignals(True)
+        """Update the object list model with pre-resolved objects (instant display)."""
+        # Avoid emitting selection signals while resetting the model.
+        # Otherwise the selection model may emit currentChanged during repopulation.
+        # Suspend painting so the reset and the default selection land in one repaint.
+        selection_model = self.object_tree.selectionModel()
+        prev_blocked = selection_model.blockSignals(True)
+        self.object_tree.setUpdatesEnabled(False)
         try:
-            self.object_tree.clear()
-
             self.logger.debug(
-                f"Updating tree with {len(self.filtered_objects)} filtered objects"
+                f"Updating tree with {len(self.filtered_indices)} filtered objects"
+            )
+            previous_id = self.get_selected_object_id()
+
+            # Limit display to the first rows; they are read lazily by the model
+            mod_ids, ids, names = self._mod_ids, self._ids, self._names
+            self.object_model.set_rows(
+                [
+                    (mod_ids[i], ids[i], names[i])
+                    for i in self.filtered_indices[:_DISPLAY_LIMIT]
+                ]
             )
 
-            # Super fast display: all objects are pre-resolved with computed names
-            for obj in self.filtered_objects[:200]:  # Limit display to first 200
-                object_id = obj.get("id", "unknown")
-                object_name = obj.get("name", "No name")  # Pre-computed name
-                mod_id = obj.get("mod_id", "dda")  # Pre-computed mod ID
-
-                # Create tree item with three columns: [Mod] [Object ID] [Object Name]
-                item = QTreeWidgetItem([mod_id, object_id, object_name])
-
-                # Store object ID in item data for selection events
-                item.setData(0, Qt.ItemDataRole.UserRole, object_id)
-
-                self.object_tree.addTopLevelItem(item)
-
-            # Select the first row by default to keep keyboard navigation usable.
-            if (
-                self.object_tree.topLevelItemCount() > 0
-                and not self.object_tree.currentItem()
-            ):
-                self.object_tree.setCurrentItem(self.object_tree.topLevelItem(0))
+            # Keep the previous selection if it survived the filter, otherwise
+            # select the first row to keep keyboard navigation usable.
+            if self.proxy_model.rowCount() > 0:
+                index = self.proxy_model.mapFromSource(
+                    self.object_model.index_for_id(previous_id or "")
+                )
+                if not index.isValid():
+                    index = self.proxy_model.index(0, 0)
+                self.object_tree.setCurrentIndex(index)
+                self.object_tree.scrollTo(index)
         finally:
-            self.object_tree.blockSignals(prev_blocked)
+            self.object_tree.setUpdatesEnabled(True)
+            selection_model.blockSignals(prev_blocked)
 
         # Update status
-        total_filtered = len(self.filtered_objects)
-        displayed = min(total_filtered, 200)
+        total_filtered = len(self.filtered_indices)
+        displayed = min(total_filtered, _DISPLAY_LIMIT)
 
-        if total_filtered > 200:
+        if total_filtered > _DISPLAY_LIMIT:
+            total_text = (
+                f"{_DISPLAY_LIMIT}+" if self._filtered_is_partial else total_filtered
+            )
             self.status_label.setText(
-                f"Showing {displayed} of {total_filtered} objects (limited)"
+                f"Showing {displayed} of {total_text} objects (limited)"
             )
         else:
             self.status_label.setText(f"Showing {displayed} objects")
 
-    def on_object_clicked(self, item: QTreeWidgetItem, column: int):
-        """Handle object selection by mouse click."""
+    def on_current_item_changed(self, current: QModelIndex, previous: QModelIndex):
+        """Handle current item change (mouse click or keyboard navigation)."""
         if not self._emit_selection_signals:
             return
-        self._emit_object_selection(item)
-
-    def on_object_activated(self, item: QTreeWidgetItem, column: int):
-        """Handle object activation (Enter key or double-click)."""
-        if not self._emit_selection_signals:
-            return
-        self._emit_object_selection(item)
-
-    def on_current_item_changed(
-        self, current: QTreeWidgetItem, previous: QTreeWidgetItem
-    ):
-        """Handle current item change (keyboard navigation)."""
-        if not self._emit_selection_signals:
-            return
-        # Emit selection immediately when navigating with arrows
-        if current:
+        # Emit selection immediately when clicking or navigating with arrows
+        if current.isValid():
             self._emit_object_selection(current)
 
-    def _emit_object_selection(self, item: QTreeWidgetItem):
+    def _emit_object_selection(self, index: QModelIndex):
         """Helper method to emit object selection signal."""
-        if not item:
+        if not index.isValid():
             return
 
-        object_id = item.data(0, Qt.ItemDataRole.UserRole)
+        object_id = index.data(Qt.ItemDataRole.UserRole)
         if object_id:
             self.logger.debug(f"Object selected: {object_id}")
             self.object_selected.emit(object_id)
@@ -323,9 +500,9 @@ class ObjectBrowser(QWidget):
 
     def get_selected_object_id(self) -> Optional[str]:
         """Get currently selected object ID."""
-        current_item = self.object_tree.currentItem()
-        if current_item:
-            return current_item.data(0, Qt.ItemDataRole.UserRole)
+        current_index = self.object_tree.currentIndex()
+        if current_index.isValid():
+            return current_index.data(Qt.ItemDataRole.UserRole)
         return None
 
     def select_object_by_id(self, object_id: str, *, set_filters: bool = True) -> bool:
@@ -356,16 +533,12 @@ class ObjectBrowser(QWidget):
             # Rebuild list with updated filters.
             self.filter_objects()
 
-        for idx in range(self.object_tree.topLevelItemCount()):
-            item = self.object_tree.topLevelItem(idx)
-            if not item:
-                continue
-            if item.data(0, Qt.ItemDataRole.UserRole) == object_id:
-                self.object_tree.setCurrentItem(item)
-                try:
-                    self.object_tree.scrollToItem(item)
-                except Exception:
-                    pass
-                return True
-
-        return False
+        index = self.proxy_model.mapFromSource(
+            self.object_model.index_for_id(object_id)
+        )
+        if not index.isValid():
+            return False
+
+        self.object_tree.setCurrentIndex(index)
+        self.object_tree.scrollTo(index)
+        return True
@@ -35,6 +35,8 @@ class DemoMapSelector(IconSelector):
 
         self.map_manager: Optional[MapManager] = None
         self.current_demo_map_id = "default"
+        # Demo ID -> combo index, rebuilt whenever the combo is repopulated
+        self._id_to_index: dict[str, int] = {}
 
         # Connect signals
         self.combo.currentTextChanged.connect(self.on_demo_map_changed)
@@ -58,7 +60,9 @@ class DemoMapSelector(IconSelector):
             self.combo.clear()
 
             # Add each demo map: display name as text, ID as user data
+            self._id_to_index = {}
             for meta in demo_maps:
+                self._id_to_index[meta.id] = self.combo.count()
                 self.combo.addItem(meta.name, meta.id)
 
             self.combo.blockSignals(False)
@@ -97,12 +101,10 @@ class DemoMapSelector(IconSelector):
         Args:
             demo_map_id: Demo map ID to select
         """
-        # Find index by demo ID in user data
-        for i in range(self.combo.count()):
-            if self.combo.itemData(i) == demo_map_id:
-                self.combo.setCurrentIndex(i)
-                self.current_demo_map_id = demo_map_id
-                break
+        index = self._id_to_index.get(demo_map_id)
+        if index is not None:
+            self.combo.setCurrentIndex(index)
+            self.current_demo_map_id = demo_map_id
 
     def _get_save_value(self) -> Optional[str]:
         """Get demo ID (user data) to save instead of display name."""
@@ -118,9 +120,9 @@ class DemoMapSelector(IconSelector):
             True if value was found and restored, False otherwise
         """
         # Find by user data (demo ID), not by text (display name)
-        for i in range(self.combo.count()):
-            if self.combo.itemData(i) == value:
-                self.combo.setCurrentIndex(i)
-                self.current_demo_map_id = value
-                return True
-        return False
+        index = self._id_to_index.get(value)
+        if index is None:
+            return False
+        self.combo.setCurrentIndex(index)
+        self.current_demo_map_id = value
+        return True
@@ -5,17 +5,37 @@ Provides a minimalist selector with icon on left, combobox on right (Photoshop-s
 """
 
 import logging
+from functools import lru_cache
 from typing import Optional, TYPE_CHECKING
 
 from PySide6.QtWidgets import QWidget, QHBoxLayout, QLabel, QComboBox
 from PySide6.QtCore import Qt, QSize
-from PySide6.QtGui import QPalette, QIcon, QPixmap
-import qtawesome as qta  # type: ignore
+from PySide6.QtGui import QPalette, QIcon, QPixmap, QColor
 
 if TYPE_CHECKING:
     from ...settings import AppSettings
 
 
+@lru_cache(maxsize=128)
+def cached_icon_pixmap(icon_name: str, color_rgba: int, size: int) -> QPixmap:
+    """Render a qtawesome icon to a square pixmap, memoized per name/color/size.
+
+    Args:
+        icon_name: qtawesome icon name (e.g., "mdi6.weather-sunny")
+        color_rgba: Icon color as returned by QColor.rgba()
+        size: Pixmap edge length in pixels
+
+    Returns:
+        Rendered pixmap (may be null if rendering failed)
+    """
+    # Deferred import: qtawesome loads its font metadata on import, so only pay
+    # for it once the first icon is actually rendered
+    import qtawesome as qta  # type: ignore
+
+    icon: QIcon = QIcon(qta.icon(icon_name, color=QColor.fromRgba(color_rgba)))  # type: ignore[arg-type]
+    return icon.pixmap(QSize(size, size))
+
+
 class IconSelector(QWidget):
     """
     Base class for minimalist icon+combobox selectors.
@@ -79,8 +99,7 @@ class IconSelector(QWidget):
         try:
             # Get color from current palette (theme-aware)
             icon_color = self.palette().color(QPalette.ColorRole.WindowText)
-            icon: QIcon = QIcon(qta.icon(self.ICON_NAME, color=icon_color))  # type: ignore[arg-type]
-            pixmap: QPixmap = icon.pixmap(QSize(20, 20))
+            pixmap = cached_icon_pixmap(self.ICON_NAME, icon_color.rgba(), 20)
             if not pixmap.isNull():
                 self.icon_label.setPixmap(pixmap)
             else:
@@ -110,11 +129,9 @@ class IconSelector(QWidget):
             return
         current_value = self._get_save_value()
         if current_value is not None:
-            self.settings.settings.setValue(
-                f"selectors/{self.SETTINGS_KEY}", current_value
-            )
-            self.settings.settings.sync()  # Force immediate write to registry
-            self.logger.debug(f"Saved {self.SETTINGS_KEY} state: {current_value}")
+            # Queued to the settings writer thread, which batches disk syncs
+            self.settings.set_value(f"selectors/{self.SETTINGS_KEY}", current_value)
+            self.logger.debug("Saved %s state: %s", self.SETTINGS_KEY, current_value)
 
     def restore_state(self) -> bool:
         """Restore selection from settings.
@@ -125,9 +142,7 @@ class IconSelector(QWidget):
         if not self.settings or not self.SETTINGS_KEY:
             return False
 
-        saved_value = self.settings.settings.value(
-            f"selectors/{self.SETTINGS_KEY}", None
-        )
+        saved_value = self.settings.cached_value(f"selectors/{self.SETTINGS_KEY}")
         if saved_value is None:
             self.logger.debug(f"No saved state for {self.SETTINGS_KEY}")
             return False
@@ -31,6 +31,9 @@ class SeasonSelector(IconSelector):
         ("autumn", "Autumn"),
         ("winter", "Winter"),
     ]
+    # Lookup tables derived from SEASONS
+    _NAME_TO_ID = {season_name: season_id for season_id, season_name in SEASONS}
+    _ID_TO_INDEX = {season_id: i for i, (season_id, _) in enumerate(SEASONS)}
 
     # Fixed icon for season selector (doesn't change with selection)
     ICON_NAME = "mdi.calendar"
@@ -55,13 +58,7 @@ class SeasonSelector(IconSelector):
 
     def on_season_changed(self, season_name: str):
         """Handle season selection change."""
-        # Find season ID by name
-        season_id = None
-        for sid, sname in self.SEASONS:
-            if sname == season_name:
-                season_id = sid
-                break
-
+        season_id = self._NAME_TO_ID.get(season_name)
         if season_id and season_id != self.current_season:
             self.current_season = season_id
             self.seasonChanged.emit(season_id)
@@ -72,11 +69,9 @@ class SeasonSelector(IconSelector):
 
     def set_current_season(self, season_id: str):
         """Set the current season programmatically."""
-        # Find index by season ID
-        for i, (sid, _) in enumerate(self.SEASONS):
-            if sid == season_id:
-                self.combo.setCurrentIndex(i)
-                self.current_season = season_id
-                break
-        else:
+        index = self._ID_TO_INDEX.get(season_id)
+        if index is None:
             self.logger.warning(f"Unknown season ID: {season_id}")
+            return
+        self.combo.setCurrentIndex(index)
+        self.current_season = season_id
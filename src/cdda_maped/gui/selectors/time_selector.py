@@ -6,16 +6,20 @@ Minimalist design: icon on the left, slider in the middle, time display on the r
 """
 
 import logging
-from typing import Optional, TYPE_CHECKING, cast
+from typing import Optional, TYPE_CHECKING
 
 from PySide6.QtWidgets import QWidget, QHBoxLayout, QLabel, QSlider
-from PySide6.QtCore import Signal, Qt, QSize
-from PySide6.QtGui import QPalette, QIcon, QPixmap
-import qtawesome as qta  # type: ignore
+from PySide6.QtCore import Signal, Slot, Qt, QTimer
+from PySide6.QtGui import QPalette, QHideEvent
+
+from .icon_selector import cached_icon_pixmap
 
 if TYPE_CHECKING:
     from ...settings import AppSettings
 
+# Idle time after the last slider tick before the hour is written to settings
+_SAVE_DELAY_MS = 300
+
 
 class TimeSelector(QWidget):
     """
@@ -31,6 +35,8 @@ class TimeSelector(QWidget):
     # Fixed icon for time selector
     ICON_NAME = "mdi.clock-outline"
     SETTINGS_KEY = "time"
+    # Pre-formatted "HH:00" labels indexed by hour
+    _HOUR_LABELS: tuple[str, ...] = tuple(f"{h:02d}:00" for h in range(24))
 
     def __init__(self, parent: Optional[QWidget] = None):
         """Initialize the time selector."""
@@ -42,6 +48,12 @@ class TimeSelector(QWidget):
 
         self.current_hour = 12  # Default: noon
 
+        # Coalesce settings writes while the slider is being dragged
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(_SAVE_DELAY_MS)
+        self._save_timer.timeout.connect(self._do_save)
+
         self._setup_ui()
         self._connect_signals()
 
@@ -85,8 +97,7 @@ class TimeSelector(QWidget):
         try:
             # Get color from current palette (theme-aware)
             icon_color = self.palette().color(QPalette.ColorRole.WindowText)
-            icon: QIcon = QIcon(qta.icon(self.ICON_NAME, color=icon_color))  # type: ignore[arg-type]
-            pixmap: QPixmap = icon.pixmap(QSize(20, 20))
+            pixmap = cached_icon_pixmap(self.ICON_NAME, icon_color.rgba(), 20)
             if not pixmap.isNull():
                 self.icon_label.setPixmap(pixmap)
             else:
@@ -102,15 +113,16 @@ class TimeSelector(QWidget):
 
     def _update_time_label(self):
         """Update the time display label."""
-        self.time_label.setText(f"{self.current_hour:02d}:00")
+        self.time_label.setText(self._HOUR_LABELS[self.current_hour])
 
+    @Slot(int)
     def on_time_changed(self, hour: int):
         """Handle time slider change (updates UI and emits signal)."""
         if hour != self.current_hour:
             self.current_hour = hour
             self._update_time_label()
             self.timeChanged.emit(hour)
-            # Save immediately on change unless restoring programmatically
+            # Schedule a save on change unless restoring programmatically
             if not self._is_restoring_state:
                 self.save_state()
 
@@ -136,14 +148,27 @@ class TimeSelector(QWidget):
         self.settings = settings
 
     def save_state(self) -> None:
-        """Save current hour to settings."""
+        """Schedule saving the current hour to settings.
+
+        Writes are debounced so dragging the slider produces a single write.
+        """
         if not self.settings:
             return
-        self.settings.settings.setValue(
-            f"selectors/{self.SETTINGS_KEY}", self.current_hour
-        )
-        self.settings.settings.sync()  # Force immediate write to registry
-        self.logger.debug(f"Saved {self.SETTINGS_KEY} state: {self.current_hour}")
+        self._save_timer.start()
+
+    def _do_save(self) -> None:
+        """Queue the current hour for the background settings writer."""
+        self._save_timer.stop()
+        if not self.settings:
+            return
+        self.settings.set_value(f"selectors/{self.SETTINGS_KEY}", self.current_hour)
+        self.logger.debug("Saved %s state: %s", self.SETTINGS_KEY, self.current_hour)
+
+    def hideEvent(self, event: QHideEvent) -> None:
+        """Write a pending save when the selector (or its window) is hidden."""
+        if self._save_timer.isActive():
+            self._do_save()
+        super().hideEvent(event)
 
     def restore_state(self) -> bool:
         """Restore hour from settings.
@@ -154,27 +179,29 @@ class TimeSelector(QWidget):
         if not self.settings:
             return False
 
-        saved_value = self.settings.settings.value(
-            f"selectors/{self.SETTINGS_KEY}", None
-        )
+        saved_value = self.settings.cached_value(f"selectors/{self.SETTINGS_KEY}")
         if saved_value is None:
             self.logger.debug(f"No saved state for {self.SETTINGS_KEY}")
             return False
 
-        try:
-            hour = int(cast(str | int, saved_value))
-            if 0 <= hour <= 23:
-                # Avoid saving while restoring programmatically
-                self._is_restoring_state = True
-                try:
-                    self.set_current_hour(hour)
-                finally:
-                    self._is_restoring_state = False
-                self.logger.info(f"Restored {self.SETTINGS_KEY} state: {hour}")
-                return True
-            else:
-                self.logger.warning(f"Invalid saved hour: {hour} (must be 0-23)")
-                return False
-        except (ValueError, TypeError):
+        # The native type comes back within a session; INI storage yields str
+        if isinstance(saved_value, int):
+            hour = saved_value
+        elif isinstance(saved_value, str) and saved_value.isdigit():
+            hour = int(saved_value)
+        else:
             self.logger.warning(f"Failed to parse saved hour: {saved_value}")
             return False
+
+        if not 0 <= hour <= 23:
+            self.logger.warning(f"Invalid saved hour: {hour} (must be 0-23)")
+            return False
+
+        # Avoid saving while restoring programmatically
+        self._is_restoring_state = True
+        try:
+            self.set_current_hour(hour)
+        finally:
+            self._is_restoring_state = False
+        self.logger.info(f"Restored {self.SETTINGS_KEY} state: {hour}")
+        return True
@@ -8,7 +8,7 @@ Minimalist design: icon on the left, selector on the right (Photoshop-style).
 
 from typing import Optional
 
-from PySide6.QtCore import Signal
+from PySide6.QtCore import QSignalBlocker, QStringListModel, Signal
 from PySide6.QtWidgets import QWidget
 
 from ...tilesets.service import TilesetService
@@ -36,6 +36,10 @@ class TsIsoSelector(IconSelector):
 
         self.tileset_service: Optional[TilesetService] = None
 
+        # Backing model lets load_tilesets() repopulate with a single reset
+        self._tileset_model = QStringListModel(self.combo)
+        self.combo.setModel(self._tileset_model)
+
         # Connect signals
         self.combo.currentTextChanged.connect(self.on_tileset_changed)
         self._enable_auto_save()
@@ -54,17 +58,11 @@ class TsIsoSelector(IconSelector):
             all_tilesets = self.tileset_service.get_available_tilesets()
 
             # Filter only isometric tilesets (is_iso == True)
-            iso_tilesets: list[str] = []
-            for tileset_name in all_tilesets:
-                tileset = self.tileset_service.get_tileset(tileset_name)
-                if tileset.is_iso:
-                    iso_tilesets.append(tileset_name)
+            iso_tilesets = self.tileset_service.get_iso_tileset_names()
 
             # Block signals while updating
-            self.combo.blockSignals(True)
-            self.combo.clear()
-            self.combo.addItems(iso_tilesets)
-            self.combo.blockSignals(False)
+            with QSignalBlocker(self.combo):
+                self._tileset_model.setStringList(iso_tilesets)
 
             if iso_tilesets:
                 # Try to restore saved state, fallback to preferred tileset
@@ -88,7 +86,9 @@ class TsIsoSelector(IconSelector):
                     self.on_tileset_changed(preferred)
 
             self.logger.info(
-                f"Loaded {len(iso_tilesets)} isometric tilesets (filtered from {len(all_tilesets)} total)"
+                "Loaded %d isometric tilesets (filtered from %d total)",
+                len(iso_tilesets),
+                len(all_tilesets),
             )
 
         except Exception as e:
@@ -8,7 +8,7 @@ Minimalist design: icon on the left, selector on the right (Photoshop-style).
 
 from typing import Optional
 
-from PySide6.QtCore import Signal
+from PySide6.QtCore import QSignalBlocker, QStringListModel, Signal, Slot
 from PySide6.QtWidgets import QWidget
 
 from ...tilesets.service import TilesetService
@@ -37,6 +37,10 @@ class TsOrthoSelector(IconSelector):
 
         self.tileset_service: Optional[TilesetService] = None
 
+        # Backing model lets load_tilesets() repopulate with a single reset
+        self._tileset_model = QStringListModel(self.combo)
+        self.combo.setModel(self._tileset_model)
+
         # Connect signals
         self.combo.currentTextChanged.connect(self.on_tileset_changed)
         self._enable_auto_save()
@@ -55,17 +59,11 @@ class TsOrthoSelector(IconSelector):
             all_tilesets = self.tileset_service.get_available_tilesets()
 
             # Filter only orthogonal tilesets (is_iso == False)
-            ortho_tilesets: list[str] = []
-            for tileset_name in all_tilesets:
-                tileset = self.tileset_service.get_tileset(tileset_name)
-                if not tileset.is_iso:
-                    ortho_tilesets.append(tileset_name)
+            ortho_tilesets = self.tileset_service.get_ortho_tileset_names()
 
             # Block signals while updating
-            self.combo.blockSignals(True)
-            self.combo.clear()
-            self.combo.addItems(ortho_tilesets)
-            self.combo.blockSignals(False)
+            with QSignalBlocker(self.combo):
+                self._tileset_model.setStringList(ortho_tilesets)
 
             if ortho_tilesets:
                 # Try to restore saved state, fallback to preferred tileset
@@ -89,12 +87,15 @@ class TsOrthoSelector(IconSelector):
                     self.on_tileset_changed(preferred)
 
             self.logger.info(
-                f"Loaded {len(ortho_tilesets)} orthogonal tilesets (filtered from {len(all_tilesets)} total)"
+                "Loaded %d orthogonal tilesets (filtered from %d total)",
+                len(ortho_tilesets),
+                len(all_tilesets),
             )
 
         except Exception as e:
             self.logger.error(f"Failed to load tilesets: {e}")
 
+    @Slot(str)
     def on_tileset_changed(self, tileset_name: str):
         """Handle tileset selection change."""
         if tileset_name:
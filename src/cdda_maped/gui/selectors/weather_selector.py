@@ -73,7 +73,7 @@ class WeatherSelector(IconSelector):
             # Determine considered mods and their priority
             considered_mods: List[str] = []
             if self.settings:
-                considered_mods = list(self.settings.active_mods)
+                considered_mods = list(self.settings.active_mods_tuple)
                 if self.settings.always_include_core and "dda" not in considered_mods:
                     # Core is lowest priority: appended at the end
                     considered_mods.append("dda")
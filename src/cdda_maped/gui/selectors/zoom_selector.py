@@ -5,13 +5,15 @@ Provides discrete zoom control with predefined steps.
 Minimalist design: icon, slider, zoom label.
 """
 
+import bisect
 import logging
-from typing import Optional, TYPE_CHECKING, cast
+from typing import Optional, TYPE_CHECKING
 
 from PySide6.QtWidgets import QWidget, QHBoxLayout, QLabel, QSlider
-from PySide6.QtCore import Signal, Qt, QSize
-from PySide6.QtGui import QPalette, QIcon, QPixmap
-import qtawesome as qta  # type: ignore
+from PySide6.QtCore import Signal, Slot, Qt
+from PySide6.QtGui import QPalette
+
+from .icon_selector import cached_icon_pixmap
 
 if TYPE_CHECKING:
     from ...settings import AppSettings
@@ -33,6 +35,8 @@ class ZoomSelector(QWidget):
         self.settings: Optional["AppSettings"] = None
         self._is_restoring_state = False
         self.current_index = self.DEFAULT_INDEX
+        # Labels for each entry of ZOOM_LEVELS, formatted once
+        self._zoom_labels = tuple(self._format_zoom_label(z) for z in self.ZOOM_LEVELS)
 
         self._setup_ui()
         self._connect_signals()
@@ -71,8 +75,7 @@ class ZoomSelector(QWidget):
         """Setup zoom icon respecting current palette."""
         try:
             icon_color = self.palette().color(QPalette.ColorRole.WindowText)
-            icon: QIcon = QIcon(qta.icon(self.ICON_NAME, color=icon_color))  # type: ignore[arg-type]
-            pixmap: QPixmap = icon.pixmap(QSize(20, 20))
+            pixmap = cached_icon_pixmap(self.ICON_NAME, icon_color.rgba(), 20)
             if not pixmap.isNull():
                 self.icon_label.setPixmap(pixmap)
             else:
@@ -86,19 +89,21 @@ class ZoomSelector(QWidget):
         self.zoom_slider.valueChanged.connect(self.on_zoom_index_changed)
 
     def _update_zoom_label(self) -> None:
-        self.zoom_label.setText(self._format_zoom_label(self.get_current_zoom()))
+        self.zoom_label.setText(self._zoom_labels[self.zoom_slider.value()])
 
     def _format_zoom_label(self, zoom: float) -> str:
         if zoom >= 1:
             return f"{zoom:.1f}x" if zoom % 1 else f"{int(zoom)}x"
         return f"{zoom:.2f}x"
 
+    @Slot(int)
     def on_zoom_index_changed(self, index: int) -> None:
-        if index != self.current_index:
-            self.current_index = index
+        # Duplicate valueChanged notifications must not trigger a map redraw
+        if index == self.current_index:
+            return
+        self.current_index = index
         self._update_zoom_label()
-        zoom = self.get_current_zoom()
-        self.zoomChanged.emit(zoom)
+        self.zoomChanged.emit(self.ZOOM_LEVELS[index])
         if not self._is_restoring_state:
             self.save_state()
 
@@ -113,10 +118,17 @@ class ZoomSelector(QWidget):
             self.zoom_slider.setValue(index)
 
     def set_current_zoom(self, zoom: float) -> None:
-        closest_index = min(
-            range(len(self.ZOOM_LEVELS)),
-            key=lambda i: abs(self.ZOOM_LEVELS[i] - zoom),
-        )
+        # ZOOM_LEVELS is sorted: the closest level is one of the bisect neighbours
+        levels = self.ZOOM_LEVELS
+        i = bisect.bisect_left(levels, zoom)
+        if i == 0:
+            closest_index = 0
+        elif i == len(levels):
+            closest_index = len(levels) - 1
+        elif levels[i] - zoom < zoom - levels[i - 1]:
+            closest_index = i
+        else:
+            closest_index = i - 1
         self.set_zoom_index(closest_index)
 
     def set_settings(self, settings: "AppSettings") -> None:
@@ -126,30 +138,33 @@ class ZoomSelector(QWidget):
         if not self.settings:
             return
         zoom_value = self.get_current_zoom()
-        self.settings.settings.setValue(f"selectors/{self.SETTINGS_KEY}", zoom_value)
-        self.settings.settings.sync()
-        self.logger.debug(f"Saved {self.SETTINGS_KEY} state: {zoom_value}")
+        # Queued to the settings writer thread, which batches disk syncs
+        self.settings.set_value(f"selectors/{self.SETTINGS_KEY}", zoom_value)
+        self.logger.debug("Saved %s state: %s", self.SETTINGS_KEY, zoom_value)
 
     def restore_state(self) -> bool:
         if not self.settings:
             return False
 
-        saved_value = self.settings.settings.value(
-            f"selectors/{self.SETTINGS_KEY}", None
-        )
+        saved_value = self.settings.cached_value(f"selectors/{self.SETTINGS_KEY}")
         if saved_value is None:
             self.logger.debug(f"No saved state for {self.SETTINGS_KEY}")
             return False
 
-        try:
-            zoom_value = float(cast(str | float, saved_value))
-            self._is_restoring_state = True
+        # The native type comes back within a session; INI storage yields str
+        if isinstance(saved_value, (int, float)):
+            zoom_value = float(saved_value)
+        else:
             try:
-                self.set_current_zoom(zoom_value)
-            finally:
-                self._is_restoring_state = False
-            self.logger.info(f"Restored {self.SETTINGS_KEY} state: {zoom_value}")
-            return True
-        except (ValueError, TypeError):
-            self.logger.warning(f"Failed to parse saved zoom: {saved_value}")
-            return False
+                zoom_value = float(str(saved_value))
+            except ValueError:
+                self.logger.warning(f"Failed to parse saved zoom: {saved_value}")
+                return False
+
+        self._is_restoring_state = True
+        try:
+            self.set_current_zoom(zoom_value)
+        finally:
+            self._is_restoring_state = False
+        self.logger.info(f"Restored {self.SETTINGS_KEY} state: {zoom_value}")
+        return True
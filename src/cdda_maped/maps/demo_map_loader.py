@@ -35,6 +35,21 @@ class DemoMapLoader:
         Returns:
             Loaded DemoMap instance
 
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ValueError: If JSON is invalid or doesn't match schema
+        """
+        return self.build_demo_map(self.load_data(path))
+
+    def load_data(self, path: Path) -> dict[str, Any]:
+        """Parse and validate a demo map JSON file without building the map.
+
+        Args:
+            path: Path to JSON file
+
+        Returns:
+            Validated JSON data, suitable for build_demo_map()
+
         Raises:
             FileNotFoundError: If file doesn't exist
             ValueError: If JSON is invalid or doesn't match schema
@@ -59,7 +74,17 @@ class DemoMapLoader:
             error_msg = "\n  - ".join(errors)
             raise ValueError(f"Invalid demo map JSON in {path}:\n  - {error_msg}")
 
-        # Convert to DemoMap
+        return data
+
+    def build_demo_map(self, data: dict[str, Any]) -> DemoMap:
+        """Build a new DemoMap instance from validated JSON data.
+
+        Args:
+            data: JSON data returned by load_data()
+
+        Returns:
+            Freshly built DemoMap instance
+        """
         demo_map = self._build_demo_map(data)
         self.logger.info(
             f"Loaded demo map '{data['id']}' with {len(demo_map.sectors)} sector(s)"
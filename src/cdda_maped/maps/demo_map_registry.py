@@ -6,7 +6,7 @@ and user configuration directories.
 
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 from PySide6.QtCore import QStandardPaths
 
@@ -31,6 +31,8 @@ class DemoMapRegistry:
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
 
         self._metadata: dict[str, DemoMapMetadata] = {}
+        # Parsed JSON of demo maps, kept as pristine templates for clone_demo_map()
+        self._templates: dict[str, dict[str, Any]] = {}
         self._loader = DemoMapLoader()
 
         # Discover available demo maps
@@ -193,6 +195,15 @@ class DemoMapRegistry:
         """
         return demo_id in self._metadata
 
+    def _require_metadata(self, demo_id: str) -> DemoMapMetadata:
+        """Get metadata for a registered demo map or raise KeyError."""
+        if demo_id not in self._metadata:
+            available = ", ".join(self._metadata.keys())
+            raise KeyError(
+                f"Demo map '{demo_id}' not found in registry. Available: {available}"
+            )
+        return self._metadata[demo_id]
+
     def load_demo_map(self, demo_id: str) -> DemoMap:
         """Load a demo map by ID.
 
@@ -209,17 +220,35 @@ class DemoMapRegistry:
             KeyError: If demo map ID is not registered
             ValueError: If JSON file is invalid
         """
-        if demo_id not in self._metadata:
-            available = ", ".join(self._metadata.keys())
-            raise KeyError(
-                f"Demo map '{demo_id}' not found in registry. Available: {available}"
-            )
-
-        metadata = self._metadata[demo_id]
+        metadata = self._require_metadata(demo_id)
         self.logger.info(f"Loading demo map '{demo_id}' from {metadata.file_path}")
 
         return self._loader.load_from_json(metadata.file_path)
 
+    def clone_demo_map(self, demo_id: str) -> DemoMap:
+        """Get a fresh working copy of a demo map.
+
+        The JSON file is read and validated once per ID; subsequent calls
+        build the map from the cached data without touching the disk.
+
+        Args:
+            demo_id: Demo map identifier
+
+        Returns:
+            Independent DemoMap instance that can be modified freely
+
+        Raises:
+            KeyError: If demo map ID is not registered
+            ValueError: If JSON file is invalid
+        """
+        template = self._templates.get(demo_id)
+        if template is None:
+            metadata = self._require_metadata(demo_id)
+            self.logger.info(f"Loading demo map '{demo_id}' from {metadata.file_path}")
+            template = self._loader.load_data(metadata.file_path)
+            self._templates[demo_id] = template
+        return self._loader.build_demo_map(template)
+
     def reload_registry(self) -> None:
         """Re-scan directories and rebuild registry.
 
@@ -227,5 +256,6 @@ class DemoMapRegistry:
         """
         self.logger.info("Reloading demo map registry")
         self._metadata.clear()
+        self._templates.clear()
         self._scan_builtin_demos()
         self._scan_user_demos()
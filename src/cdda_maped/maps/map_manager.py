@@ -33,8 +33,9 @@ class MapManager:
     def get_demomap(self, demo_id: str = "default") -> DemoMap:
         """Get a demo map by ID.
 
-        If the map is requested for the first time, it will be loaded from JSON.
-        Subsequent calls return the same instance until reset_demomap() is called.
+        If the map is requested for the first time, it will be built from the
+        registry's parsed template. Subsequent calls return the same instance
+        until reset_demomap() is called.
 
         Args:
             demo_id: ID of the demo map to load (default: "default")
@@ -46,29 +47,39 @@ class MapManager:
             KeyError: If demo map ID is not found in registry
             ValueError: If JSON file is invalid
         """
-        # Load new map if not loaded or if ID changed
-        if self._current_map is None or self._current_map_id != demo_id:
-            self.logger.info(f"Loading demo map: {demo_id}")
-            self._current_map = self.registry.load_demo_map(demo_id)
-            self._current_map_id = demo_id
+        # Fast path: same ID as the loaded map (the ID is only set with a map)
+        current = self._current_map
+        if demo_id == self._current_map_id and current is not None:
+            return current
 
+        self.logger.info(f"Loading demo map: {demo_id}")
+        current = self.registry.clone_demo_map(demo_id)
+        self._current_map = current
+        self._current_map_id = demo_id
+        return current
+
+    def current_map(self) -> Optional[DemoMap]:
+        """Get the currently loaded demo map without any lookup.
+
+        Intended for hot paths that already know the map has not changed;
+        call get_demomap() when the selected demo ID may differ.
+
+        Returns:
+            Current DemoMap instance or None if no map loaded
+        """
         return self._current_map
 
     def reset_demomap(self) -> DemoMap:
         """Reset the current demo map to its initial state.
 
-                Rebuilds the map using the stored factory function, discarding all
-                user modifications.
-
-                Returns:
-                    Freshly built DemoMap instance
-        loads the map from JSON, discarding all user modifications.
+        Rebuilds the map from the registry's pristine template, discarding all
+        user modifications without re-reading the JSON file.
 
-                Returns:
-                    Freshly loaded DemoMap instance
+        Returns:
+            Freshly built DemoMap instance
 
-                Raises:
-                    RuntimeError: If no map has been loaded yet
+        Raises:
+            RuntimeError: If no map has been loaded yet
         """
         if self._current_map_id is None:
             raise RuntimeError("No demo map loaded. Call get_demomap() first.")
@@ -76,7 +87,7 @@ class MapManager:
         self.logger.info(
             f"Resetting demo map '{self._current_map_id}' to initial state"
         )
-        self._current_map = self.registry.load_demo_map(self._current_map_id)
+        self._current_map = self.registry.clone_demo_map(self._current_map_id)
         return self._current_map
 
     def get_available_demos(self) -> list[DemoMapMetadata]:
@@ -7,19 +7,31 @@ Provides helpers to access packaged assets such as the application icon.
 from functools import lru_cache
 from importlib import resources as importlib_resources
 
+from PySide6.QtCore import QSize
 from PySide6.QtGui import QIcon
 
+# Icon sizes registered for the application icon (window title bar, taskbar)
+_APP_ICON_SIZES = (16, 32, 256)
+
 
 @lru_cache(maxsize=1)
 def get_app_icon() -> QIcon:
     """Return the shared application icon.
 
-    Uses importlib.resources to resolve the packaged ``maped.ico`` file.
+    Uses importlib.resources to resolve the packaged ``maped.ico`` file and
+    registers it for the sizes actually shown, deferring decoding to Qt.
     Returns an empty icon if the resource is missing.
     """
 
     try:
-        with importlib_resources.path(__name__, "maped.ico") as icon_path:
-            return QIcon(str(icon_path))
+        resource = importlib_resources.files(__name__) / "maped.ico"
+        with importlib_resources.as_file(resource) as icon_path:
+            if not icon_path.exists():
+                return QIcon()
+            # Register the file per size; Qt decodes an entry on first use
+            icon = QIcon()
+            for size in _APP_ICON_SIZES:
+                icon.addFile(str(icon_path), QSize(size, size))
+            return icon
     except FileNotFoundError:
         return QIcon()
@@ -5,9 +5,12 @@ Provides centralized loading and application of Qt stylesheets.
 """
 
 import logging
+import mmap
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
+from PySide6.QtCore import QThreadPool
 from PySide6.QtWidgets import QApplication, QWidget
 
 
@@ -19,6 +22,9 @@ class StyleManager:
         self.styles_dir = Path(__file__).parent / "styles"
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
         self._loaded_styles: dict[str, str] = {}
+        # Guards _loaded_styles; held across the file read so a style is only
+        # read once even if a background preload is still running
+        self._lock = threading.Lock()
 
     def load_style(self, style_name: str) -> Optional[str]:
         """Load a stylesheet from file.
@@ -29,6 +35,11 @@ class StyleManager:
         Returns:
             Stylesheet content or None if not found
         """
+        with self._lock:
+            return self._load_style_locked(style_name)
+
+    def _load_style_locked(self, style_name: str) -> Optional[str]:
+        """Load a stylesheet; caller must hold self._lock."""
         if style_name in self._loaded_styles:
             return self._loaded_styles[style_name]
 
@@ -39,15 +50,37 @@ class StyleManager:
             return None
 
         try:
-            with open(style_file, "r", encoding="utf-8") as f:
-                content = f.read()
-                self._loaded_styles[style_name] = content
-                self.logger.debug(f"Loaded stylesheet: {style_name}")
-                return content
+            with open(style_file, "rb") as f:
+                # mmap cannot map empty files
+                if style_file.stat().st_size == 0:
+                    content = ""
+                else:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        content = mm[:].decode("utf-8")
+            self._loaded_styles[style_name] = content
+            self.logger.debug("Loaded stylesheet: %s", style_name)
+            return content
         except Exception as e:
             self.logger.error(f"Failed to load stylesheet {style_name}: {e}")
             return None
 
+    def preload_async(self, style_names: Iterable[str]) -> None:
+        """Load stylesheets into the cache on a background thread.
+
+        Later load_style()/apply_app_style() calls are then served from memory
+        instead of reading files on the GUI thread.
+
+        Args:
+            style_names: Names of the style files (without .qss extension)
+        """
+        names = list(style_names)
+
+        def preload() -> None:
+            for name in names:
+                self.load_style(name)
+
+        QThreadPool.globalInstance().start(preload)
+
     def apply_style(self, widget: QWidget, style_name: str) -> bool:
         """Apply a stylesheet to a widget.
 
@@ -81,16 +114,14 @@ class StyleManager:
 
         # Load additional styles (e.g., map_view)
         additional_styles = ["map_view"]
-        combined_style = main_style
+        parts = [main_style]
 
         for additional_style_name in additional_styles:
             additional_content = self.load_style(additional_style_name)
             if additional_content:
-                combined_style += (
-                    f"\n\n/* {additional_style_name}.qss */\n{additional_content}"
-                )
+                parts.append(f"/* {additional_style_name}.qss */\n{additional_content}")
 
-        app.setStyleSheet(combined_style)
+        app.setStyleSheet("\n\n".join(parts))
         self.logger.info(
             f"Applied application stylesheet: {style_name} with {len(additional_styles)} additional styles"
         )
@@ -111,6 +142,9 @@ def apply_style_class(widget: QWidget, class_name: str) -> None:
         widget: Widget to apply class to
         class_name: CSS class name (should match selectors in QSS files)
     """
+    # Re-polishing is expensive; skip it when the class is already applied
+    if widget.property("class") == class_name:
+        return
     widget.setProperty("class", class_name)
     # Force style recalculation to apply new property
     widget.style().unpolish(widget)
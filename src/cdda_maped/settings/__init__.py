@@ -5,13 +5,13 @@ This package provides a modular, type-safe configuration management system
 using Qt's QSettings for cross-platform storage.
 
 Usage:
-    from cdda_maped.settings import AppSettings, ValidationResult
+    from cdda_maped.settings import get_app_settings
 
-    settings = AppSettings()
+    settings = get_app_settings()
     result = settings.validate()
 """
 
-from .core import AppSettings
+from .core import AppSettings, get_app_settings
 from .types import ConfigVersion, ConfigError, ValidationResult
 from .mods import ModSettings
 from .type_slot_mapping import TypeSlotMappingSettings
@@ -19,6 +19,7 @@ from .multi_z_level import MultiZLevelSettings
 
 __all__ = [
     "AppSettings",
+    "get_app_settings",
     "ConfigVersion",
     "ConfigError",
     "ValidationResult",
@@ -0,0 +1,148 @@
+"""
+Cached, type-safe read access to QSettings for settings subsystems.
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, cast
+
+from ._helpers import to_bool
+
+if TYPE_CHECKING:
+    from PySide6.QtCore import QSettings
+
+    from .writer import SettingsWriter
+
+# Sentinel distinguishing "not cached" from a cached None (missing key)
+_MISSING = object()
+
+
+class TypedSettingsReader:
+    """Reads settings values through a shared in-memory cache.
+
+    Each key is fetched from QSettings at most once; later reads are served
+    from the cache dict, which set() keeps in step with writes. Because reads
+    never go back to QSettings for a written key, writes can be handed to a
+    SettingsWriter thread without readers seeing stale values.
+    """
+
+    def __init__(
+        self,
+        settings: "QSettings",
+        cache: Optional[Dict[str, Any]] = None,
+        writer: Optional["SettingsWriter"] = None,
+    ):
+        """Initialize the reader.
+
+        Args:
+            settings: QSettings instance to read from
+            cache: Dict of raw values (None = missing) to share with other readers
+            writer: Background writer for set()/put_list(); when omitted,
+                values are written to settings on the calling thread
+        """
+        self.settings = settings
+        self.cache: Dict[str, Any] = cache if cache is not None else {}
+        self._writer = writer
+        # Normalized string lists by key, owned by this reader
+        self._lists: Dict[str, List[str]] = {}
+        # Immutable snapshots of _lists, shareable with callers without copying
+        self._tuples: Dict[str, Tuple[str, ...]] = {}
+
+    def value(self, key: str) -> Any:
+        """Raw settings value, read from QSettings only on first access."""
+        cache = self.cache
+        if key in cache:
+            return cache[key]
+        value = self.settings.value(key, None)
+        cache[key] = value
+        return value
+
+    def set(self, key: str, value: Any) -> bool:
+        """Write a settings value unless it matches the cached one.
+
+        Args:
+            key: Settings key
+            value: New value to store
+
+        Returns:
+            True if the value was written, False if it was unchanged
+        """
+        if self.cache.get(key, _MISSING) == value:
+            return False
+        self.cache[key] = value
+        if self._writer is not None:
+            self._writer.put(key, value)
+        else:
+            self.settings.setValue(key, value)
+        return True
+
+    def get_str(self, key: str, default: str = "") -> str:
+        """Type-safe string retrieval from settings."""
+        value = self.value(key)
+        return str(value) if value is not None else default
+
+    def get_bool(self, key: str, default: bool = False) -> bool:
+        """Type-safe boolean retrieval from settings."""
+        return to_bool(self.value(key), default)
+
+    def get_int(self, key: str, default: int = 0) -> int:
+        """Type-safe integer retrieval from settings."""
+        value = self.value(key)
+        # Native ints (registry backend, values written this session) need no
+        # conversion or exception handling
+        if type(value) is int:
+            return value
+        if value is None:
+            return default
+        try:
+            return int(cast(str | int, value))
+        except (ValueError, TypeError):
+            return default
+
+    def get_float(self, key: str, default: float = 0.0) -> float:
+        """Type-safe float retrieval from settings."""
+        value = self.value(key)
+        if type(value) is float:
+            return value
+        if value is None:
+            return default
+        try:
+            return float(cast(str | float, value))
+        except (ValueError, TypeError):
+            return default
+
+    def get_list(self, key: str) -> List[str]:
+        """Cached string-list retrieval from settings.
+
+        The returned list is the cached object itself: copy it before handing
+        it out, and write in-place changes back with put_list().
+        """
+        items = self._lists.get(key)
+        if items is None:
+            # type=list has Qt coerce missing keys to [] and a lone string
+            # (how INI stores a one-element list) to a one-element list
+            value = cast(list[object], self.settings.value(key, [], type=list))
+            if all(type(item) is str for item in value):
+                # The usual case: take Qt's list as-is
+                items = cast(List[str], value)
+            else:
+                # Elements may still come back as non-strings (ints, None)
+                items = [str(item) if item is not None else "" for item in value]
+            self._lists[key] = items
+        return items
+
+    def get_tuple(self, key: str) -> Tuple[str, ...]:
+        """Cached string list as a tuple, rebuilt only after put_list()."""
+        items = self._tuples.get(key)
+        if items is None:
+            items = tuple(self.get_list(key))
+            self._tuples[key] = items
+        return items
+
+    def put_list(self, key: str, value: List[str]) -> None:
+        """Store a string list in the list cache and write it to settings."""
+        self._lists[key] = value
+        self._tuples.pop(key, None)
+        if self._writer is not None:
+            # The cached list may be edited in place before the writer runs
+            self._writer.put(key, list(value))
+        else:
+            self.settings.setValue(key, value)
@@ -0,0 +1,43 @@
+"""
+Shared value coercion helpers for settings subsystems.
+"""
+
+from typing import Any
+
+# Lower-case spellings of True used when a boolean is stored as text
+_TRUTHY: frozenset[str] = frozenset({"true", "1", "yes"})
+
+
+def to_bool(value: Any, default: bool = False) -> bool:
+    """Coerce a raw QSettings value to bool.
+
+    Args:
+        value: Value as returned by QSettings.value() (None if missing)
+        default: Result used when value is None
+
+    Returns:
+        Boolean interpretation of value
+    """
+    if value is None:
+        return default
+    # Booleans are stored as "true"/"false" (see bool_str), so a string in the
+    # canonical spelling is the common case and skips lower()
+    if type(value) is str:
+        return value in _TRUTHY or value.lower() in _TRUTHY
+    # Native bools from older writes on non-INI backends, or numbers
+    return bool(value)
+
+
+def bool_str(value: bool) -> str:
+    """Canonical stored form of a boolean setting.
+
+    Storing booleans as "true"/"false" on every backend means reads always
+    see a string and to_bool() takes a single branch.
+
+    Args:
+        value: Boolean to store
+
+    Returns:
+        "true" or "false"
+    """
+    return "true" if value else "false"
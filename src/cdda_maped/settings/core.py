@@ -1,30 +1,56 @@
 """
 Core settings management for CDDA-maped.
+
+Sync policy: setters never call QSettings.sync() themselves. Path, UI and
+mod settings, and values written with set_value(), are queued to the
+SettingsWriter thread, which persists them in batches; window geometry is
+additionally debounced before it is queued. Editor, logging and
+multi-z-level writes request a single debounced sync through
+AppSettings._schedule_sync(); anything else is flushed by Qt when the
+QSettings object is destroyed. AppSettings.sync(), connected to
+QApplication.aboutToQuit, is the explicit flush on shutdown.
+
+Settings access is bound by the QSettings backend (file parsing, registry
+calls, syncs to disk), not by Python. Each AppSettings therefore owns a single
+QSettings that every subsystem receives by reference; constructing another
+QSettings re-reads the backing store. Code outside this package should reach
+settings through get_app_settings() rather than creating its own instances.
 """
 
 import logging
+from functools import cached_property
 from pathlib import Path
-from typing import TYPE_CHECKING, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
-from PySide6.QtCore import QSettings
-from PySide6.QtWidgets import QWidget, QMainWindow
+from PySide6.QtCore import QCoreApplication, QSettings, QTimer
 
 from .types import ConfigVersion, ValidationResult
 from .migration import SettingsMigrator
-from .validation import SettingsValidator
-from .paths import PathSettings
-from .ui import UISettings
-from .editor import EditorSettings
-from .logging import LoggingSettings
-from .mods import ModSettings
-from .type_slot_mapping import TypeSlotMappingSettings
-from .multi_z_level import MultiZLevelSettings
+from .writer import SettingsWriter
+from ._accessors import TypedSettingsReader
+from ._helpers import bool_str
 
 if TYPE_CHECKING:
+    from PySide6.QtWidgets import QWidget, QMainWindow
+
     from ..tilesets.service import TilesetService
+    from .editor import EditorSettings
+    from .logging import LoggingSettings
+    from .mods import ModSettings
+    from .multi_z_level import MultiZLevelSettings
+    from .paths import PathSettings
+    from .type_slot_mapping import TypeSlotMappingSettings
+    from .ui import UISettings
+    from .validation import SettingsValidator
 
 logger = logging.getLogger(__name__)
 
+# Delay used to coalesce bursts of setter writes into a single sync()
+_SYNC_DELAY_MS = 500
+
+# Upper bound for sync() waiting on the background settings writer
+_WRITER_FLUSH_TIMEOUT_S = 5.0
+
 
 class AppSettings:
     """
@@ -32,214 +58,290 @@ class AppSettings:
 
     Provides type-safe access to application settings with automatic
     cross-platform storage and validation.
+
+    Use get_app_settings() to obtain the shared instance instead of
+    constructing new ones.
     """
 
+    # Number of AppSettings (and thus QSettings) instances created so far
+    _SETTINGS_INSTANCES = 0
+
     def __init__(self, profile: str = "default"):
         """Initialize settings with organization, application name, and profile.
 
         Args:
             profile: Settings profile name (default: "default")
         """
-        self.settings = QSettings("vetall812", "cdda_maped")
+        AppSettings._SETTINGS_INSTANCES += 1
+        # Single QSettings shared by every subsystem; opening more instances
+        # re-reads the backing store each time
+        self._settings = QSettings("vetall812", "cdda_maped")
         self.profile = profile
+        # In-memory mirror of raw settings values (None = missing), shared with
+        # the subsystems that read through it
+        self._value_cache: Dict[str, Any] = {}
+        # Cached typed reads over _value_cache
+        self._reader = TypedSettingsReader(self._settings, self._value_cache)
+        # Applies set_value() writes off the GUI thread
+        self._writer = SettingsWriter("vetall812", "cdda_maped", profile)
+        # True while a deferred sync() is already queued
+        self._sync_pending = False
 
         # Use profile as a group to create hierarchy: vetall812/cdda_maped/default/...
-        self.settings.beginGroup(profile)
-
-        # Initialize subsystems
-        self._migrator = SettingsMigrator(self.settings)
-        self._validator = SettingsValidator(self)
-        self._paths = PathSettings(self.settings)
-        self._ui = UISettings(self.settings)
-        self._editor = EditorSettings(self.settings)
-        self._logging = LoggingSettings(self.settings)
-        self._mods = ModSettings(self.settings)
-        self._type_slot_mapping = TypeSlotMappingSettings(self.settings)
-        self._multi_z_level = MultiZLevelSettings(self.settings)
-
-        # Ensure version and migrate if needed
+        # The group stays open for the lifetime of the instance: every
+        # subsystem, nested beginGroup() and external settings.settings user
+        # works with profile-relative keys, and QSettings applies the prefix
+        # natively, which is no slower than concatenating keys in Python
+        self._settings.beginGroup(profile)
+
+        # Only the migrator is needed up front; the remaining subsystems are
+        # cached properties created on first access, since most startup paths
+        # touch few of them. Their constructors do no I/O, and they share
+        # self._settings, whose group state makes it unsafe to use from several
+        # threads, so they are not built in parallel. Off-thread work uses its
+        # own QSettings (see SettingsWriter).
+        self._migrator = SettingsMigrator(self._settings, self._value_cache)
+
+        # Ensure version and migrate if needed; this also seeds the value cache
+        # with app/version (and app/first_run on a first run)
         self._migrator.ensure_version()
 
         logger.debug(
-            f"Settings initialized for profile '{profile}', stored at: {self.settings.fileName()}"
+            f"Settings initialized for profile '{profile}', stored at: {self._settings.fileName()} "
+            f"(instance #{AppSettings._SETTINGS_INSTANCES})"
         )
+        if AppSettings._SETTINGS_INSTANCES > 1:
+            logger.debug(
+                "Multiple AppSettings instances created; prefer get_app_settings()"
+            )
+
+    @property
+    def settings(self) -> QSettings:
+        """Underlying QSettings instance, scoped to the profile group (read-only)."""
+        return self._settings
 
     # === SUBSYSTEM ACCESS ===
+    # Subsystem modules are imported on first access so unused ones are never
+    # loaded at startup
 
-    @property
-    def paths(self) -> PathSettings:
+    @cached_property
+    def _validator(self) -> "SettingsValidator":
+        """Configuration validator, created on first validate() call."""
+        from .validation import SettingsValidator
+
+        return SettingsValidator(self)
+
+    @cached_property
+    def paths(self) -> "PathSettings":
         """Access path settings subsystem."""
-        return self._paths
+        from .paths import PathSettings
 
-    @property
-    def ui(self) -> UISettings:
+        return PathSettings(self._settings, self._value_cache, self._writer)
+
+    @cached_property
+    def ui(self) -> "UISettings":
         """Access UI settings subsystem."""
-        return self._ui
+        from .ui import UISettings
 
-    @property
-    def editor(self) -> EditorSettings:
+        return UISettings(self._settings, self._value_cache, self._writer)
+
+    @cached_property
+    def editor(self) -> "EditorSettings":
         """Access editor settings subsystem."""
-        return self._editor
+        from .editor import EditorSettings
 
-    @property
-    def logging(self) -> LoggingSettings:
+        return EditorSettings(self._settings, self._value_cache, self._schedule_sync)
+
+    @cached_property
+    def logging(self) -> "LoggingSettings":
         """Access logging settings subsystem."""
-        return self._logging
+        from .logging import LoggingSettings
 
-    @property
-    def type_slot_mapping(self) -> TypeSlotMappingSettings:
+        return LoggingSettings(self._settings, self._value_cache, self._schedule_sync)
+
+    @cached_property
+    def type_slot_mapping(self) -> "TypeSlotMappingSettings":
         """Access type-slot mapping settings subsystem."""
-        return self._type_slot_mapping
+        from .type_slot_mapping import TypeSlotMappingSettings
 
-    @property
-    def mods(self) -> ModSettings:
+        return TypeSlotMappingSettings(self._settings)
+
+    @cached_property
+    def mods(self) -> "ModSettings":
         """Access mod settings subsystem."""
-        return self._mods
+        from .mods import ModSettings
 
-    @property
-    def multi_z_level(self) -> MultiZLevelSettings:
+        return ModSettings(self._settings, self._value_cache, self._writer)
+
+    @cached_property
+    def multi_z_level(self) -> "MultiZLevelSettings":
         """Access multi-z-level rendering settings subsystem."""
-        return self._multi_z_level
+        from .multi_z_level import MultiZLevelSettings
+
+        return MultiZLevelSettings(
+            self._settings, self._value_cache, self._schedule_sync
+        )
 
     # === VERSION AND FIRST RUN ===
 
     @property
     def is_first_run(self) -> bool:
         """Check if this is the first run of the application."""
-        return self._get_bool("app/first_run", True)
+        return self._reader.get_bool("app/first_run", True)
 
     def set_first_run_complete(self) -> None:
         """Mark first run as complete."""
-        self.settings.setValue("app/first_run", False)
-        self.settings.sync()
+        if self._reader.set("app/first_run", bool_str(False)):
+            self._settings.sync()
 
     @property
     def version(self) -> str:
         """Get configuration version."""
-        return self._get_str("app/version", ConfigVersion.CURRENT.value)
+        return self._reader.get_str("app/version", ConfigVersion.CURRENT.value)
 
     # === HELPER METHODS ===
 
-    def _get_str(self, key: str, default: str = "") -> str:
-        """Type-safe string retrieval from settings."""
-        value = self.settings.value(key, default)
-        return str(value) if value is not None else default
+    def cached_value(self, key: str, default: Any = None) -> Any:
+        """Read a raw settings value, hitting QSettings only on first access.
+
+        Args:
+            key: Settings key relative to the profile group
+            default: Value returned when the key is not stored
 
-    def _get_bool(self, key: str, default: bool = False) -> bool:
-        """Type-safe boolean retrieval from settings."""
-        value = self.settings.value(key, default)
-        if isinstance(value, bool):
-            return value
-        if isinstance(value, str):
-            return value.lower() in ("true", "1", "yes")
-        return bool(value) if value is not None else default
+        Returns:
+            Stored value, or default if the key is missing
+        """
+        value = self._reader.value(key)
+        return default if value is None else value
+
+    def set_value(self, key: str, value: Any) -> None:
+        """Write a settings value, skipping the write if it is unchanged.
+
+        The write is queued to a background thread; cached_value() sees the
+        new value immediately, and sync() waits for it to reach storage.
+
+        Args:
+            key: Settings key relative to the profile group
+            value: New value to store
+        """
+        if key in self._value_cache and self._value_cache[key] == value:
+            return
+        self._value_cache[key] = value
+        self._writer.put(key, value)
 
     # === PATH SETTINGS (DELEGATED) ===
 
     @property
     def cdda_path(self) -> Optional[Path]:
         """Get CDDA game directory path."""
-        return self._paths.cdda_path
+        return self.paths.cdda_path
 
     @cdda_path.setter
     def cdda_path(self, value: Optional[Path]) -> None:
         """Set CDDA game directory path."""
-        self._paths.cdda_path = value
+        self.paths.cdda_path = value
 
     @property
     def cdda_data_path(self) -> Optional[Path]:
         """Get CDDA data directory path (derived from cdda_path)."""
-        return self._paths.cdda_data_path
+        return self.paths.cdda_data_path
 
     @property
     def tilesets_path(self) -> Optional[Path]:
         """Get tilesets directory path (derived from cdda_path)."""
-        return self._paths.tilesets_path
+        return self.paths.tilesets_path
 
     @property
     def recent_files(self) -> List[str]:
         """Get list of recently opened files."""
-        return self._paths.recent_files
+        return self.paths.recent_files
+
+    @property
+    def recent_files_tuple(self) -> Tuple[str, ...]:
+        """Recently opened files, as a shared read-only tuple."""
+        return self.paths.recent_files_tuple
 
     def add_recent_file(self, file_path: Union[str, Path]) -> None:
         """Add file to recent files list (max 10 items)."""
-        self._paths.add_recent_file(file_path)
+        self.paths.add_recent_file(file_path)
 
     def clear_recent_files(self) -> None:
         """Clear recent files list."""
-        self._paths.clear_recent_files()
+        self.paths.clear_recent_files()
 
     # === UI SETTINGS (DELEGATED) ===
 
-    def save_window_geometry(self, widget: Union[QWidget, QMainWindow]) -> None:
+    def save_window_geometry(self, widget: Union["QWidget", "QMainWindow"]) -> None:
         """Save window geometry and state."""
-        self._ui.save_window_geometry(widget)
+        self.ui.save_window_geometry(widget)
 
-    def restore_window_geometry(self, widget: Union[QWidget, QMainWindow]) -> bool:
+    def restore_window_geometry(self, widget: Union["QWidget", "QMainWindow"]) -> bool:
         """Restore window geometry and state. Returns True if restored."""
-        return self._ui.restore_window_geometry(widget)
+        return self.ui.restore_window_geometry(widget)
 
     def save_explorer_window_geometry(
-        self, widget: Union[QWidget, QMainWindow]
+        self, widget: Union["QWidget", "QMainWindow"]
     ) -> None:
         """Save object explorer window geometry and state."""
-        self._ui.save_explorer_window_geometry(widget)
+        self.ui.save_explorer_window_geometry(widget)
 
     def restore_explorer_window_geometry(
-        self, widget: Union[QWidget, QMainWindow]
+        self, widget: Union["QWidget", "QMainWindow"]
     ) -> bool:
         """Restore object explorer window geometry/state. Returns True if restored."""
-        return self._ui.restore_explorer_window_geometry(widget)
+        return self.ui.restore_explorer_window_geometry(widget)
 
-    def save_log_window_geometry(self, widget: Union[QWidget, QMainWindow]) -> None:
+    def save_log_window_geometry(self, widget: Union["QWidget", "QMainWindow"]) -> None:
         """Save log window geometry (separate from main window)."""
-        self._ui.save_log_window_geometry(widget)
+        self.ui.save_log_window_geometry(widget)
 
-    def restore_log_window_geometry(self, widget: Union[QWidget, QMainWindow]) -> bool:
+    def restore_log_window_geometry(
+        self, widget: Union["QWidget", "QMainWindow"]
+    ) -> bool:
         """Restore log window geometry. Returns True if restored."""
-        return self._ui.restore_log_window_geometry(widget)
+        return self.ui.restore_log_window_geometry(widget)
 
     @property
     def theme(self) -> str:
         """Get UI theme name."""
-        return self._ui.theme
+        return self.ui.theme
 
     @theme.setter
     def theme(self, value: str) -> None:
         """Set UI theme name."""
-        self._ui.theme = value
+        self.ui.theme = value
 
     @property
     def explorer_stay_above_main(self) -> bool:
         """Whether Object Explorer should stay above the main window."""
-        return self._ui.get_explorer_stay_above_main()
+        return self.ui.get_explorer_stay_above_main()
 
     @explorer_stay_above_main.setter
     def explorer_stay_above_main(self, value: bool) -> None:
         """Persist Object Explorer z-order option."""
-        self._ui.set_explorer_stay_above_main(value)
+        self.ui.set_explorer_stay_above_main(value)
 
     # === EDITOR SETTINGS (DELEGATED) ===
 
     @property
     def default_tileset(self) -> str:
         """Get default tileset name."""
-        return self._editor.default_tileset
+        return self.editor.default_tileset
 
     @default_tileset.setter
     def default_tileset(self, value: str) -> None:
         """Set default tileset name."""
-        self._editor.default_tileset = value
+        self.editor.default_tileset = value
 
     @property
     def default_tileset_iso(self) -> str:
         """Get default tileset name for isometric view."""
-        return self._editor.default_tileset_iso
+        return self.editor.default_tileset_iso
 
     @default_tileset_iso.setter
     def default_tileset_iso(self, value: str) -> None:
         """Set default tileset name for isometric view."""
-        self._editor.default_tileset_iso = value
+        self.editor.default_tileset_iso = value
 
     def get_preferred_tileset(
         self, tileset_service: "TilesetService", is_iso: bool = False
@@ -259,203 +361,208 @@ class AppSettings:
     @property
     def grid_visible(self) -> bool:
         """Check if grid should be visible."""
-        return self._editor.grid_visible
+        return self.editor.grid_visible
 
     @grid_visible.setter
     def grid_visible(self, value: bool) -> None:
         """Set grid visibility."""
-        self._editor.grid_visible = value
+        self.editor.grid_visible = value
 
     @property
     def zoom_level(self) -> float:
         """Get zoom level."""
-        return self._editor.zoom_level
+        return self.editor.zoom_level
 
     @zoom_level.setter
     def zoom_level(self, value: float) -> None:
         """Set zoom level."""
-        self._editor.zoom_level = value
+        self.editor.zoom_level = value
 
     @property
     def animation_timeout(self) -> int:
         """Get animation timeout in milliseconds."""
-        return self._editor.animation_timeout
+        return self.editor.animation_timeout
 
     @animation_timeout.setter
     def animation_timeout(self, value: int) -> None:
         """Set animation timeout in milliseconds."""
-        self._editor.animation_timeout = value
+        self.editor.animation_timeout = value
 
     # === LOGGING SETTINGS (DELEGATED) ===
 
     @property
     def console_logging(self) -> bool:
         """Check if console logging is enabled."""
-        return self._logging.console_logging
+        return self.logging.console_logging
 
     @console_logging.setter
     def console_logging(self, value: bool) -> None:
         """Set console logging enabled state."""
-        self._logging.console_logging = value
+        self.logging.console_logging = value
 
     @property
     def console_log_level(self) -> str:
         """Get console logging level."""
-        return self._logging.console_log_level
+        return self.logging.console_log_level
 
     @console_log_level.setter
     def console_log_level(self, value: str) -> None:
         """Set console logging level."""
-        self._logging.console_log_level = value
+        self.logging.console_log_level = value
 
     @property
     def console_use_colors(self) -> bool:
         """Check if console should use colors."""
-        return self._logging.console_use_colors
+        return self.logging.console_use_colors
 
     @console_use_colors.setter
     def console_use_colors(self, value: bool) -> None:
         """Set console color usage."""
-        self._logging.console_use_colors = value
+        self.logging.console_use_colors = value
 
     @property
     def file_logging(self) -> bool:
         """Check if file logging is enabled."""
-        return self._logging.file_logging
+        return self.logging.file_logging
 
     @file_logging.setter
     def file_logging(self, value: bool) -> None:
         """Set file logging enabled state."""
-        self._logging.file_logging = value
+        self.logging.file_logging = value
 
     @property
     def log_file_path(self) -> str:
         """Get log file path (read-only)."""
-        return self._logging.log_file_path
+        return self.logging.log_file_path
 
     @property
     def log_file_absolute_path(self) -> Path:
         """Get absolute path to log file."""
-        return self._logging.log_file_absolute_path
+        return self.logging.log_file_absolute_path
 
     @property
     def gui_logging(self) -> bool:
         """Check if GUI logging is enabled (always True)."""
-        return self._logging.gui_logging
+        return self.logging.gui_logging
 
     @property
     def gui_log_level(self) -> str:
         """Get GUI logging level."""
-        return self._logging.gui_log_level
+        return self.logging.gui_log_level
 
     @gui_log_level.setter
     def gui_log_level(self, value: str) -> None:
         """Set GUI logging level."""
-        self._logging.gui_log_level = value
+        self.logging.gui_log_level = value
 
     @property
     def gui_show_on_startup(self) -> bool:
         """Check if GUI log window should show on startup."""
-        return self._logging.gui_show_on_startup
+        return self.logging.gui_show_on_startup
 
     @gui_show_on_startup.setter
     def gui_show_on_startup(self, value: bool) -> None:
         """Set GUI log window show on startup."""
-        self._logging.gui_show_on_startup = value
+        self.logging.gui_show_on_startup = value
 
     @property
     def gui_show_on_error(self) -> bool:
         """Check if GUI log window should show on errors."""
-        return self._logging.gui_show_on_error
+        return self.logging.gui_show_on_error
 
     @gui_show_on_error.setter
     def gui_show_on_error(self, value: bool) -> None:
         """Set GUI log window show on error."""
-        self._logging.gui_show_on_error = value
+        self.logging.gui_show_on_error = value
 
     @property
     def gui_focus_on_error(self) -> bool:
         """Check if GUI log window should gain focus on errors."""
-        return self._logging.gui_focus_on_error
+        return self.logging.gui_focus_on_error
 
     @gui_focus_on_error.setter
     def gui_focus_on_error(self, value: bool) -> None:
         """Set GUI log window focus on error."""
-        self._logging.gui_focus_on_error = value
+        self.logging.gui_focus_on_error = value
 
     @property
     def gui_max_lines(self) -> int:
         """Get maximum number of lines to keep in GUI log buffer."""
-        return self._logging.gui_max_lines
+        return self.logging.gui_max_lines
 
     @gui_max_lines.setter
     def gui_max_lines(self, value: int) -> None:
         """Set maximum number of lines in GUI log buffer."""
-        self._logging.gui_max_lines = value
+        self.logging.gui_max_lines = value
 
     # === MOD SETTINGS (DELEGATED) ===
 
     @property
     def active_mods(self) -> List[str]:
         """Get list of active mods in priority order."""
-        return self._mods.active_mods
+        return self.mods.active_mods
 
     @active_mods.setter
     def active_mods(self, value: List[str]) -> None:
         """Set list of active mods in priority order."""
-        self._mods.active_mods = value
+        self.mods.active_mods = value
+
+    @property
+    def active_mods_tuple(self) -> Tuple[str, ...]:
+        """Active mods in priority order, as a shared read-only tuple."""
+        return self.mods.active_mods_tuple
 
     @property
     def available_mods(self) -> List[str]:
         """Get list of all available mods (cached for UI)."""
-        return self._mods.available_mods
+        return self.mods.available_mods
 
     @available_mods.setter
     def available_mods(self, value: List[str]) -> None:
         """Set list of all available mods (cached for UI)."""
-        self._mods.available_mods = value
+        self.mods.available_mods = value
 
     def add_mod(self, mod_id: str) -> None:
         """Add a mod to the active list if not already present."""
-        self._mods.add_mod(mod_id)
+        self.mods.add_mod(mod_id)
 
     def remove_mod(self, mod_id: str) -> None:
         """Remove a mod from the active list."""
-        self._mods.remove_mod(mod_id)
+        self.mods.remove_mod(mod_id)
 
     def move_mod_up(self, mod_id: str) -> bool:
         """Move mod up in priority (towards beginning of list)."""
-        return self._mods.move_mod_up(mod_id)
+        return self.mods.move_mod_up(mod_id)
 
     def move_mod_down(self, mod_id: str) -> bool:
         """Move mod down in priority (towards end of list)."""
-        return self._mods.move_mod_down(mod_id)
+        return self.mods.move_mod_down(mod_id)
 
     def set_mod_priority(self, mod_id: str, new_index: int) -> bool:
         """Set mod to specific priority position."""
-        return self._mods.set_mod_priority(mod_id, new_index)
+        return self.mods.set_mod_priority(mod_id, new_index)
 
     def clear_active_mods(self) -> None:
         """Clear all active mods."""
-        self._mods.clear_active_mods()
+        self.mods.clear_active_mods()
 
     def is_mod_active(self, mod_id: str) -> bool:
         """Check if a mod is active."""
-        return self._mods.is_mod_active(mod_id)
+        return self.mods.is_mod_active(mod_id)
 
     def get_mod_priority(self, mod_id: str) -> int:
         """Get priority index of a mod (-1 if not active)."""
-        return self._mods.get_mod_priority(mod_id)
+        return self.mods.get_mod_priority(mod_id)
 
     @property
     def always_include_core(self) -> bool:
         """Whether to always include core data regardless of active mods."""
-        return self._mods.always_include_core
+        return self.mods.always_include_core
 
     @always_include_core.setter
     def always_include_core(self, value: bool) -> None:
         """Set whether to always include core data."""
-        self._mods.always_include_core = value
+        self.mods.always_include_core = value
 
     # === VALIDATION ===
 
@@ -467,8 +574,42 @@ class AppSettings:
 
     def get_settings_file_path(self) -> str:
         """Get the file path where settings are stored."""
-        return self.settings.fileName()
+        return self._settings.fileName()
 
     def sync(self) -> None:
         """Force synchronization of settings to storage."""
-        self.settings.sync()
+        self._sync_pending = False
+        if "ui" in self.__dict__:
+            # Hand debounced geometry writes to the writer before flushing it
+            self.ui.flush_geometry()
+        self._writer.flush(_WRITER_FLUSH_TIMEOUT_S)
+        self._settings.sync()
+
+    def _schedule_sync(self) -> None:
+        """Queue a single deferred sync() for a burst of setter writes.
+
+        Without a running Qt application there is no event loop to fire the
+        timer; QSettings then still writes pending changes on destruction.
+        """
+        if self._sync_pending or QCoreApplication.instance() is None:
+            return
+        self._sync_pending = True
+        QTimer.singleShot(_SYNC_DELAY_MS, self._run_scheduled_sync)
+
+    def _run_scheduled_sync(self) -> None:
+        """Timer callback for _schedule_sync()."""
+        if self._sync_pending:
+            self._sync_pending = False
+            self._settings.sync()
+
+
+# Process-wide AppSettings instance returned by get_app_settings()
+_app_settings: Optional[AppSettings] = None
+
+
+def get_app_settings() -> AppSettings:
+    """Get the shared AppSettings instance, creating it on first use."""
+    global _app_settings
+    if _app_settings is None:
+        _app_settings = AppSettings()
+    return _app_settings
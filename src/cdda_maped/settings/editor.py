@@ -2,107 +2,117 @@
 Editor-related settings for CDDA-maped.
 """
 
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any, Callable, Dict, Final, Optional
+
+from ._accessors import TypedSettingsReader
+from ._helpers import bool_str
 
 if TYPE_CHECKING:
     from PySide6.QtCore import QSettings
 
 
+# Settings keys, relative to the profile group
+_KEY_DEFAULT_TILESET: Final[str] = "editor/default_tileset"
+_KEY_DEFAULT_TILESET_ISO: Final[str] = "editor/default_tileset_iso"
+_KEY_GRID_VISIBLE: Final[str] = "editor/grid_visible"
+_KEY_ZOOM_LEVEL: Final[str] = "editor/zoom_level"
+_KEY_ANIMATION_TIMEOUT: Final[str] = "editor/animation_timeout"
+
+# Allowed animation timeout range in milliseconds
+ANIMATION_TIMEOUT_MIN_MS: Final[int] = 1
+ANIMATION_TIMEOUT_MAX_MS: Final[int] = 1000
+
+
+def clamp_animation_timeout(value: int) -> int:
+    """Clamp an animation timeout to the allowed millisecond range."""
+    return max(ANIMATION_TIMEOUT_MIN_MS, min(ANIMATION_TIMEOUT_MAX_MS, value))
+
+
 class EditorSettings:
     """Manages editor-related settings."""
 
-    def __init__(self, settings: "QSettings"):
+    def __init__(
+        self,
+        settings: "QSettings",
+        cache: Optional[Dict[str, Any]] = None,
+        schedule_sync: Optional[Callable[[], None]] = None,
+    ):
         self.settings = settings
-
-    def _get_str(self, key: str, default: str = "") -> str:
-        """Type-safe string retrieval from settings."""
-        value = self.settings.value(key, default)
-        return str(value) if value is not None else default
-
-    def _get_bool(self, key: str, default: bool = False) -> bool:
-        """Type-safe boolean retrieval from settings."""
-        value = self.settings.value(key, default)
-        if isinstance(value, bool):
-            return value
-        if isinstance(value, str):
-            return value.lower() in ("true", "1", "yes")
-        return bool(value) if value is not None else default
-
-    def _get_float(self, key: str, default: float = 0.0) -> float:
-        """Type-safe float retrieval from settings."""
-        value = self.settings.value(key, default)
-        try:
-            if value is None:
-                return default
-            return float(cast(str | float, value))
-        except (ValueError, TypeError):
-            return default
+        # Cached typed reads and write-if-changed over the shared value cache
+        self._r = TypedSettingsReader(settings, cache)
+        # Requests a deferred, coalesced sync() after writes
+        self._schedule_sync = schedule_sync
+        # Set once the stored animation timeout has been range-checked
+        self._animation_timeout_checked = False
+
+    def _set(self, key: str, value: Any) -> None:
+        """Write a settings value if it changed and schedule a sync."""
+        if self._r.set(key, value) and self._schedule_sync is not None:
+            self._schedule_sync()
 
     @property
     def default_tileset(self) -> str:
         """Get default tileset name for orthogonal view."""
-        return self._get_str("editor/default_tileset", "UltimateCataclysm")
+        return self._r.get_str(_KEY_DEFAULT_TILESET, "UltimateCataclysm")
 
     @default_tileset.setter
     def default_tileset(self, value: str) -> None:
         """Set default tileset name for orthogonal view."""
-        self.settings.setValue("editor/default_tileset", value)
-        self.settings.sync()
+        self._set(_KEY_DEFAULT_TILESET, value)
 
     @property
     def default_tileset_iso(self) -> str:
         """Get default tileset name for isometric view."""
-        return self._get_str("editor/default_tileset_iso", "Ultica_iso")
+        return self._r.get_str(_KEY_DEFAULT_TILESET_ISO, "Ultica_iso")
 
     @default_tileset_iso.setter
     def default_tileset_iso(self, value: str) -> None:
         """Set default tileset name for isometric view."""
-        self.settings.setValue("editor/default_tileset_iso", value)
-        self.settings.sync()
+        self._set(_KEY_DEFAULT_TILESET_ISO, value)
 
     @property
     def grid_visible(self) -> bool:
         """Check if grid should be visible."""
-        return self._get_bool("editor/grid_visible", True)
+        return self._r.get_bool(_KEY_GRID_VISIBLE, True)
 
     @grid_visible.setter
     def grid_visible(self, value: bool) -> None:
         """Set grid visibility."""
-        self.settings.setValue("editor/grid_visible", value)
-        self.settings.sync()
+        self._set(_KEY_GRID_VISIBLE, bool_str(value))
 
     @property
     def zoom_level(self) -> float:
         """Get zoom level."""
-        return self._get_float("editor/zoom_level", 1.0)
+        return self._r.get_float(_KEY_ZOOM_LEVEL, 1.0)
 
     @zoom_level.setter
     def zoom_level(self, value: float) -> None:
         """Set zoom level."""
-        self.settings.sync()
-        self.settings.setValue("editor/zoom_level", value)
-
-    def _get_int(self, key: str, default: int = 0) -> int:
-        """Type-safe integer retrieval from settings."""
-        value = self.settings.value(key, default)
-        try:
-            if value is None:
-                return default
-            return int(cast(str | int, value))
-        except (ValueError, TypeError):
-            return default
+        self._set(_KEY_ZOOM_LEVEL, value)
 
     @property
     def animation_timeout(self) -> int:
         """Get animation timeout in milliseconds (1-1000 ms)."""
-        value = self._get_int("editor/animation_timeout", 10)
-        # Validate range
-        return max(1, min(1000, value))
+        if not self._animation_timeout_checked:
+            self._normalize_animation_timeout()
+        # Clamped on write and by the first read above, so later reads are
+        # plain cache hits
+        return self._r.get_int(_KEY_ANIMATION_TIMEOUT, 10)
 
     @animation_timeout.setter
     def animation_timeout(self, value: int) -> None:
         """Set animation timeout in milliseconds (1-1000 ms)."""
-        # Validate range
-        validated = max(1, min(1000, value))
-        self.settings.setValue("editor/animation_timeout", validated)
-        self.settings.sync()
+        self._set(_KEY_ANIMATION_TIMEOUT, clamp_animation_timeout(value))
+
+    def _normalize_animation_timeout(self) -> None:
+        """Clamp a stored out-of-range or non-numeric timeout once, in place."""
+        self._animation_timeout_checked = True
+        stored = self._r.value(_KEY_ANIMATION_TIMEOUT)
+        if stored is None:
+            return
+        value = self._r.get_int(_KEY_ANIMATION_TIMEOUT, 10)
+        clamped = clamp_animation_timeout(value)
+        if clamped != stored:
+            # Hand-edited or legacy profiles; also stores numeric strings as
+            # int so get_int() takes its fast path
+            self._set(_KEY_ANIMATION_TIMEOUT, clamped)
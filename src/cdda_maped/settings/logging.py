@@ -4,7 +4,10 @@ Logging-related settings for CDDA-maped.
 
 import logging
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable, Dict, Final, Optional
+
+from ._accessors import TypedSettingsReader
+from ._helpers import bool_str
 
 if TYPE_CHECKING:
     from PySide6.QtCore import QSettings
@@ -14,52 +17,66 @@ logger = logging.getLogger(__name__)
 # Константа для пути к логу
 LOG_FILE_PATH = "logs/cdda_maped.csv"
 
+# Settings keys, relative to the profile group
+_KEY_CONSOLE_ENABLED: Final[str] = "logging/console_enabled"
+_KEY_CONSOLE_LEVEL: Final[str] = "logging/console_level"
+_KEY_CONSOLE_USE_COLORS: Final[str] = "logging/console_use_colors"
+_KEY_FILE_ENABLED: Final[str] = "logging/file_enabled"
+_KEY_GUI_LEVEL: Final[str] = "logging/gui_level"
+_KEY_GUI_SHOW_ON_STARTUP: Final[str] = "logging/gui_show_on_startup"
+_KEY_GUI_SHOW_ON_ERROR: Final[str] = "logging/gui_show_on_error"
+_KEY_GUI_FOCUS_ON_ERROR: Final[str] = "logging/gui_focus_on_error"
+_KEY_GUI_MAX_LINES: Final[str] = "logging/gui_max_lines"
+
+# Level names accepted by the console and GUI log level setters
+_VALID_LOG_LEVELS: frozenset[str] = frozenset(
+    {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
+)
+
 
 class LoggingSettings:
     """Manages logging-related settings."""
 
-    def __init__(self, settings: "QSettings"):
+    def __init__(
+        self,
+        settings: "QSettings",
+        cache: Optional[Dict[str, Any]] = None,
+        schedule_sync: Optional[Callable[[], None]] = None,
+    ):
         self.settings = settings
-
-    def _get_str(self, key: str, default: str = "") -> str:
-        """Type-safe string retrieval from settings."""
-        value = self.settings.value(key, default)
-        return str(value) if value is not None else default
-
-    def _get_bool(self, key: str, default: bool = False) -> bool:
-        """Type-safe boolean retrieval from settings."""
-        value = self.settings.value(key, default)
-        if isinstance(value, bool):
-            return value
-        if isinstance(value, str):
-            return value.lower() in ("true", "1", "yes")
-        return bool(value) if value is not None else default
-
-    # === CONSOLE LOGGING SETTINGS ===
+        # Cached typed reads and write-if-changed over the shared value cache
+        self._r = TypedSettingsReader(settings, cache)
+        # Requests a deferred, coalesced sync() after writes
+        self._schedule_sync = schedule_sync
+        # Resolved LOG_FILE_PATH, computed on first access
+        self._log_file_absolute_path: Optional[Path] = None
+
+    def _set(self, key: str, value: Any) -> None:
+        """Write a settings value if it changed and schedule a sync."""
+        if self._r.set(key, value) and self._schedule_sync is not None:
+            self._schedule_sync()
 
     @property
     def console_logging(self) -> bool:
         """Check if console logging is enabled."""
-        return self._get_bool("logging/console_enabled", False)
+        return self._r.get_bool(_KEY_CONSOLE_ENABLED, False)
 
     @console_logging.setter
     def console_logging(self, value: bool) -> None:
         """Set console logging enabled state."""
-        self.settings.setValue("logging/console_enabled", value)
-        self.settings.sync()
+        self._set(_KEY_CONSOLE_ENABLED, bool_str(value))
 
     @property
     def console_log_level(self) -> str:
         """Get console logging level."""
-        return self._get_str("logging/console_level", "INFO")
+        return self._r.get_str(_KEY_CONSOLE_LEVEL, "INFO")
 
     @console_log_level.setter
     def console_log_level(self, value: str) -> None:
         """Set console logging level."""
-        valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        if value.upper() in valid_levels:
-            self.settings.setValue("logging/console_level", value.upper())
-            self.settings.sync()
+        upper_value = value.upper()
+        if upper_value in _VALID_LOG_LEVELS:
+            self._set(_KEY_CONSOLE_LEVEL, upper_value)
         else:
             logger.warning(
                 f"Invalid console log level: {value}, keeping current: {self.console_log_level}"
@@ -68,25 +85,24 @@ class LoggingSettings:
     @property
     def console_use_colors(self) -> bool:
         """Check if console should use colors."""
-        return self._get_bool("logging/console_use_colors", True)
+        return self._r.get_bool(_KEY_CONSOLE_USE_COLORS, True)
 
     @console_use_colors.setter
     def console_use_colors(self, value: bool) -> None:
         """Set console color usage."""
-        self.settings.sync()
-        self.settings.setValue("logging/console_use_colors", value)
+        self._set(_KEY_CONSOLE_USE_COLORS, bool_str(value))
 
     # === FILE LOGGING SETTINGS ===
 
     @property
     def file_logging(self) -> bool:
         """Check if file logging is enabled."""
-        return self._get_bool("logging/file_enabled", False)
+        return self._r.get_bool(_KEY_FILE_ENABLED, False)
 
     @file_logging.setter
     def file_logging(self, value: bool) -> None:
         """Set file logging enabled state."""
-        self.settings.setValue("logging/file_enabled", value)
+        self._set(_KEY_FILE_ENABLED, bool_str(value))
 
     @property
     def log_file_path(self) -> str:
@@ -95,8 +111,10 @@ class LoggingSettings:
 
     @property
     def log_file_absolute_path(self) -> Path:
-        """Get absolute path to log file."""
-        return Path(LOG_FILE_PATH).resolve()
+        """Get absolute path to log file (resolved once per instance)."""
+        if self._log_file_absolute_path is None:
+            self._log_file_absolute_path = Path(LOG_FILE_PATH).resolve()
+        return self._log_file_absolute_path
 
     # === GUI LOGGING SETTINGS ===
 
@@ -108,14 +126,14 @@ class LoggingSettings:
     @property
     def gui_log_level(self) -> str:
         """Get GUI logging level."""
-        return self._get_str("logging/gui_level", "INFO")
+        return self._r.get_str(_KEY_GUI_LEVEL, "INFO")
 
     @gui_log_level.setter
     def gui_log_level(self, value: str) -> None:
         """Set GUI logging level."""
-        valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        if value.upper() in valid_levels:
-            self.settings.setValue("logging/gui_level", value.upper())
+        upper_value = value.upper()
+        if upper_value in _VALID_LOG_LEVELS:
+            self._set(_KEY_GUI_LEVEL, upper_value)
         else:
             logger.warning(
                 f"Invalid GUI log level: {value}, keeping current: {self.gui_log_level}"
@@ -124,47 +142,43 @@ class LoggingSettings:
     @property
     def gui_show_on_startup(self) -> bool:
         """Check if GUI log window should show on startup."""
-        return self._get_bool("logging/gui_show_on_startup", True)
+        return self._r.get_bool(_KEY_GUI_SHOW_ON_STARTUP, True)
 
     @gui_show_on_startup.setter
     def gui_show_on_startup(self, value: bool) -> None:
         """Set GUI log window show on startup."""
-        self.settings.setValue("logging/gui_show_on_startup", value)
+        self._set(_KEY_GUI_SHOW_ON_STARTUP, bool_str(value))
 
     @property
     def gui_show_on_error(self) -> bool:
         """Check if GUI log window should show on errors."""
-        return self._get_bool("logging/gui_show_on_error", True)
+        return self._r.get_bool(_KEY_GUI_SHOW_ON_ERROR, True)
 
     @gui_show_on_error.setter
     def gui_show_on_error(self, value: bool) -> None:
         """Set GUI log window show on error."""
-        self.settings.setValue("logging/gui_show_on_error", value)
+        self._set(_KEY_GUI_SHOW_ON_ERROR, bool_str(value))
 
     @property
     def gui_focus_on_error(self) -> bool:
         """Check if GUI log window should gain focus on errors."""
-        return self._get_bool("logging/gui_focus_on_error", True)
+        return self._r.get_bool(_KEY_GUI_FOCUS_ON_ERROR, True)
 
     @gui_focus_on_error.setter
     def gui_focus_on_error(self, value: bool) -> None:
         """Set GUI log window focus on error."""
-        self.settings.setValue("logging/gui_focus_on_error", value)
+        self._set(_KEY_GUI_FOCUS_ON_ERROR, bool_str(value))
 
     @property
     def gui_max_lines(self) -> int:
         """Get maximum number of lines to keep in GUI log buffer."""
-        value = self.settings.value("logging/gui_max_lines", 1000)
-        try:
-            return int(str(value)) if value is not None else 1000
-        except (ValueError, TypeError):
-            return 1000
+        return self._r.get_int(_KEY_GUI_MAX_LINES, 1000)
 
     @gui_max_lines.setter
     def gui_max_lines(self, value: int) -> None:
         """Set maximum number of lines in GUI log buffer."""
         if value > 0:
-            self.settings.setValue("logging/gui_max_lines", value)
+            self._set(_KEY_GUI_MAX_LINES, value)
         else:
             logger.warning(
                 f"Invalid GUI max lines: {value}, keeping current: {self.gui_max_lines}"
@@ -4,8 +4,9 @@ Settings migration system for CDDA-maped.
 
 import logging
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
+from ._helpers import bool_str
 from .types import ConfigVersion
 
 if TYPE_CHECKING:
@@ -17,8 +18,10 @@ logger = logging.getLogger(__name__)
 class SettingsMigrator:
     """Handles configuration migration between versions."""
 
-    def __init__(self, settings: "QSettings"):
+    def __init__(self, settings: "QSettings", cache: Optional[Dict[str, Any]] = None):
         self.settings = settings
+        # Shared raw value cache; seeded with the app/* values handled here
+        self._cache: Dict[str, Any] = cache if cache is not None else {}
 
     def ensure_version(self) -> None:
         """Ensure configuration version is set and handle migrations."""
@@ -27,35 +30,66 @@ class SettingsMigrator:
         if not current_version:
             # First run - set current version
             self.settings.setValue("app/version", ConfigVersion.CURRENT.value)
-            self.settings.setValue("app/first_run", True)
+            self.settings.setValue("app/first_run", bool_str(True))
             self.settings.sync()
+            self._cache["app/first_run"] = bool_str(True)
+            current_version = ConfigVersion.CURRENT.value
             logger.info("First run detected, initializing configuration")
         elif current_version != ConfigVersion.CURRENT.value:
             # Migration needed
             self._migrate_config(current_version, ConfigVersion.CURRENT.value)
+            current_version = ConfigVersion.CURRENT.value
+
+        self._cache["app/version"] = current_version
 
     def _migrate_config(self, from_version: str, to_version: str) -> None:
         """Migrate configuration from old version to new version."""
         logger.info(f"Migrating configuration from {from_version} to {to_version}")
 
-        # Migration logic based on versions
-        if from_version == "1.0" and to_version == "1.1":
-            self._migrate_1_0_to_1_1()
-        # elif from_version == "1.1" and to_version == "2.0":
-        #     self._migrate_1_1_to_2_0()
-
-        # Update version after successful migration
-        self.settings.setValue("app/version", to_version)
-        self.settings.setValue("app/migrated_from", from_version)
-        self.settings.sync()
+        # Migration steps only stage changes; they are synced once at the end,
+        # including when a step fails, so partial progress is not lost
+        try:
+            # Migration logic based on versions
+            if from_version == "1.0" and to_version == "1.1":
+                self._migrate_1_0_to_1_1(self._read_group("paths"))
+            # elif from_version == "1.1" and to_version == "2.0":
+            #     self._migrate_1_1_to_2_0()
+
+            # Update version after successful migration
+            self.settings.setValue("app/version", to_version)
+            self.settings.setValue("app/migrated_from", from_version)
+        finally:
+            self.settings.sync()
         logger.info(f"Migration from {from_version} to {to_version} completed")
 
-    def _migrate_1_0_to_1_1(self) -> None:
-        """Migrate from version 1.0 to 1.1 - consolidate paths."""
+    def _read_group(self, group: str) -> Dict[str, Any]:
+        """Read all direct keys of a settings group in one pass.
+
+        Args:
+            group: Group name relative to the current profile group
+
+        Returns:
+            Mapping of "group/key" to the stored value
+        """
+        self.settings.beginGroup(group)
+        try:
+            return {
+                f"{group}/{key}": self.settings.value(key)
+                for key in self.settings.childKeys()
+            }
+        finally:
+            self.settings.endGroup()
+
+    def _migrate_1_0_to_1_1(self, paths: Dict[str, Any]) -> None:
+        """Migrate from version 1.0 to 1.1 - consolidate paths.
+
+        Args:
+            paths: Preloaded "paths/*" values (see _read_group)
+        """
         logger.debug("Performing migration from 1.0 to 1.1")
 
         # Migrate from cdda_data_path to cdda_path (parent directory)
-        old_data_path = str(self.settings.value("paths/cdda_data", ""))
+        old_data_path = str(paths.get("paths/cdda_data") or "")
         if old_data_path:
             data_path = Path(old_data_path)
 
@@ -76,13 +110,11 @@ class SettingsMigrator:
                 self.settings.setValue("paths/cdda", str(data_path))
                 logger.warning(f"Migrated unverified path as CDDA root: {data_path}")
 
-            self.settings.sync()
-
             # Remove old setting
             self.settings.remove("paths/cdda_data")
 
         # Remove tilesets_path since it's now derived from cdda_path
-        old_tilesets_path = self.settings.value("paths/tilesets", "")
+        old_tilesets_path = paths.get("paths/tilesets", "")
         if old_tilesets_path:
             logger.info(
                 f"Removed tilesets_path (now auto-derived): {old_tilesets_path}"
@@ -2,65 +2,110 @@
 Mod-related settings for CDDA-maped.
 """
 
-from typing import List, TYPE_CHECKING, cast
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from ._accessors import TypedSettingsReader
+from ._helpers import bool_str
 
 if TYPE_CHECKING:
     from PySide6.QtCore import QSettings
 
+    from .writer import SettingsWriter
+
+# Settings key holding the active mod IDs in priority order
+_ACTIVE_KEY = "mods/active"
+
 
 class ModSettings:
     """Manages mod-related settings."""
 
-    def __init__(self, settings: "QSettings"):
+    def __init__(
+        self,
+        settings: "QSettings",
+        cache: Optional[Dict[str, Any]] = None,
+        writer: Optional["SettingsWriter"] = None,
+    ):
         self.settings = settings
-
-    def _get_list(self, key: str, default: List[str] | None = None) -> List[str]:
-        """Type-safe list retrieval from settings."""
-        if default is None:
-            default = []
-        value = self.settings.value(key, default)
-        if isinstance(value, list):
-            return [
-                str(item) if item is not None else ""
-                for item in cast(list[object], value)
-            ]
-        return default
+        # In-memory copies of the mod lists; mutators edit them in place and
+        # queue each change to the writer thread once
+        self._r = TypedSettingsReader(settings, cache, writer)
+        # Position of each active mod, built lazily from the cached list so
+        # membership and priority lookups don't scan it
+        self._active_index: Optional[Dict[str, int]] = None
+
+    def _replace_list(self, key: str, value: List[str]) -> None:
+        """Store a new list unless it equals the cached one."""
+        if self._r.get_list(key) != value:
+            self._save_list(key, list(value))
+
+    def _save_list(self, key: str, value: List[str]) -> None:
+        """Write a (possibly in-place modified) cached list back to settings."""
+        if key == _ACTIVE_KEY:
+            self._active_index = None
+        self._r.put_list(key, value)
+
+    def _get_active_index(self) -> Dict[str, int]:
+        """Map of active mod ID to its priority index."""
+        index = self._active_index
+        if index is None:
+            active = self._r.get_list(_ACTIVE_KEY)
+            index = {}
+            for i, mod_id in enumerate(active):
+                # First occurrence wins, matching list.index()
+                index.setdefault(mod_id, i)
+            self._active_index = index
+        return index
+
+    def _swap_active(self, first: int, second: int) -> None:
+        """Swap two active mods, keeping the position index in step."""
+        active = self._r.get_list(_ACTIVE_KEY)
+        index = self._get_active_index()
+        active[first], active[second] = active[second], active[first]
+        self._r.put_list(_ACTIVE_KEY, active)
+        index[active[first]] = first
+        index[active[second]] = second
 
     @property
     def active_mods(self) -> List[str]:
         """Get list of active mods in priority order."""
-        return self._get_list("mods/active", [])
+        return list(self.active_mods_tuple)
 
     @active_mods.setter
     def active_mods(self, value: List[str]) -> None:
         """Set list of active mods in priority order."""
-        self.settings.setValue("mods/active", value)
-        self.settings.sync()
+        self._replace_list(_ACTIVE_KEY, value)
+
+    @property
+    def active_mods_tuple(self) -> Tuple[str, ...]:
+        """Active mods in priority order, shared read-only (no copy)."""
+        return self._r.get_tuple(_ACTIVE_KEY)
 
     @property
     def available_mods(self) -> List[str]:
         """Get list of all available mods (cached for UI)."""
-        return self._get_list("mods/available", [])
+        return list(self._r.get_tuple("mods/available"))
 
     @available_mods.setter
     def available_mods(self, value: List[str]) -> None:
         """Set list of all available mods (cached for UI)."""
-        self.settings.setValue("mods/available", value)
-        self.settings.sync()
+        self._replace_list("mods/available", value)
 
     def add_mod(self, mod_id: str) -> None:
         """Add a mod to the active list if not already present."""
-        active = self.active_mods
-        if mod_id not in active:
+        index = self._get_active_index()
+        if mod_id not in index:
+            active = self._r.get_list(_ACTIVE_KEY)
             active.append(mod_id)
-            self.active_mods = active
+            self._r.put_list(_ACTIVE_KEY, active)
+            index[mod_id] = len(active) - 1
 
     def remove_mod(self, mod_id: str) -> None:
         """Remove a mod from the active list."""
-        active = self.active_mods
-        if mod_id in active:
-            active.remove(mod_id)
-            self.active_mods = active
+        position = self._get_active_index().get(mod_id)
+        if position is not None:
+            active = self._r.get_list(_ACTIVE_KEY)
+            del active[position]
+            self._save_list(_ACTIVE_KEY, active)
 
     def move_mod_up(self, mod_id: str) -> bool:
         """Move mod up in priority (towards beginning of list).
@@ -68,15 +113,10 @@ class ModSettings:
         Returns:
             True if mod was moved, False if it was already at the top or not found.
         """
-        active = self.active_mods
-        try:
-            index = active.index(mod_id)
-            if index > 0:
-                active[index], active[index - 1] = active[index - 1], active[index]
-                self.active_mods = active
-                return True
-        except ValueError:
-            pass
+        index = self._get_active_index().get(mod_id)
+        if index is not None and index > 0:
+            self._swap_active(index, index - 1)
+            return True
         return False
 
     def move_mod_down(self, mod_id: str) -> bool:
@@ -85,15 +125,10 @@ class ModSettings:
         Returns:
             True if mod was moved, False if it was already at the bottom or not found.
         """
-        active = self.active_mods
-        try:
-            index = active.index(mod_id)
-            if index < len(active) - 1:
-                active[index], active[index + 1] = active[index + 1], active[index]
-                self.active_mods = active
-                return True
-        except ValueError:
-            pass
+        index = self._get_active_index().get(mod_id)
+        if index is not None and index < len(self._r.get_list(_ACTIVE_KEY)) - 1:
+            self._swap_active(index, index + 1)
+            return True
         return False
 
     def set_mod_priority(self, mod_id: str, new_index: int) -> bool:
@@ -106,17 +141,25 @@ class ModSettings:
         Returns:
             True if mod was moved, False if mod not found or index invalid.
         """
-        active = self.active_mods
-        try:
-            old_index = active.index(mod_id)
-            if 0 <= new_index < len(active) and old_index != new_index:
-                # Remove from old position and insert at new position
-                mod = active.pop(old_index)
-                active.insert(new_index, mod)
-                self.active_mods = active
-                return True
-        except (ValueError, IndexError):
-            pass
+        index = self._get_active_index()
+        old_index = index.get(mod_id)
+        if old_index is None:
+            return False
+        active = self._r.get_list(_ACTIVE_KEY)
+        if 0 <= new_index < len(active) and old_index != new_index:
+            # Shift only the entries between the two positions by one
+            mod = active[old_index]
+            if new_index > old_index:
+                active[old_index:new_index] = active[old_index + 1 : new_index + 1]
+                first, last = old_index, new_index
+            else:
+                active[new_index + 1 : old_index + 1] = active[new_index:old_index]
+                first, last = new_index, old_index
+            active[new_index] = mod
+            self._r.put_list(_ACTIVE_KEY, active)
+            for i in range(first, last + 1):
+                index[active[i]] = i
+            return True
         return False
 
     def clear_active_mods(self) -> None:
@@ -125,7 +168,7 @@ class ModSettings:
 
     def is_mod_active(self, mod_id: str) -> bool:
         """Check if a mod is active."""
-        return mod_id in self.active_mods
+        return mod_id in self._get_active_index()
 
     def get_mod_priority(self, mod_id: str) -> int:
         """Get priority index of a mod (-1 if not active).
@@ -133,19 +176,14 @@ class ModSettings:
         Returns:
             Priority index (0 = highest priority) or -1 if mod is not active.
         """
-        try:
-            return self.active_mods.index(mod_id)
-        except ValueError:
-            return -1
+        return self._get_active_index().get(mod_id, -1)
 
     @property
     def always_include_core(self) -> bool:
         """Whether to always include core data regardless of active mods."""
-        value = self.settings.value("mods/always_include_core", True, type=bool)
-        return bool(value)
+        return self._r.get_bool("mods/always_include_core", True)
 
     @always_include_core.setter
     def always_include_core(self, value: bool) -> None:
         """Set whether to always include core data."""
-        self.settings.sync()
-        self.settings.setValue("mods/always_include_core", value)
+        self._r.set("mods/always_include_core", bool_str(value))
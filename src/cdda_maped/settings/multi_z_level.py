@@ -2,7 +2,10 @@
 Multi-z-level rendering settings for CDDA-maped.
 """
 
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Any, Callable, Dict, Literal, Optional
+
+from ._accessors import TypedSettingsReader
+from ._helpers import bool_str
 
 if TYPE_CHECKING:
     from PySide6.QtCore import QSettings
@@ -16,90 +19,67 @@ TransparencyMethod = Literal["Add", "Magnify", "None"]
 class MultiZLevelSettings:
     """Manages multi-z-level rendering settings."""
 
-    def __init__(self, settings: "QSettings"):
+    def __init__(
+        self,
+        settings: "QSettings",
+        cache: Optional[Dict[str, Any]] = None,
+        schedule_sync: Optional[Callable[[], None]] = None,
+    ):
         self.settings = settings
+        # Cached typed reads and write-if-changed over the shared value cache
+        self._r = TypedSettingsReader(settings, cache)
+        # Requests a deferred, coalesced sync() after writes
+        self._schedule_sync = schedule_sync
 
-    def _get_str(self, key: str, default: str = "") -> str:
-        """Type-safe string retrieval from settings."""
-        value = self.settings.value(key, default)
-        return str(value) if value is not None else default
-
-    def _get_bool(self, key: str, default: bool = False) -> bool:
-        """Type-safe boolean retrieval from settings."""
-        value = self.settings.value(key, default)
-        if isinstance(value, bool):
-            return value
-        if isinstance(value, str):
-            return value.lower() in ("true", "1", "yes")
-        return bool(value) if value is not None else default
-
-    def _get_int(self, key: str, default: int = 0) -> int:
-        """Type-safe integer retrieval from settings."""
-        value = self.settings.value(key, default)
-        try:
-            if value is None:
-                return default
-            return int(value)  # type: ignore
-        except (ValueError, TypeError):
-            return default
-
-    def _get_float(self, key: str, default: float = 0.0) -> float:
-        """Type-safe float retrieval from settings."""
-        value = self.settings.value(key, default)
-        try:
-            if value is None:
-                return default
-            return float(value)  # type: ignore
-        except (ValueError, TypeError):
-            return default
+    def _set(self, key: str, value: Any) -> None:
+        """Write a settings value if it changed and schedule a sync."""
+        if self._r.set(key, value) and self._schedule_sync is not None:
+            self._schedule_sync()
 
     # === Enable Multi-Z-Level Rendering ===
 
     @property
     def enabled(self) -> bool:
         """Check if multi-z-level rendering is enabled."""
-        return self._get_bool("multi_z_level/enabled", False)
+        return self._r.get_bool("multi_z_level/enabled", False)
 
     @enabled.setter
     def enabled(self, value: bool) -> None:
         """Set multi-z-level rendering enabled state."""
-        self.settings.setValue("multi_z_level/enabled", value)
-        self.settings.sync()
+        self._set("multi_z_level/enabled", bool_str(value))
 
     # === Z-Level Range ===
 
     @property
     def levels_above(self) -> int:
         """Get number of z-levels to render above current (0-10)."""
-        value = self._get_int("multi_z_level/levels_above", 1)
+        value = self._r.get_int("multi_z_level/levels_above", 1)
         return max(0, min(10, value))
 
     @levels_above.setter
     def levels_above(self, value: int) -> None:
         """Set number of z-levels to render above current (0-10)."""
         validated = max(0, min(10, value))
-        self.settings.setValue("multi_z_level/levels_above", validated)
-        self.settings.sync()
+        self._set("multi_z_level/levels_above", validated)
 
     @property
     def levels_below(self) -> int:
         """Get number of z-levels to render below current (0-10)."""
-        value = self._get_int("multi_z_level/levels_below", 1)
+        value = self._r.get_int("multi_z_level/levels_below", 1)
         return max(0, min(10, value))
 
     @levels_below.setter
     def levels_below(self, value: int) -> None:
         """Set number of z-levels to render below current (0-10)."""
         validated = max(0, min(10, value))
-        self.settings.setValue("multi_z_level/levels_below", validated)
-        self.settings.sync()
+        self._set("multi_z_level/levels_below", validated)
 
     # === Brightness Settings ===
 
     @property
     def brightness_method(self) -> BrightnessMethod:
         """Get brightness adjustment method."""
-        value = self._get_str("multi_z_level/brightness_method", "Add")
+        value = self._r.get_str("multi_z_level/brightness_method", "Add")
         if value in ("Add", "Magnify", "None"):
             return value  # type: ignore
         return "Add"
@@ -109,26 +89,24 @@ class MultiZLevelSettings:
         """Set brightness adjustment method."""
         if value not in ("Add", "Magnify", "None"):
             raise ValueError(f"Invalid brightness method: {value}")
-        self.settings.setValue("multi_z_level/brightness_method", value)
-        self.settings.sync()
+        self._set("multi_z_level/brightness_method", value)
 
     @property
     def brightness_step(self) -> float:
         """Get brightness step per z-level (0.0-1.0, stored as 0-100%)."""
-        value = self._get_float("multi_z_level/brightness_step", 20.0)
+        value = self._r.get_float("multi_z_level/brightness_step", 20.0)
         return max(0.0, min(100.0, value)) / 100.0
 
     @brightness_step.setter
     def brightness_step(self, value: float) -> None:
         """Set brightness step per z-level (0.0-1.0, stored as 0-100%)."""
         validated = max(0.0, min(1.0, value)) * 100.0
-        self.settings.setValue("multi_z_level/brightness_step", validated)
-        self.settings.sync()
+        self._set("multi_z_level/brightness_step", validated)
 
     @property
     def brightness_operation_above(self) -> BrightnessOperation:
         """Get brightness operation for z-levels above current."""
-        value = self._get_str("multi_z_level/brightness_operation_above", "Darken")
+        value = self._r.get_str("multi_z_level/brightness_operation_above", "Darken")
         if value in ("Darken", "Lighten", "None"):
             return value  # type: ignore
         return "Darken"
@@ -138,13 +116,12 @@ class MultiZLevelSettings:
         """Set brightness operation for z-levels above current."""
         if value not in ("Darken", "Lighten", "None"):
             raise ValueError(f"Invalid brightness operation: {value}")
-        self.settings.setValue("multi_z_level/brightness_operation_above", value)
-        self.settings.sync()
+        self._set("multi_z_level/brightness_operation_above", value)
 
     @property
     def brightness_operation_below(self) -> BrightnessOperation:
         """Get brightness operation for z-levels below current."""
-        value = self._get_str("multi_z_level/brightness_operation_below", "Darken")
+        value = self._r.get_str("multi_z_level/brightness_operation_below", "Darken")
         if value in ("Darken", "Lighten", "None"):
             return value  # type: ignore
         return "Darken"
@@ -154,15 +131,14 @@ class MultiZLevelSettings:
         """Set brightness operation for z-levels below current."""
         if value not in ("Darken", "Lighten", "None"):
             raise ValueError(f"Invalid brightness operation: {value}")
-        self.settings.setValue("multi_z_level/brightness_operation_below", value)
-        self.settings.sync()
+        self._set("multi_z_level/brightness_operation_below", value)
 
     # === Transparency Settings ===
 
     @property
     def transparency_method(self) -> TransparencyMethod:
         """Get transparency adjustment method."""
-        value = self._get_str("multi_z_level/transparency_method", "Add")
+        value = self._r.get_str("multi_z_level/transparency_method", "Add")
         if value in ("Add", "Magnify", "None"):
             return value  # type: ignore
         return "Add"
@@ -172,21 +148,19 @@ class MultiZLevelSettings:
         """Set transparency adjustment method."""
         if value not in ("Add", "Magnify", "None"):
             raise ValueError(f"Invalid transparency method: {value}")
-        self.settings.setValue("multi_z_level/transparency_method", value)
-        self.settings.sync()
+        self._set("multi_z_level/transparency_method", value)
 
     @property
     def transparency_step(self) -> float:
         """Get transparency step per z-level (0.0-1.0, stored as 0-100%)."""
-        value = self._get_float("multi_z_level/transparency_step", 20.0)
+        value = self._r.get_float("multi_z_level/transparency_step", 20.0)
         return max(0.0, min(100.0, value)) / 100.0
 
     @transparency_step.setter
     def transparency_step(self, value: float) -> None:
         """Set transparency step per z-level (0.0-1.0, stored as 0-100%)."""
         validated = max(0.0, min(1.0, value)) * 100.0
-        self.settings.setValue("multi_z_level/transparency_step", validated)
-        self.settings.sync()
+        self._set("multi_z_level/transparency_step", validated)
 
     # === Utility Methods ===
 
@@ -2,86 +2,109 @@
 Path-related settings for CDDA-maped.
 """
 
+from functools import cached_property
 from pathlib import Path
-from typing import List, Optional, Union, TYPE_CHECKING, cast
+from typing import Any, Dict, List, Optional, Tuple, Union, TYPE_CHECKING
+
+from ._accessors import TypedSettingsReader
 
 if TYPE_CHECKING:
     from PySide6.QtCore import QSettings
 
+    from .writer import SettingsWriter
+
+# Cached attributes that depend on the stored CDDA path
+_CDDA_PATH_DERIVED = ("_cdda_path", "cdda_data_path", "tilesets_path")
+
+# Number of entries kept in the recent files list
+_MAX_RECENT_FILES = 10
+
 
 class PathSettings:
     """Manages path-related settings."""
 
-    def __init__(self, settings: "QSettings"):
+    def __init__(
+        self,
+        settings: "QSettings",
+        cache: Optional[Dict[str, Any]] = None,
+        writer: Optional["SettingsWriter"] = None,
+    ):
         self.settings = settings
+        # Cached reads; writes are queued to the writer thread
+        self._r = TypedSettingsReader(settings, cache, writer)
 
-    def _get_str(self, key: str, default: str = "") -> str:
-        """Type-safe string retrieval from settings."""
-        value = self.settings.value(key, default)
-        return str(value) if value is not None else default
-
-    def _get_list(self, key: str, default: Optional[List[str]] = None) -> List[str]:
-        """Type-safe list retrieval from settings."""
-        if default is None:
-            default = []
-        value = self.settings.value(key, default)
-        if isinstance(value, list):
-            return [
-                str(item) if item is not None else ""
-                for item in cast(list[object], value)
-            ]
-        return default
+    @cached_property
+    def _cdda_path(self) -> Optional[Path]:
+        """Stored CDDA game directory as a Path, built once per value."""
+        path_str = self._r.get_str("paths/cdda", "")
+        return Path(path_str) if path_str else None
 
     @property
     def cdda_path(self) -> Optional[Path]:
         """Get CDDA game directory path."""
-        path_str = self._get_str("paths/cdda", "")
-        return Path(path_str) if path_str else None
+        return self._cdda_path
 
     @cdda_path.setter
     def cdda_path(self, value: Optional[Path]) -> None:
         """Set CDDA game directory path."""
-        self.settings.setValue("paths/cdda", str(value) if value else "")
-        self.settings.sync()
+        self._r.set("paths/cdda", str(value) if value else "")
+        # Drop the cached path and everything derived from it
+        for name in _CDDA_PATH_DERIVED:
+            self.__dict__.pop(name, None)
 
-    @property
+    @cached_property
     def cdda_data_path(self) -> Optional[Path]:
         """Get CDDA data directory path (derived from cdda_path)."""
-        if self.cdda_path:
-            return self.cdda_path / "data"
-        return None
+        cdda_path = self._cdda_path
+        return cdda_path / "data" if cdda_path else None
 
-    @property
+    @cached_property
     def tilesets_path(self) -> Optional[Path]:
         """Get tilesets directory path (derived from cdda_path)."""
-        if self.cdda_path:
-            return self.cdda_path / "gfx"
-        return None
+        cdda_path = self._cdda_path
+        return cdda_path / "gfx" if cdda_path else None
 
     @property
     def recent_files(self) -> List[str]:
         """Get list of recently opened files."""
-        return self._get_list("paths/recent_files", [])
+        return list(self.recent_files_tuple)
+
+    @recent_files.setter
+    def recent_files(self, value: List[str]) -> None:
+        """Replace the recent files list."""
+        if self._r.get_list("paths/recent_files") != value:
+            self._r.put_list("paths/recent_files", list(value))
+
+    @property
+    def recent_files_tuple(self) -> Tuple[str, ...]:
+        """Recently opened files, shared read-only (no copy)."""
+        return self._r.get_tuple("paths/recent_files")
 
     def add_recent_file(self, file_path: Union[str, Path]) -> None:
         """Add file to recent files list (max 10 items)."""
-        recent = self.recent_files
+        # Edit the cached list in place and queue it for writing once
+        recent = self._r.get_list("paths/recent_files")
         file_str = str(file_path)
 
+        # Reopening the most recent file changes nothing
+        if recent and recent[0] == file_str:
+            return
+
         # Remove if already exists
-        if file_str in recent:
+        try:
             recent.remove(file_str)
+        except ValueError:
+            pass
 
         # Add to beginning
         recent.insert(0, file_str)
 
-        # Keep only 10 most recent
-        recent = recent[:10]
+        # Keep only the most recent entries
+        del recent[_MAX_RECENT_FILES:]
 
-        self.settings.setValue("paths/recent_files", recent)
-        self.settings.sync()
+        self._r.put_list("paths/recent_files", recent)
 
     def clear_recent_files(self) -> None:
         """Clear recent files list."""
-        self.settings.sync()
-        self.settings.setValue("paths/recent_files", [])
+        if self._r.get_list("paths/recent_files"):
+            self._r.put_list("paths/recent_files", [])
@@ -4,12 +4,20 @@ Type to slot mapping settings.
 Manages the mapping between CDDA object types and cell slots.
 """
 
+import json
 import logging
+from functools import cache
 from typing import Dict, Optional, List
 from PySide6.QtCore import QSettings
 
 logger = logging.getLogger(__name__)
 
+# Settings group that holds the mapping
+_MAPPING_GROUP = "TypeSlotMapping"
+# Key (inside the group) of the JSON-serialized mapping; older configs store
+# one key per object type in the group instead
+_MAPPING_DATA_KEY = "data"
+
 
 # Default mapping for common CDDA types
 DEFAULT_TYPE_SLOT_MAPPING: Dict[str, str] = {
@@ -20,6 +28,15 @@ DEFAULT_TYPE_SLOT_MAPPING: Dict[str, str] = {
 }
 
 
+@cache
+def _available_slot_names() -> tuple[str, ...]:
+    """Names of all CellSlot members; the enum is fixed, so computed once."""
+    # Import here to avoid circular dependency
+    from ..maps.models import CellSlot
+
+    return tuple(slot.name for slot in CellSlot)
+
+
 class TypeSlotMappingSettings:
     """Settings for mapping CDDA object types to cell slots."""
 
@@ -31,6 +48,8 @@ class TypeSlotMappingSettings:
         """
         self.settings = settings
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        # Mapping as last read or written; None until first needed
+        self._mapping_cache: Optional[Dict[str, str]] = None
 
     def get_mapping(self) -> Dict[str, str]:
         """Get the complete type-to-slot mapping.
@@ -39,10 +58,30 @@ class TypeSlotMappingSettings:
             Dictionary mapping object type to slot name (e.g., {"terrain": "TERRAIN"})
             If no custom mapping exists, returns default mapping
         """
+        return self._load_mapping().copy()
+
+    def _load_mapping(self) -> Dict[str, str]:
+        """Cached mapping; must not be modified by callers."""
+        if self._mapping_cache is None:
+            self._mapping_cache = self._read_mapping()
+        return self._mapping_cache
+
+    def _read_mapping(self) -> Dict[str, str]:
+        """Read the mapping from settings."""
         # Try to load from settings
-        self.settings.beginGroup("TypeSlotMapping")
+        self.settings.beginGroup(_MAPPING_GROUP)
         try:
-            # Get list of all types that have custom mappings
+            data = self.settings.value(_MAPPING_DATA_KEY)
+            if data is not None:
+                try:
+                    stored = self._parse_mapping(str(data))
+                except ValueError as e:
+                    self.logger.warning(f"Invalid stored type-slot mapping: {e}")
+                    stored = {}
+                # An empty mapping means "no custom mapping", as before
+                return stored or DEFAULT_TYPE_SLOT_MAPPING.copy()
+
+            # Legacy layout: one key per object type
             all_keys = self.settings.allKeys()
 
             if not all_keys:
@@ -66,20 +105,38 @@ class TypeSlotMappingSettings:
         Args:
             mapping: Dictionary mapping object type to slot name
         """
-        self.settings.beginGroup("TypeSlotMapping")
+        # Only save entries with a slot
+        stored = {object_type: slot for object_type, slot in mapping.items() if slot}
+        if stored and stored == self._mapping_cache:
+            return
+
+        self.settings.beginGroup(_MAPPING_GROUP)
         try:
-            # Clear existing mapping
+            # Clear existing mapping, including legacy per-type keys
             self.settings.remove("")
 
-            # Save new mapping
-            for object_type, slot in mapping.items():
-                if slot:  # Only save if slot is not empty
-                    self.settings.setValue(object_type, slot)
+            # Save new mapping as a single value
+            self.settings.setValue(_MAPPING_DATA_KEY, json.dumps(stored))
 
             self.logger.debug(f"Saved type-slot mapping with {len(mapping)} entries")
         finally:
             self.settings.endGroup()
 
+        # Same result get_mapping() would read back
+        self._mapping_cache = stored or DEFAULT_TYPE_SLOT_MAPPING.copy()
+
+    @staticmethod
+    def _parse_mapping(data: str) -> Dict[str, str]:
+        """Parse a JSON-serialized mapping.
+
+        Raises:
+            ValueError: If data is not a JSON object
+        """
+        parsed = json.loads(data)
+        if not isinstance(parsed, dict):
+            raise ValueError("expected a JSON object")
+        return {str(key): str(slot) for key, slot in parsed.items() if slot}
+
     def get_slot_for_type(self, object_type: str) -> Optional[str]:
         """Get the slot assigned to a specific object type.
 
@@ -89,8 +146,7 @@ class TypeSlotMappingSettings:
         Returns:
             Slot name (e.g., "TERRAIN") or None if not mapped
         """
-        mapping = self.get_mapping()
-        return mapping.get(object_type)
+        return self._load_mapping().get(object_type)
 
     def set_slot_for_type(self, object_type: str, slot: Optional[str]) -> None:
         """Set the slot for a specific object type.
@@ -99,16 +155,16 @@ class TypeSlotMappingSettings:
             object_type: CDDA object type
             slot: Slot name or None to unmap
         """
-        self.settings.beginGroup("TypeSlotMapping")
-        try:
-            if slot:
-                self.settings.setValue(object_type, slot)
-                self.logger.debug(f"Mapped type '{object_type}' to slot '{slot}'")
-            else:
-                self.settings.remove(object_type)
-                self.logger.debug(f"Unmapped type '{object_type}'")
-        finally:
-            self.settings.endGroup()
+        if self._load_mapping().get(object_type) == (slot or None):
+            return
+        mapping = self._load_mapping().copy()
+        if slot:
+            mapping[object_type] = slot
+            self.logger.debug(f"Mapped type '{object_type}' to slot '{slot}'")
+        else:
+            mapping.pop(object_type, None)
+            self.logger.debug(f"Unmapped type '{object_type}'")
+        self.set_mapping(mapping)
 
     def get_mapped_types(self) -> List[str]:
         """Get list of all object types that are mapped to any slot.
@@ -116,8 +172,7 @@ class TypeSlotMappingSettings:
         Returns:
             List of object type names
         """
-        mapping = self.get_mapping()
-        return list(mapping.keys())
+        return list(self._load_mapping())
 
     def get_types_for_slot(self, slot: str) -> List[str]:
         """Get list of object types assigned to a specific slot.
@@ -128,8 +183,11 @@ class TypeSlotMappingSettings:
         Returns:
             List of object types mapped to this slot
         """
-        mapping = self.get_mapping()
-        return [obj_type for obj_type, obj_slot in mapping.items() if obj_slot == slot]
+        return [
+            obj_type
+            for obj_type, obj_slot in self._load_mapping().items()
+            if obj_slot == slot
+        ]
 
     def reset_to_defaults(self) -> None:
         """Reset mapping to default values."""
@@ -142,7 +200,4 @@ class TypeSlotMappingSettings:
         Returns:
             List of slot names (e.g., ["TERRAIN", "FURNITURE", "ITEMS", ...])
         """
-        # Import here to avoid circular dependency
-        from ..maps.models import CellSlot
-
-        return [slot.name for slot in CellSlot]
+        return list(_available_slot_names())
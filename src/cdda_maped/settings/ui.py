@@ -2,94 +2,128 @@
 UI-related settings for CDDA-maped.
 """
 
-from typing import Union, TYPE_CHECKING, Any
+from typing import Any, Dict, Optional, Union, TYPE_CHECKING
 
-from PySide6.QtCore import QByteArray
+from PySide6.QtCore import QByteArray, QCoreApplication, QTimer
 from PySide6.QtWidgets import QWidget, QMainWindow
 
+from ._accessors import TypedSettingsReader
+from ._helpers import bool_str
+
 if TYPE_CHECKING:
     from PySide6.QtCore import QSettings
 
+    from .writer import SettingsWriter
+
+# Quiet period after the last geometry save before it is written
+_GEOMETRY_SAVE_DELAY_MS = 300
+
 
 class UISettings:
     """Manages UI-related settings."""
 
-    def __init__(self, settings: "QSettings"):
+    def __init__(
+        self,
+        settings: "QSettings",
+        cache: Optional[Dict[str, Any]] = None,
+        writer: Optional["SettingsWriter"] = None,
+    ):
         self.settings = settings
-
-    def _get_str(self, key: str, default: str = "") -> str:
-        """Type-safe string retrieval from settings."""
-        value = self.settings.value(key, default)
-        return str(value) if value is not None else default
-
-    def _get_bool(self, key: str, default: bool = False) -> bool:
-        """Type-safe boolean retrieval from settings."""
-        value = self.settings.value(key, default)
-        if isinstance(value, bool):
+        # Cached reads; writes (including geometry saved on every move/resize)
+        # are queued to the writer thread
+        self._r = TypedSettingsReader(settings, cache, writer)
+        # Geometry/state values saved within the debounce window, by key
+        self._pending_geometry: Dict[str, Any] = {}
+        self._geometry_timer: Optional[QTimer] = None
+
+    @staticmethod
+    def _coerce_qba(value: Any) -> Optional[QByteArray]:
+        """Convert a stored geometry/state value to QByteArray.
+
+        QSettings normally hands back a QByteArray already, which is returned
+        as-is without copying.
+
+        Returns:
+            The value as QByteArray, or None if it cannot be converted
+        """
+        if isinstance(value, QByteArray):
             return value
-        if isinstance(value, str):
-            return value.lower() in ("true", "1", "yes")
-        return bool(value) if value is not None else default
+        if isinstance(value, bytes):
+            return QByteArray(value)
+        # Try to convert from string or other format
+        try:
+            return QByteArray(bytes(value))
+        except (TypeError, ValueError):
+            return None
+
+    def _save_geometry(self, key: str, value: QByteArray) -> None:
+        """Stage a geometry/state value; bursts collapse into one write."""
+        if QCoreApplication.instance() is None:
+            # No event loop to fire the timer
+            self._r.set(key, value)
+            return
+        self._pending_geometry[key] = value
+        if self._geometry_timer is None:
+            self._geometry_timer = QTimer()
+            self._geometry_timer.setSingleShot(True)
+            self._geometry_timer.setInterval(_GEOMETRY_SAVE_DELAY_MS)
+            self._geometry_timer.timeout.connect(self.flush_geometry)
+        # Restarting pushes the write out until saves settle
+        self._geometry_timer.start()
+
+    def _geometry(self, key: str) -> Any:
+        """Stored geometry/state value, including one not yet written."""
+        if key in self._pending_geometry:
+            return self._pending_geometry[key]
+        return self._r.value(key)
+
+    def flush_geometry(self) -> None:
+        """Write staged geometry/state values now."""
+        if self._geometry_timer is not None:
+            self._geometry_timer.stop()
+        pending, self._pending_geometry = self._pending_geometry, {}
+        for key, value in pending.items():
+            self._r.set(key, value)
 
     def get_explorer_stay_above_main(self) -> bool:
         """Whether Object Explorer should stay above the main window."""
-        return self._get_bool("explorer/stay_above_main", False)
+        return self._r.get_bool("explorer/stay_above_main", False)
 
     def set_explorer_stay_above_main(self, value: bool) -> None:
         """Persist 'stay above main window' option for Object Explorer."""
-        self.settings.setValue("explorer/stay_above_main", bool(value))
-        self.settings.sync()
+        self._r.set("explorer/stay_above_main", bool_str(value))
 
     def save_window_geometry(self, widget: Union[QWidget, QMainWindow]) -> None:
         """Save window geometry and state."""
         if hasattr(widget, "saveGeometry"):
-            self.settings.setValue("ui/window_geometry", widget.saveGeometry())
+            self._save_geometry("ui/window_geometry", widget.saveGeometry())
         # Only QMainWindow has saveState
         if isinstance(widget, QMainWindow):
-            self.settings.setValue("ui/window_state", widget.saveState())
-        self.settings.sync()
+            self._save_geometry("ui/window_state", widget.saveState())
 
     def save_explorer_window_geometry(
         self, widget: Union[QWidget, QMainWindow]
     ) -> None:
         """Save object explorer window geometry and state."""
         if hasattr(widget, "saveGeometry"):
-            self.settings.setValue("explorer/window_geometry", widget.saveGeometry())
+            self._save_geometry("explorer/window_geometry", widget.saveGeometry())
         if isinstance(widget, QMainWindow):
-            self.settings.setValue("explorer/window_state", widget.saveState())
-        self.settings.sync()
+            self._save_geometry("explorer/window_state", widget.saveState())
 
     def restore_window_geometry(self, widget: Union[QWidget, QMainWindow]) -> bool:
         """Restore window geometry and state. Returns True if restored."""
-        geometry: Any = self.settings.value("ui/window_geometry")
-        state: Any = self.settings.value("ui/window_state")
+        geometry: Any = self._geometry("ui/window_geometry")
+        state: Any = self._geometry("ui/window_state")
 
         restored = False
         if geometry and hasattr(widget, "restoreGeometry"):
-            # Ensure it's QByteArray
-            if isinstance(geometry, bytes):
-                geometry = QByteArray(geometry)
-            elif not isinstance(geometry, QByteArray):
-                # Try to convert from string or other format
-                try:
-                    geometry = QByteArray(bytes(geometry))
-                except (TypeError, ValueError):
-                    geometry = None
-
+            geometry = self._coerce_qba(geometry)
             if geometry:
                 widget.restoreGeometry(geometry)
                 restored = True
 
         if state and isinstance(widget, QMainWindow):
-            # Ensure it's QByteArray
-            if isinstance(state, bytes):
-                state = QByteArray(state)
-            elif not isinstance(state, QByteArray):
-                try:
-                    state = QByteArray(bytes(state))
-                except (TypeError, ValueError):
-                    state = None
-
+            state = self._coerce_qba(state)
             if state:
                 widget.restoreState(state)
                 restored = True
@@ -100,34 +134,22 @@ class UISettings:
         self, widget: Union[QWidget, QMainWindow]
     ) -> bool:
         """Restore object explorer window geometry/state. Returns True if restored."""
-        geometry: Any = self.settings.value("explorer/window_geometry")
-        state: Any = self.settings.value("explorer/window_state")
+        geometry: Any = self._geometry("explorer/window_geometry")
+        state: Any = self._geometry("explorer/window_state")
 
         # Fallback to legacy keys if new ones are absent (backward compatibility)
         if geometry is None and state is None:
-            geometry = self.settings.value("ui/window_geometry")
-            state = self.settings.value("ui/window_state")
+            geometry = self._geometry("ui/window_geometry")
+            state = self._geometry("ui/window_state")
 
         restored = False
         if geometry and hasattr(widget, "restoreGeometry"):
-            if isinstance(geometry, bytes):
-                geometry = QByteArray(geometry)
-            elif not isinstance(geometry, QByteArray):
-                try:
-                    geometry = QByteArray(bytes(geometry))
-                except (TypeError, ValueError):
-                    geometry = None
+            geometry = self._coerce_qba(geometry)
             if geometry:
                 restored = widget.restoreGeometry(geometry) or restored
 
         if state and isinstance(widget, QMainWindow):
-            if isinstance(state, bytes):
-                state = QByteArray(state)
-            elif not isinstance(state, QByteArray):
-                try:
-                    state = QByteArray(bytes(state))
-                except (TypeError, ValueError):
-                    state = None
+            state = self._coerce_qba(state)
             if state:
                 restored = widget.restoreState(state) or restored
 
@@ -136,24 +158,14 @@ class UISettings:
     def save_log_window_geometry(self, widget: Union[QWidget, QMainWindow]) -> None:
         """Save log window geometry (separate from main window)."""
         if hasattr(widget, "saveGeometry"):
-            self.settings.setValue("ui/log_window_geometry", widget.saveGeometry())
-        self.settings.sync()
+            self._save_geometry("ui/log_window_geometry", widget.saveGeometry())
 
     def restore_log_window_geometry(self, widget: Union[QWidget, QMainWindow]) -> bool:
         """Restore log window geometry. Returns True if restored."""
-        geometry: Any = self.settings.value("ui/log_window_geometry")
+        geometry: Any = self._geometry("ui/log_window_geometry")
 
         if geometry and hasattr(widget, "restoreGeometry"):
-            # Ensure it's QByteArray
-            if isinstance(geometry, bytes):
-                geometry = QByteArray(geometry)
-            elif not isinstance(geometry, QByteArray):
-                # Try to convert from string or other format
-                try:
-                    geometry = QByteArray(bytes(geometry))
-                except (TypeError, ValueError):
-                    geometry = None
-
+            geometry = self._coerce_qba(geometry)
             if geometry:
                 widget.restoreGeometry(geometry)
                 return True
@@ -163,10 +175,9 @@ class UISettings:
     @property
     def theme(self) -> str:
         """Get UI theme name."""
-        return self._get_str("ui/theme", "system")
+        return self._r.get_str("ui/theme", "system")
 
     @theme.setter
     def theme(self, value: str) -> None:
         """Set UI theme name."""
-        self.settings.setValue("ui/theme", value)
-        self.settings.sync()
+        self._r.set("ui/theme", value)
@@ -3,8 +3,9 @@ Settings validation system for CDDA-maped.
 """
 
 import logging
+import os
 from pathlib import Path
-from typing import List, TYPE_CHECKING
+from typing import Dict, FrozenSet, List, Optional, TYPE_CHECKING
 
 from .types import ValidationResult
 
@@ -20,6 +21,32 @@ class SettingsValidator:
     def __init__(self, settings: "AppSettings"):
         self.settings = settings
 
+    @staticmethod
+    def _file_exists(
+        file_path: str, listings: Dict[Path, Optional[FrozenSet[str]]]
+    ) -> bool:
+        """Check a file through its parent's listing, one listdir per directory.
+
+        Args:
+            file_path: File to check
+            listings: Directory listings of the current validate() call,
+                filled on demand (None for directories that cannot be listed)
+        """
+        path = Path(file_path)
+        directory = path.parent
+        if directory not in listings:
+            try:
+                listings[directory] = frozenset(os.listdir(directory))
+            except OSError:
+                listings[directory] = None
+        names = listings[directory]
+        if names is not None and path.name in names:
+            return True
+        # A miss is not proof the file is gone: the name may differ in case,
+        # Unicode normalization (NFC vs NFD on macOS) or be a Windows short
+        # name, so ask the filesystem before dropping a recent file
+        return path.exists()
+
     def validate(self) -> ValidationResult:
         """Validate current configuration."""
         errors: List[str] = []
@@ -37,18 +64,18 @@ class SettingsValidator:
             warnings.append("CDDA path not set")
 
         # Validate recent files
-        recent_files = self.settings.recent_files
+        recent_files = self.settings.recent_files_tuple
         valid_recent: List[str] = []
+        listings: Dict[Path, Optional[FrozenSet[str]]] = {}
         for file_path in recent_files:
-            if Path(file_path).exists():
+            if self._file_exists(file_path, listings):
                 valid_recent.append(file_path)
             else:
                 warnings.append(f"Recent file no longer exists: {file_path}")
 
         # Clean up invalid recent files
         if len(valid_recent) != len(recent_files):
-            self.settings.settings.setValue("paths/recent_files", valid_recent)
-            self.settings.settings.sync()
+            self.settings.paths.recent_files = valid_recent
 
         return ValidationResult(
             is_valid=len(errors) == 0, errors=errors, warnings=warnings
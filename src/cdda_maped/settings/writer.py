@@ -0,0 +1,147 @@
+"""
+Background settings writer for CDDA-maped.
+
+Applies queued QSettings writes on a worker thread so the GUI thread never
+waits for registry/disk access.
+"""
+
+import atexit
+import logging
+import queue
+import threading
+import time
+from typing import Any, Optional, Tuple, Union
+
+from PySide6.QtCore import QSettings
+
+logger = logging.getLogger(__name__)
+
+# Maximum time a written value may stay unsynced on the writer thread
+_SYNC_INTERVAL_S = 1.0
+
+# How long stop() waits for the writer thread to finish its queue
+_STOP_TIMEOUT_S = 5.0
+
+
+class _Flush:
+    """Queue marker asking the writer to sync and signal completion."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+
+
+_QueueItem = Union[Tuple[str, Any], _Flush, None]
+
+
+class SettingsWriter:
+    """Serializes settings writes onto a single background thread.
+
+    The thread owns its own QSettings instance (QSettings objects must not be
+    shared between threads) for the same organization/application/profile,
+    applies writes in order and syncs them to storage in batches.
+    """
+
+    def __init__(self, organization: str, application: str, profile: str):
+        self._organization = organization
+        self._application = application
+        self._profile = profile
+        self._queue: "queue.Queue[_QueueItem]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+    def put(self, key: str, value: Any) -> None:
+        """Queue a value to be written; returns immediately."""
+        self._ensure_started()
+        self._queue.put_nowait((key, value))
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """Block until all queued writes are applied and synced.
+
+        Args:
+            timeout: Maximum seconds to wait, or None to wait indefinitely
+        """
+        thread = self._thread
+        if thread is None or not thread.is_alive():
+            return
+        marker = _Flush()
+        self._queue.put_nowait(marker)
+        if not marker.done.wait(timeout):
+            logger.warning("Timed out waiting for settings writer to flush")
+
+    def stop(self, timeout: Optional[float] = _STOP_TIMEOUT_S) -> None:
+        """Flush pending writes and stop the writer thread.
+
+        Args:
+            timeout: Maximum seconds to wait for the thread, or None to wait
+                indefinitely
+        """
+        thread = self._thread
+        if thread is None:
+            return
+        self._queue.put_nowait(None)
+        thread.join(timeout)
+        if thread.is_alive():
+            logger.warning("Timed out waiting for settings writer to stop")
+        self._thread = None
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="SettingsWriter", daemon=True
+                )
+                self._thread.start()
+                # atexit runs before daemon threads are killed, so queued
+                # writes still reach storage if nobody called stop()/flush()
+                atexit.register(self.stop)
+
+    def _run(self) -> None:
+        settings = QSettings(self._organization, self._application)
+        settings.beginGroup(self._profile)
+        # Monotonic time by which unsynced writes must be synced
+        deadline: Optional[float] = None
+
+        while True:
+            timeout = (
+                None if deadline is None else max(0.0, deadline - time.monotonic())
+            )
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                self._sync(settings)
+                deadline = None
+                continue
+
+            if item is None:
+                self._sync(settings)
+                return
+            if isinstance(item, _Flush):
+                self._sync(settings)
+                deadline = None
+                item.done.set()
+                continue
+
+            key, value = item
+            try:
+                settings.setValue(key, value)
+            except Exception:
+                # A bad value must not kill the thread: flush()/stop() wait on it
+                logger.exception(f"Failed to write setting {key}")
+                continue
+            now = time.monotonic()
+            if deadline is None:
+                deadline = now + _SYNC_INTERVAL_S
+            elif now >= deadline:
+                # Keep syncing periodically even under a steady stream of writes
+                self._sync(settings)
+                deadline = None
+
+    @staticmethod
+    def _sync(settings: QSettings) -> None:
+        """Sync settings to storage, logging instead of raising on failure."""
+        try:
+            settings.sync()
+        except Exception:
+            logger.exception("Failed to sync settings")
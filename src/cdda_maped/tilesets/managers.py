@@ -5,15 +5,66 @@ Provides indexing, lookup and bookkeeping for different components of the
 tileset system. No I/O or heavy logic beyond basic JSON reading.
 """
 
-from pathlib import Path
-from typing import Dict
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate
+import os
+from typing import Any, Dict, Iterable, Sequence
 from dataclasses import dataclass, field
 from PIL import Image
 import orjson
+import sys
 import threading
 
 from .models import Tileset, Sheet, FallbackSheet, Tile, TileSource, SheetInfo
 
+# tileset.txt keys -> Tileset attribute they set (None: the tile_info JSON name)
+_TILESET_TXT_KEYS: Dict[bytes, str | None] = {
+    b"NAME": "short_name",
+    b"VIEW": "view_name",
+    b"JSON": None,
+}
+
+
+def _mtime_ns(path: str) -> int | None:
+    """Return the file's modification time in ns, or None if it is missing."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+@lru_cache(maxsize=64)
+def _parse_tileset_txt(path: str, mtime_ns: int) -> tuple[tuple[str | None, str], ...]:
+    """Parse tileset.txt into (Tileset attribute, value) pairs in file order.
+
+    Cached per (path, mtime_ns), so re-registering an unchanged tileset
+    skips the read; an edited file gets a new key.
+    """
+    # Scan raw bytes and decode only the values of recognized keys
+    with open(path, "rb") as f:
+        data = f.read()
+    pairs: list[tuple[str | None, str]] = []
+    for line in data.split(b"\n"):
+        key, sep, value = line.partition(b":")
+        if sep and key in _TILESET_TXT_KEYS:
+            pairs.append(
+                (_TILESET_TXT_KEYS[key], value.strip().decode("utf-8", "replace"))
+            )
+    return tuple(pairs)
+
+
+def _parse_tile_info(path: str) -> dict[str, Any]:
+    """Parse tile_info.json.
+
+    Not cached: the tree is large, each tileset is read once per load, and
+    the loader hands tiles-new to the new Tileset and frees it afterwards.
+    """
+    with open(path, "rb") as f:
+        raw = f.read()
+    data = orjson.loads(raw) if raw else {}
+    return data if isinstance(data, dict) else {}
+
 
 class TilesetManager:
     """Manage tileset metadata discovered on disk.
@@ -23,6 +74,8 @@ class TilesetManager:
 
     def __init__(self):
         self.tilesets = dict[str, Tileset]()
+        # short_name -> first registered tileset with that name
+        self._by_short_name: dict[str, Tileset] = {}
 
     def add_tileset(self, ts_path: str) -> Tileset:
         """Add a tileset from the given directory path.
@@ -30,64 +83,64 @@ class TilesetManager:
         Reads tileset.txt and tile_info.json to populate basic metadata.
         Returns the `Tileset` instance registered in the manager.
         """
-        if not Path(ts_path).exists():
+        # Plain os.path string handling: this runs once per discovered tileset
+        # and needs no Path objects
+        if not os.path.exists(ts_path):
             raise FileNotFoundError(f"Tileset path not found: {ts_path}")
 
-        ts_dir = Path(ts_path)
-        ts_metadata = Tileset(folder_name=ts_dir.name)
+        ts_metadata = Tileset(folder_name=os.path.basename(os.path.normpath(ts_path)))
 
         # 1) Parse tileset.txt
         json_name = None
         try:
-            tileset_txt = ts_dir / "tileset.txt"
-            if tileset_txt.exists():
-                with open(tileset_txt, encoding="utf-8") as f:
-                    for line in f:
-                        if line.startswith("NAME:"):
-                            ts_metadata.short_name = line.partition(":")[2].strip()
-                        elif line.startswith("VIEW:"):
-                            ts_metadata.view_name = line.partition(":")[2].strip()
-                        elif line.startswith("JSON:"):
-                            json_name = line.partition(":")[2].strip()
+            txt_path = os.path.join(ts_path, "tileset.txt")
+            mtime_ns = _mtime_ns(txt_path)
+            if mtime_ns is not None:
+                for attr, value in _parse_tileset_txt(txt_path, mtime_ns):
+                    if attr is None:
+                        json_name = value
+                    else:
+                        setattr(ts_metadata, attr, value)
         except Exception as e:
             print(f"Error reading tileset.txt: {e}")
 
         # 2) Parse tile_info.json
         try:
-            if json_name:
-                json_path = ts_dir / json_name
-            else:
-                json_path = ts_dir / "tile_info.json"
-            if json_path.exists():
-                with open(json_path, "rb") as f:
-                    data = orjson.loads(f.read())
-                    tile_info = data.get("tile_info", [{}])[0]
-                    ts_metadata.pixelscale = tile_info.get(
-                        "pixelscale", ts_metadata.pixelscale
-                    )
-                    ts_metadata.grid_width = tile_info.get(
-                        "width", ts_metadata.grid_width
-                    )
-                    ts_metadata.grid_height = tile_info.get(
-                        "height", ts_metadata.grid_height
-                    )
-                    ts_metadata.grid_z_height = tile_info.get(
-                        "zlevel_height", ts_metadata.grid_z_height
-                    )
-                    ts_metadata.is_iso = tile_info.get("iso", ts_metadata.is_iso)
-                    ts_metadata.retract_dist_min = tile_info.get(
-                        "retract_dist_min", ts_metadata.retract_dist_min
-                    )
-                    ts_metadata.retract_dist_max = tile_info.get(
-                        "retract_dist_max", ts_metadata.retract_dist_max
-                    )
-                    # Store parsed tiles_new list directly (no re-serialization)
-                    tiles_new = data.get("tiles-new", [])
-                    ts_metadata.objects_source = tiles_new
+            json_path = os.path.join(ts_path, json_name or "tile_info.json")
+            data = _parse_tile_info(json_path) if os.path.isfile(json_path) else {}
+            if data:
+                tile_info: dict[str, Any] = (data.get("tile_info") or ({},))[0]
+                get = tile_info.get
+                ts_metadata.pixelscale = get("pixelscale", ts_metadata.pixelscale)
+                ts_metadata.grid_width = get("width", ts_metadata.grid_width)
+                ts_metadata.grid_height = get("height", ts_metadata.grid_height)
+                ts_metadata.grid_z_height = get(
+                    "zlevel_height", ts_metadata.grid_z_height
+                )
+                ts_metadata.is_iso = get("iso", ts_metadata.is_iso)
+                ts_metadata.retract_dist_min = get(
+                    "retract_dist_min", ts_metadata.retract_dist_min
+                )
+                ts_metadata.retract_dist_max = get(
+                    "retract_dist_max", ts_metadata.retract_dist_max
+                )
+                # Store parsed tiles_new list directly (no re-serialization)
+                ts_metadata.objects_source = data.get("tiles-new") or []
         except Exception as e:
             print(f"Error reading tile_info.json: {e}")
 
+        previous = self.tilesets.get(ts_metadata.folder_name)
         self.tilesets[ts_metadata.folder_name] = ts_metadata
+        if previous is not None and (
+            self._by_short_name.get(previous.short_name) is previous
+        ):
+            # Re-added folder was indexed under its old name; rebuild so the
+            # first tileset in registration order still wins
+            self._by_short_name = {}
+            for tileset in self.tilesets.values():
+                self._by_short_name.setdefault(tileset.short_name, tileset)
+        else:
+            self._by_short_name.setdefault(ts_metadata.short_name, ts_metadata)
         return ts_metadata
 
     def get_tileset(self, folder_name: str) -> Tileset | None:
@@ -97,13 +150,26 @@ class TilesetManager:
     def get_tileset_by_short_name(self, short_name: str) -> Tileset | None:
         """Return tileset by short_name if present.
 
-        Searches through all tilesets to find one with matching short_name.
+        If several tilesets share a short_name, the first one registered wins.
         Returns None if not found.
         """
-        for tileset in self.tilesets.values():
-            if tileset.short_name == short_name:
-                return tileset
-        return None
+        return self._by_short_name.get(short_name)
+
+
+# Separator between a tile id and its season in seasonal variant ids
+_SEASON_MARKER = "_season_"
+# Prebuilt seasonal id suffixes for the four CDDA seasons
+_SEASON_SUFFIXES = {
+    season: f"{_SEASON_MARKER}{season}"
+    for season in ("spring", "summer", "autumn", "winter")
+}
+
+# Shared default for per-tileset lookups on render paths, so a miss does not
+# build a throwaway dict; never mutate it
+_EMPTY: Dict[str, Any] = {}
+
+# Upper bound on memoized tile lookups before the memo is reset
+_LOOKUP_CACHE_MAX_ENTRIES = 65536
 
 
 @dataclass
@@ -113,6 +179,9 @@ class TilesManager:
     Two-level indices are maintained:
     - tilesets[tileset][id] -> Tile (last-wins override behavior)
     - tilesets_by_mod[tileset][mod_id][id] -> Tile (for precise origin lookups)
+
+    Point lookups go through flat tuple-keyed mirrors of both indices, which
+    take a single dict probe; the nested ones serve per-tileset iteration.
     """
 
     # tileset_name -> id -> tile
@@ -122,42 +191,74 @@ class TilesManager:
         default_factory=lambda: {}
     )
 
-    def __post_init__(self):
-        self.tilesets = {}
-        self.tilesets_by_mod = {}
+    # (tileset_name, id) -> tile; flat mirror of `tilesets`
+    _flat: Dict[tuple[str, str], Tile] = field(
+        default_factory=lambda: {}, init=False, repr=False
+    )
+    # (tileset_name, mod_id, id) -> tile; flat mirror of `tilesets_by_mod`
+    _flat_by_mod: Dict[tuple[str, str, str], Tile] = field(
+        default_factory=lambda: {}, init=False, repr=False
+    )
+
+    # tileset_name -> ids that have at least one "<id>_season_<season>" variant
+    seasonal_ids: Dict[str, set[str]] = field(default_factory=lambda: {})
+    # (tileset, id, season, preferred mods) -> result of
+    # get_tile_with_season_and_priority; cleared whenever a tile is added
+    _lookup_cache: Dict[tuple[str, str, str, tuple[str, ...]], Tile | None] = field(
+        default_factory=lambda: {}, init=False, repr=False
+    )
 
     def add_tile(self, tileset: str, tile_obj: Tile):
         """Add a tile to indices, honoring mod priority (last-wins)."""
-        if tileset not in self.tilesets:
-            self.tilesets[tileset] = {}
-        if tileset not in self.tilesets_by_mod:
-            self.tilesets_by_mod[tileset] = {}
-        if tile_obj.mod_id not in self.tilesets_by_mod[tileset]:
-            self.tilesets_by_mod[tileset][tile_obj.mod_id] = {}
+        # Tile and mod ids repeat across tiles and mods: share one string object
+        # per id so index keys take no extra memory and compare by identity
+        tileid = tile_obj.tileid = sys.intern(tile_obj.tileid)
+        mod_id = tile_obj.mod_id = sys.intern(tile_obj.mod_id)
+        tileset = sys.intern(tileset)
+        if self._lookup_cache:
+            self._lookup_cache.clear()
 
         # Основной индекс - последний тайл с таким ID побеждает (приоритет модов)
-        self.tilesets[tileset][tile_obj.tileid] = tile_obj
+        self.tilesets.setdefault(tileset, {})[tileid] = tile_obj
         # Индекс по модам - для точного поиска
-        self.tilesets_by_mod[tileset][tile_obj.mod_id][tile_obj.tileid] = tile_obj
+        by_mod = self.tilesets_by_mod.setdefault(tileset, {})
+        by_mod.setdefault(mod_id, {})[tileid] = tile_obj
+        self._flat[(tileset, tileid)] = tile_obj
+        self._flat_by_mod[(tileset, mod_id, tileid)] = tile_obj
+
+        base_id, sep, _ = tileid.rpartition(_SEASON_MARKER)
+        if sep:
+            self.seasonal_ids.setdefault(tileset, set()).add(base_id)
+
+    def _seasonal_id(self, tileset: str, tileid: str, season: str) -> str | None:
+        """Id of the tile's seasonal variant, or None if it has none."""
+        if tileid not in self.seasonal_ids.get(tileset, ()):
+            return None
+        suffix = _SEASON_SUFFIXES.get(season)
+        if suffix is None:
+            return f"{tileid}{_SEASON_MARKER}{season}"
+        return tileid + suffix
 
     def get_tile(self, tileset: str, tileid: str) -> Tile | None:
         """Get a tile by id within a tileset, if present."""
-        return self.tilesets.get(tileset, {}).get(tileid)
+        return self._flat.get((tileset, tileid))
 
     def get_tile_from_mod(self, tileset: str, mod_id: str, tileid: str) -> Tile | None:
         """Get a tile from a specific mod."""
-        return self.tilesets_by_mod.get(tileset, {}).get(mod_id, {}).get(tileid)
+        return self._flat_by_mod.get((tileset, mod_id, tileid))
 
     def get_tile_with_priority(
-        self, tileset: str, tileid: str, preferred_mods: list[str] | None = None
+        self, tileset: str, tileid: str, preferred_mods: Sequence[str] | None = None
     ) -> Tile | None:
         """Get a tile honoring a preferred mod order, falling back to default."""
+        # Inlined lookups: this runs for every rendered cell
         if preferred_mods:
+            get_from_mod = self._flat_by_mod.get
             for mod_id in preferred_mods:
-                tile_obj = self.get_tile_from_mod(tileset, mod_id, tileid)
+                tile_obj = get_from_mod((tileset, mod_id, tileid))
                 if tile_obj:
                     return tile_obj
-        return self.get_tile(tileset, tileid)
+        return self._flat.get((tileset, tileid))
 
     def get_available_mods(self, tileset: str) -> list[str]:
         """List mods that contribute tiles to the given tileset."""
@@ -173,10 +274,11 @@ class TilesManager:
     ) -> Tile | None:
         """Get a tile with seasonal support, trying seasonal variant first."""
         # First try seasonal variant: {tileid}_season_{season}
-        seasonal_id = f"{tileid}_season_{season}"
-        seasonal_tile = self.get_tile(tileset, seasonal_id)
-        if seasonal_tile:
-            return seasonal_tile
+        seasonal_id = self._seasonal_id(tileset, tileid, season)
+        if seasonal_id is not None:
+            seasonal_tile = self.get_tile(tileset, seasonal_id)
+            if seasonal_tile:
+                return seasonal_tile
 
         # Fall back to base tile (for objects that don't change with seasons)
         return self.get_tile(tileset, tileid)
@@ -186,22 +288,53 @@ class TilesManager:
         tileset: str,
         tileid: str,
         season: str = "spring",
-        preferred_mods: list[str] | None = None,
+        preferred_mods: Sequence[str] | None = None,
     ) -> Tile | None:
-        """Get a tile with both seasonal and mod priority support."""
-        seasonal_id = f"{tileid}_season_{season}"
+        """Get a tile with both seasonal and mod priority support.
 
-        # First try seasonal variant with mod priority
-        if preferred_mods:
-            for mod_id in preferred_mods:
-                seasonal_tile = self.get_tile_from_mod(tileset, mod_id, seasonal_id)
-                if seasonal_tile:
-                    return seasonal_tile
+        Results are memoized until the next add_tile(). Callers on hot paths
+        should pass the same preferred_mods tuple every time (e.g.
+        AppSettings.active_mods_tuple): it is then used in the cache key as is.
+        """
+        mods = (
+            preferred_mods
+            if type(preferred_mods) is tuple
+            else tuple(preferred_mods or ())
+        )
+        key = (tileset, tileid, season, mods)
+        cache = self._lookup_cache
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+        if len(cache) >= _LOOKUP_CACHE_MAX_ENTRIES:
+            cache.clear()
+        result = cache[key] = self._find_tile_with_season_and_priority(
+            tileset, tileid, season, preferred_mods
+        )
+        return result
 
-        # Try base seasonal tile
-        seasonal_tile = self.get_tile(tileset, seasonal_id)
-        if seasonal_tile:
-            return seasonal_tile
+    def _find_tile_with_season_and_priority(
+        self,
+        tileset: str,
+        tileid: str,
+        season: str,
+        preferred_mods: Sequence[str] | None,
+    ) -> Tile | None:
+        """Uncached lookup behind get_tile_with_season_and_priority()."""
+        seasonal_id = self._seasonal_id(tileset, tileid, season)
+        if seasonal_id is not None:
+            # First try seasonal variant with mod priority
+            if preferred_mods:
+                for mod_id in preferred_mods:
+                    seasonal_tile = self.get_tile_from_mod(tileset, mod_id, seasonal_id)
+                    if seasonal_tile:
+                        return seasonal_tile
+
+            # Try base seasonal tile
+            seasonal_tile = self.get_tile(tileset, seasonal_id)
+            if seasonal_tile:
+                return seasonal_tile
 
         # Fall back to base tile with mod priority
         return self.get_tile_with_priority(tileset, tileid, preferred_mods)
@@ -215,10 +348,23 @@ class SheetManager:
         self.sheets: dict[str, dict[str, Sheet]] = {}
         # tileset_name -> mod_id -> [sheet_ids] (for mod-scoped lookups)
         self.sheets_by_mod: dict[str, dict[str, list[str]]] = {}
-        # Global sprite index: tileset_name -> global_index -> (sheet_id, local_index)
-        self.global_sprite_index: dict[str, dict[int, tuple[str, int]]] = {}
-        # Thread safety lock
-        self._lock = threading.Lock()
+        # Global sprite index: tileset_name -> (sheets in load order, running
+        # sprite totals); a global index falls in the first sheet whose total
+        # exceeds it. Holding the Sheet objects saves a sheet_id lookup per
+        # sprite fetch; finalize_tileset() rebuilds it after sheets change
+        self.global_sprite_index: dict[str, tuple[list[Sheet], list[int]]] = {}
+        # tileset_name -> sheet_id -> SheetInfo, built once per added sheet
+        self._sheet_infos: dict[str, dict[str, SheetInfo]] = {}
+        # tileset_name -> mod_id -> (mod sheets in order, set of their ids,
+        # running maximum of their sprite counts); built lazily per mod and
+        # dropped when the mod gains a sheet
+        self._mod_sprite_index: dict[
+            str, dict[str, tuple[list[Sheet], set[str], list[int]]]
+        ] = {}
+        # Per-tileset locks, so unrelated tilesets finalize concurrently
+        self._locks: dict[str, threading.Lock] = {}
+        # Guards creation of entries in _locks
+        self._locks_guard = threading.Lock()
 
     def add_sheet(self, tileset_name: str, sheet: Sheet):
         """Register a sheet, update mod index. Note: global sprite index rebuild is deferred.
@@ -228,54 +374,111 @@ class SheetManager:
         if tileset_name not in self.sheets:
             self.sheets[tileset_name] = {}
             self.sheets_by_mod[tileset_name] = {}
-            self.global_sprite_index[tileset_name] = {}
+            self.global_sprite_index[tileset_name] = ([], [])
 
         # Добавляем лист
+        replaced = sheet.sheet_id in self.sheets[tileset_name]
         self.sheets[tileset_name][sheet.sheet_id] = sheet
+        # Sprites are cut when the Sheet is constructed, so the info is final
+        self._sheet_infos.setdefault(tileset_name, {})[sheet.sheet_id] = SheetInfo(
+            name=sheet.name,
+            file=sheet.file,
+            sprite_width=sheet.sprite_width,
+            sprite_height=sheet.sprite_height,
+            mod_id=sheet.mod_id,
+            sprite_count=sheet.sprite_count,
+            sprite_offset_x=getattr(sheet, "sprite_offset_x", 0),
+            sprite_offset_y=getattr(sheet, "sprite_offset_y", 0),
+            sprite_offset_x_retracted=getattr(sheet, "sprite_offset_x_retracted", 0),
+            sprite_offset_y_retracted=getattr(sheet, "sprite_offset_y_retracted", 0),
+            pixelscale=getattr(sheet, "pixelscale", 1),
+        )
 
         # Index by mod
         if sheet.mod_id not in self.sheets_by_mod[tileset_name]:
             self.sheets_by_mod[tileset_name][sheet.mod_id] = []
         self.sheets_by_mod[tileset_name][sheet.mod_id].append(sheet.sheet_id)
+        if replaced:
+            # Other mods' indices may hold the sheet this one replaced
+            self._mod_sprite_index.pop(tileset_name, None)
+        else:
+            self._mod_sprite_index.get(tileset_name, {}).pop(sheet.mod_id, None)
 
     def finalize_tileset(self, tileset_name: str):
         """Rebuild global sprite index after all sheets are loaded.
 
         Call this once after loading all sheets for a tileset to avoid O(n²) complexity.
         """
-        with self._lock:
+        with self._tileset_lock(tileset_name):
             self._update_global_sprite_index(tileset_name)
 
+    def _tileset_lock(self, tileset_name: str) -> threading.Lock:
+        """Return the lock for a tileset, creating it on first use."""
+        lock = self._locks.get(tileset_name)
+        if lock is None:
+            with self._locks_guard:
+                lock = self._locks.setdefault(tileset_name, threading.Lock())
+        return lock
+
     def _update_global_sprite_index(self, tileset_name: str):
-        """Recompute mapping from global index to (sheet_id, local_index)."""
-        global_index = 0
-        self.global_sprite_index[tileset_name] = {}
-
-        for sheet_id, sheet in self.sheets[tileset_name].items():
-            for local_index in range(len(sheet.sprites)):
-                self.global_sprite_index[tileset_name][global_index] = (
-                    sheet_id,
-                    local_index,
-                )
-                global_index += 1
+        """Recompute the sheet order and running sprite totals for a tileset."""
+        sheets = list(self.sheets[tileset_name].values())
+        totals = list(accumulate(sheet.sprite_count for sheet in sheets))
+        self.global_sprite_index[tileset_name] = (sheets, totals)
 
     def get_sprite_by_global_index(
         self, tileset_name: str, global_index: int
     ) -> Image.Image | None:
         """Return sprite image by global index, or None if not found."""
-        if tileset_name not in self.global_sprite_index:
+        index = self.global_sprite_index.get(tileset_name)
+        if index is None or global_index < 0:
             return None
 
-        mapping = self.global_sprite_index[tileset_name].get(global_index)
-        if not mapping:
+        sheets, totals = index
+        # Empty sheets share their predecessor's total and are skipped
+        position = bisect_right(totals, global_index)
+        if position >= len(sheets):
             return None
 
-        sheet_id, local_index = mapping
-        sheet = self.sheets[tileset_name].get(sheet_id)
-        if not sheet:
-            return None
+        local_index = global_index - (totals[position - 1] if position else 0)
+        return sheets[position].get_sprite_by_index(local_index)
+
+    def get_global_sprite_count(self, tileset_name: str) -> int:
+        """Number of valid global sprite indices in a tileset (0 if unknown)."""
+        index = self.global_sprite_index.get(tileset_name)
+        if index is None or not index[1]:
+            return 0
+        return index[1][-1]
 
-        return sheet.get_sprite_by_index(local_index)
+    def get_sprites_by_global_indices(
+        self, tileset_name: str, global_indices: Iterable[int]
+    ) -> dict[int, Image.Image]:
+        """Resolve several global indices at once.
+
+        Looks up the tileset's index once for the whole batch.
+
+        Returns:
+            Mapping of global index to sprite image; indices that cannot be
+            resolved are left out
+        """
+        sprites: dict[int, Image.Image] = {}
+        index = self.global_sprite_index.get(tileset_name)
+        if index is None:
+            return sprites
+
+        sheets, totals = index
+        sheet_count = len(sheets)
+        for global_index in global_indices:
+            if global_index < 0:
+                continue
+            position = bisect_right(totals, global_index)
+            if position >= sheet_count:
+                continue
+            local_index = global_index - (totals[position - 1] if position else 0)
+            sprite = sheets[position].get_sprite_by_index(local_index)
+            if sprite is not None:
+                sprites[global_index] = sprite
+        return sprites
 
     def get_sprite_by_mod_index(
         self,
@@ -285,26 +488,95 @@ class SheetManager:
         sheet_hint: str | None = None,
     ) -> Image.Image | None:
         """Return sprite image by local index from mod sheet, or None if not found."""
-        # Получаем список листов для данного мода
-        mod_sheet_ids = self.get_sheets_from_mod(tileset_name, mod_id)
-        if not mod_sheet_ids:
+        index = self._get_mod_sprite_index(tileset_name, mod_id)
+        if index is None:
             # TODO: logging using logging module
             return None
+        mod_sheets, mod_sheet_ids, max_counts = index
 
         # Если подсказка по листу дана, попробуем её первой
         if sheet_hint and sheet_hint in mod_sheet_ids:
             sheet = self.sheets[tileset_name].get(sheet_hint)
-            if sheet and local_index < len(sheet.sprites):
-                return sheet.get_sprite_by_index(local_index)
-
-        # Иначе ищем по всем листам мода
-        for sheet_id in mod_sheet_ids:
-            sheet = self.sheets[tileset_name].get(sheet_id)
-            if sheet and local_index < len(sheet.sprites):
+            if sheet and local_index < sheet.sprite_count:
                 return sheet.get_sprite_by_index(local_index)
 
+        # Иначе берём первый лист мода, в котором достаточно спрайтов:
+        # это первый лист, где текущий максимум превышает индекс
+        position = bisect_right(max_counts, local_index)
+        if position < len(mod_sheets):
+            return mod_sheets[position].get_sprite_by_index(local_index)
         return None
 
+    def get_sprites_by_mod_indices(
+        self,
+        tileset_name: str,
+        mod_id: str,
+        local_indices: Iterable[int],
+        sheet_hint: str | None = None,
+    ) -> dict[int, Image.Image]:
+        """Resolve several mod-local indices at once.
+
+        Same rules as get_sprite_by_mod_index(), with the mod's index and the
+        hinted sheet looked up once for the whole batch.
+
+        Returns:
+            Mapping of local index to sprite image; indices that cannot be
+            resolved are left out
+        """
+        sprites: dict[int, Image.Image] = {}
+        index = self._get_mod_sprite_index(tileset_name, mod_id)
+        if index is None:
+            return sprites
+        mod_sheets, mod_sheet_ids, max_counts = index
+
+        hinted = None
+        if sheet_hint and sheet_hint in mod_sheet_ids:
+            hinted = self.sheets[tileset_name].get(sheet_hint)
+        hinted_count = hinted.sprite_count if hinted else 0
+        sheet_count = len(mod_sheets)
+        for local_index in local_indices:
+            if hinted is not None and local_index < hinted_count:
+                sprite = hinted.get_sprite_by_index(local_index)
+            else:
+                position = bisect_right(max_counts, local_index)
+                if position >= sheet_count:
+                    continue
+                sprite = mod_sheets[position].get_sprite_by_index(local_index)
+            if sprite is not None:
+                sprites[local_index] = sprite
+        return sprites
+
+    def get_mod_sprite_count(self, tileset_name: str, mod_id: str) -> int:
+        """Upper bound (exclusive) of resolvable mod-local sprite indices.
+
+        A local index resolves when some sheet of the mod is large enough,
+        i.e. when it is below the mod's largest sheet size.
+        """
+        index = self._get_mod_sprite_index(tileset_name, mod_id)
+        if index is None or not index[2]:
+            return 0
+        return index[2][-1]
+
+    def _get_mod_sprite_index(
+        self, tileset_name: str, mod_id: str
+    ) -> tuple[list[Sheet], set[str], list[int]] | None:
+        """Return (sheets, sheet ids, running max sprite count) for a mod."""
+        by_mod = self._mod_sprite_index.setdefault(tileset_name, {})
+        index = by_mod.get(mod_id)
+        if index is None:
+            mod_sheet_ids = self.get_sheets_from_mod(tileset_name, mod_id)
+            if not mod_sheet_ids:
+                return None
+            sheets = self.sheets[tileset_name]
+            mod_sheets = [
+                sheets[sheet_id] for sheet_id in mod_sheet_ids if sheet_id in sheets
+            ]
+            max_counts = list(
+                accumulate((sheet.sprite_count for sheet in mod_sheets), max)
+            )
+            index = by_mod[mod_id] = (mod_sheets, set(mod_sheet_ids), max_counts)
+        return index
+
     def get_sheet_info(self, tileset_name: str, sheet_id: str) -> SheetInfo | None:
         """Return lightweight info about a sheet.
 
@@ -313,31 +585,15 @@ class SheetManager:
             sheet_id: ID of the sheet
 
         Returns:
-            SheetInfo instance or None if not found
+            SheetInfo instance (shared; do not modify) or None if not found
         """
-        sheet = self.sheets.get(tileset_name, {}).get(sheet_id)
-        if not sheet:
-            return None
-
-        return SheetInfo(
-            name=sheet.name,
-            file=sheet.file,
-            sprite_width=sheet.sprite_width,
-            sprite_height=sheet.sprite_height,
-            mod_id=sheet.mod_id,
-            sprite_count=len(sheet.sprites),
-            sprite_offset_x=getattr(sheet, "sprite_offset_x", 0),
-            sprite_offset_y=getattr(sheet, "sprite_offset_y", 0),
-            sprite_offset_x_retracted=getattr(sheet, "sprite_offset_x_retracted", 0),
-            sprite_offset_y_retracted=getattr(sheet, "sprite_offset_y_retracted", 0),
-            pixelscale=getattr(sheet, "pixelscale", 1),
-        )
+        return self._sheet_infos.get(tileset_name, _EMPTY).get(sheet_id)
 
     def get_ascii(
         self, tileset_name: str, sheet_id: str, color: str, char: str
     ) -> Image.Image | None:
         """Get ASCII sprite from a fallback sheet if available."""
-        sheet = self.sheets.get(tileset_name, {}).get(sheet_id)
+        sheet = self.sheets.get(tileset_name, _EMPTY).get(sheet_id)
         if isinstance(sheet, FallbackSheet):
             return sheet.get_ascii_sprite(color, char)
         return None
@@ -5,10 +5,18 @@ Contains all dataclasses and type definitions used by the tileset system.
 Each model is intentionally lightweight: no file-system or service logic.
 """
 
+import logging
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Tuple, TypedDict, Sequence, cast
+from weakref import WeakValueDictionary
 from PIL import Image
 
+logger = logging.getLogger(__name__)
+
+# Decoded RGBA sheet images by file path. A mod sheet is registered once per
+# compatible tileset; all those Sheet objects share a single decode
+_decoded_images: "WeakValueDictionary[str, Image.Image]" = WeakValueDictionary()
+
 # =============================================================================
 # Tile Models
 # =============================================================================
@@ -135,13 +143,14 @@ class TileSource:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Tile:
     """Resolved tile bound to a concrete sprite sheet.
 
     sheet_id links the tile to a specific `Sheet`. mod_id identifies the
     source mod ("dda" for base game). When several mods override the same
     tile id, the priority resolution happens in the managers layer.
+    Slotted: a loaded tileset holds one instance per tile id.
     """
 
     tileid: str
@@ -150,12 +159,13 @@ class Tile:
     mod_id: str = "dda"  # ID мода, которому принадлежит этот тайл
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SheetInfo:
     """Lightweight information about a sprite sheet.
 
     Contains metadata needed for rendering without holding the full Sheet object.
-    Used as TileObject.style and returned from service methods.
+    Used as TileObject.style and returned from service methods. Instances are
+    shared between lookups, so they are immutable.
     """
 
     name: str = "unknown"
@@ -253,8 +263,11 @@ SpriteIndex = Dict[Tuple[str, str], Image.Image]  # (color, char) -> sprite
 class Sheet:
     """Sprite sheet.
 
-    The image is sliced immediately on construction (see `__post_init__`).
-    Offsets allow partial shifting of the grid inside the source image.
+    Construction only reads the image size to count the sprites. When
+    `image_path` is set the file is closed right away and decoded and sliced
+    on first sprite access (see `_load_pixels`); otherwise the given image
+    is sliced immediately. Offsets allow partial shifting of the grid inside
+    the source image.
     """
 
     name: str  # Уникальное имя листа
@@ -269,7 +282,11 @@ class Sheet:
     sprite_offset_y_retracted: int = 0
     pixelscale: int = 1
     tiles_source: List[Dict[str, Any]] = field(default_factory=lambda: [])
+    image_path: str = ""  # Файл для отложенной загрузки (пусто - сразу)
     sprites: List[Image.Image] = field(init=False, default_factory=lambda: [])
+    # Sprites in the grid, known from the image size before any decoding
+    sprite_count: int = field(init=False, default=0)
+    _pixels_loaded: bool = field(init=False, default=False, repr=False)
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Sheet":
@@ -305,11 +322,38 @@ class Sheet:
             sprite_offset_y_retracted=int(data.get("sprite_offset_y_retracted", 0)),
             pixelscale=int(data.get("pixelscale", 1)),
             tiles_source=tiles_source,
+            image_path=str(data.get("image_path", "")),
         )
 
     def __post_init__(self):
-        self.image = self.image.convert("RGBA")
-        self._precut_all()
+        if self.image:
+            img_width, img_height = self.image.size
+            self.sprite_count = (img_width // self.sprite_width) * (
+                img_height // self.sprite_height
+            )
+        if self.image_path:
+            # Only the header has been read; release the file until needed
+            self.image.close()
+        else:
+            self._load_pixels()
+
+    def _load_pixels(self):
+        """Decode the sheet image and slice it into sprites."""
+        try:
+            if self.image_path:
+                image = _decoded_images.get(self.image_path)
+                if image is None:
+                    with Image.open(self.image_path) as raw_image:
+                        image = raw_image.convert("RGBA")
+                    _decoded_images[self.image_path] = image
+                self.image = image
+            elif self.image:
+                self.image = self.image.convert("RGBA")
+            self._precut_all()
+        except OSError as e:
+            logger.error(f"Failed to decode sheet image {self.file}: {e}")
+            self.sprites = []
+        self._pixels_loaded = True
 
     def _precut_all(self):
         """Slice the sheet image into individual sprites.
@@ -321,8 +365,9 @@ class Sheet:
         They are used only for positioning sprites on viewport during rendering.
         This prevents double-offset issues where sprites get offset twice.
         """
-        self.sprites = []
+        sprites: List[Image.Image] = []
         if not self.image:
+            self.sprites = sprites
             return
 
         img_width, img_height = self.image.size
@@ -338,7 +383,9 @@ class Sheet:
                 bottom = top + self.sprite_height
 
                 sprite = self.image.crop((left, top, right, bottom))
-                self.sprites.append(sprite)
+                sprites.append(sprite)
+        # Publish the full list at once; readers never see a partial one
+        self.sprites = sprites
 
     @property
     def sheet_id(self) -> str:
@@ -351,7 +398,11 @@ class Sheet:
 
     def get_sprite_by_index(self, index: int) -> Image.Image | None:
         """Return sprite by local index or None if out of range."""
-        if 0 <= index < len(self.sprites):
+        if not 0 <= index < self.sprite_count:
+            return None
+        if not self._pixels_loaded:
+            self._load_pixels()
+        if index < len(self.sprites):
             return self.sprites[index]
         return None
 
@@ -483,7 +534,8 @@ class Tileset:
 
     Mirrors fields found in upstream Cataclysm tileset definition files.
     `objects_source` keeps the parsed tiles-new list (already extracted
-    from tile_info.json) for direct use without re-parsing.
+    from tile_info.json) for direct use without re-parsing. The loader
+    empties it once the sheets have been built from it.
     """
 
     short_name: str = "not found"
@@ -13,8 +13,11 @@ Responsibilities:
 
 import orjson
 import logging
+import os
+import time
+from itertools import chain
 from pathlib import Path
-from typing import cast, Any, Optional, TYPE_CHECKING
+from typing import cast, Any, Optional, Sequence, TYPE_CHECKING
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from PIL import Image
 from dataclasses import fields
@@ -26,28 +29,133 @@ from .managers import TilesetManager, SheetManager, TilesManager, Sheet, Fallbac
 if TYPE_CHECKING:
     from ..settings import AppSettings
 
+# On-disk cache of mod_tileset objects per mod JSON file (under cache_dir)
+_MOD_SCAN_CACHE_FILE = "mod_tilesets.json"
+# Bump when the cache layout changes; other versions are ignored
+_MOD_SCAN_CACHE_VERSION = 1
+# (mtime_ns, size, mod_tileset objects) recorded for one mod JSON file
+_ModScanEntry = tuple[int, int, list[dict[str, Any]]]
+
+# File name (and sheet id) of a tileset's ASCII fallback sheet
+_FALLBACK_SHEET = "fallback.png"
+
+# Files whose presence marks a directory under gfx as a tileset
+_TILESET_MARKER_FILES = frozenset(("tileset.txt", "tile_config.json"))
+
+# Minimum time between Qt event-loop passes while tilesets are loading
+_EVENT_PUMP_INTERVAL_S = 0.05
+
+# Upper bound on memoized TileObjects before the memo is reset
+_RESOLVED_OBJECTS_MAX_ENTRIES = 65536
+
+# JSON keys that map onto TileSource fields; anything else is dropped
+_TILE_SOURCE_FIELDS = frozenset(f.name for f in fields(TileSource))
+
+
+def _extend_sprite_indices(
+    value: int | list[int] | list[WeightedSprite] | WeightedSprite | None,
+    out: list[int],
+) -> None:
+    """Append the sprite indices referenced by an fg/bg value to `out`."""
+    if value is None:
+        return
+    if isinstance(value, int):
+        out.append(value)
+    elif isinstance(value, list):
+        if not value:
+            return
+        if isinstance(value[0], int):
+            out.extend(cast(list[int], value))
+        else:
+            for ws in cast(list[WeightedSprite], value):
+                if isinstance(ws.sprite, int):
+                    out.append(ws.sprite)
+                else:
+                    out.extend(ws.sprite)
+    elif isinstance(value.sprite, int):
+        out.append(value.sprite)
+    else:
+        out.extend(value.sprite)
+
 
 class TilesetService:
     """Facade for tileset operations.
 
     Instantiate with path to a CDDA game directory. Immediately triggers
-    scanning and registration of base tilesets and mods.
+    scanning and registration of base tilesets and mods. With `cache_dir`
+    set, the `mod_tileset` objects found in mod JSON files are kept on disk
+    and reused for files whose modification time and size are unchanged.
     """
 
-    def __init__(self, game_path: str, settings: Optional["AppSettings"] = None):
+    def __init__(
+        self,
+        game_path: str,
+        settings: Optional["AppSettings"] = None,
+        cache_dir: Optional[str] = None,
+    ):
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
         self.game_path = Path(game_path)
         self.settings = settings
+        self.cache_dir = Path(cache_dir) if cache_dir else None
 
         self.tilesets = TilesetManager()
         self.sheets = SheetManager()
         self.tiles = TilesManager()
+        # folder_name -> is_iso, recorded once when each tileset is discovered
+        self._iso_flags: dict[str, bool] = {}
+        # Registered tileset names and their is_iso split, rebuilt lazily
+        # after a registration
+        self._available_cache: tuple[str, ...] | None = None
+        self._by_iso: dict[bool, tuple[str, ...]] | None = None
+        # (tileset, object id, season, fallback color, fallback symbol) ->
+        # resolved TileObject, valid for the _resolved_for_mods mod order
+        self._resolved_objects: dict[tuple[str, str, str, str, str], TileObject] = {}
+        self._resolved_for_mods: tuple[str, ...] | None = None
+        # id(TileSource) -> (that TileSource, its sprite indices); the source
+        # is kept so its id cannot be reused by another object
+        self._sprite_indices_cache: dict[int, tuple[TileSource, tuple[int, ...]]] = {}
+        # tileset name -> tileset_has_real_sprites() result
+        self._has_real_sprites: dict[str, bool] = {}
+        # Qt application to keep responsive while loading (None without a GUI)
+        try:
+            from PySide6.QtWidgets import QApplication
+
+            self._qapp = QApplication.instance()
+        except ImportError:
+            self._qapp = None
+        self._next_event_pump = 0.0
+        # Mod JSON path -> (mtime_ns, size, mod_tileset objects), as stored on
+        # disk by the previous run and as collected by this one
+        self._mod_scan_cache: dict[str, _ModScanEntry] = {}
+        self._mod_scan_fresh: dict[str, _ModScanEntry] = {}
         self._init_tilesets()
 
+    def _pump_gui_events(self) -> None:
+        """Let a running Qt GUI handle pending events during loading.
+
+        Throttled to once per _EVENT_PUMP_INTERVAL_S, so fast loads do not
+        pay for an event-loop pass after every tileset or mod.
+        """
+        if self._qapp is None:
+            return
+        now = time.monotonic()
+        if now >= self._next_event_pump:
+            self._next_event_pump = now + _EVENT_PUMP_INTERVAL_S
+            self._qapp.processEvents()
+
     def _init_tilesets(self):
         """Initialize tileset loading (base + mods)."""
-        # Сначала загружаем базовые тайлсеты
-        self._load_base_tilesets()
+        # One pool for sheet image loads of every base tileset, instead of a
+        # fresh pool per tileset directory; released once loading is done
+        self._sheet_pool = ThreadPoolExecutor(
+            max_workers=min(16, (os.cpu_count() or 1) * 2),
+            thread_name_prefix="SheetLoader",
+        )
+        try:
+            # Сначала загружаем базовые тайлсеты
+            self._load_base_tilesets()
+        finally:
+            self._sheet_pool.shutdown()
         # Затем загружаем моды
         self._load_mod_tilesets()
 
@@ -65,9 +173,12 @@ class TilesetService:
         Returns:
             True if directory contains tileset files, False otherwise
         """
-        return (tileset_dir / "tileset.txt").exists() or (
-            tileset_dir / "tile_config.json"
-        ).exists()
+        # One directory read instead of a stat per candidate file
+        try:
+            with os.scandir(tileset_dir) as entries:
+                return any(entry.name in _TILESET_MARKER_FILES for entry in entries)
+        except OSError:
+            return False
 
     def _load_base_tilesets(self):
         """Load core tilesets from the `gfx` directory in parallel."""
@@ -76,7 +187,9 @@ class TilesetService:
             raise RuntimeError(f"Tilesets path is invalid: {gfx_path}")
 
         # Filter only valid tileset directories
-        all_dirs = [d for d in gfx_path.iterdir() if d.is_dir()]
+        # scandir entries cache is_dir() from the directory read
+        with os.scandir(gfx_path) as entries:
+            all_dirs = [Path(entry.path) for entry in entries if entry.is_dir()]
         tileset_dirs = [d for d in all_dirs if self._is_valid_tileset_dir(d)]
 
         skipped = len(all_dirs) - len(tileset_dirs)
@@ -102,15 +215,7 @@ class TilesetService:
                     self.logger.info(f"  base tileset: {ts_dir.name}")
                     # Обеспечиваем наличие default fallback для каждого тайлсета
                     self._ensure_default_fallback(ts_dir.name)
-                    # Try to process Qt events if available
-                    try:
-                        from PySide6.QtWidgets import QApplication
-
-                        app = QApplication.instance()
-                        if app:
-                            app.processEvents()
-                    except ImportError:
-                        pass
+                    self._pump_gui_events()
                 except Exception as e:
                     self.logger.error(f"Failed to load tileset {ts_dir.name}: {e}")
 
@@ -121,21 +226,81 @@ class TilesetService:
             self.logger.warning(f"Mods path not found: {mods_path}")
             return
 
-        mod_dirs = [d for d in mods_path.iterdir() if d.is_dir()]
+        with os.scandir(mods_path) as entries:
+            mod_dirs = [Path(entry.path) for entry in entries if entry.is_dir()]
         self.logger.debug(f"total {len(mod_dirs)} mod dirs found")
 
-        for _, mod_dir in enumerate(mod_dirs):
-            self.logger.debug(f"processing mod: {mod_dir.name}")
-            self._process_mod_dir(mod_dir)
-            # Try to process Qt events if available
-            try:
-                from PySide6.QtWidgets import QApplication
+        self._mod_scan_cache = self._load_mod_scan_cache()
+        # Walk the mods and then parse their JSON files on one pool, file by
+        # file, so a single large mod spreads over all workers. Registration
+        # stays sequential on this thread: map() yields in submission order,
+        # so mod overrides remain deterministic
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+            json_files_by_mod = list(executor.map(self._list_mod_json_files, mod_dirs))
+            parsed_files = executor.map(
+                self._read_mod_tilesets,
+                [
+                    json_file
+                    for json_files in json_files_by_mod
+                    for json_file in json_files
+                ],
+            )
+            for mod_dir, json_files in zip(mod_dirs, json_files_by_mod):
+                mod_tilesets = [obj for _ in json_files for obj in next(parsed_files)]
+                self.logger.debug(f"processing mod: {mod_dir.name}")
+                self._process_mod_dir(mod_dir, mod_tilesets)
+                self._pump_gui_events()
+        self._save_mod_scan_cache()
+        # Scan entries hold the parsed mod_tileset objects; they are only
+        # needed while loading
+        self._mod_scan_cache = {}
+        self._mod_scan_fresh = {}
+
+    def _load_mod_scan_cache(self) -> dict[str, _ModScanEntry]:
+        """Read the previous run's mod scan results, or {} if unavailable."""
+        if self.cache_dir is None:
+            return {}
+        cache_file = self.cache_dir / _MOD_SCAN_CACHE_FILE
+        try:
+            data = orjson.loads(cache_file.read_bytes())
+        except FileNotFoundError:
+            return {}
+        except (OSError, orjson.JSONDecodeError) as e:
+            self.logger.warning(f"Ignoring unreadable mod scan cache {cache_file}: {e}")
+            return {}
+        if not isinstance(data, dict) or data.get("version") != _MOD_SCAN_CACHE_VERSION:
+            return {}
+        files = data.get("files")
+        if not isinstance(files, dict):
+            return {}
+        return {
+            path: (entry[0], entry[1], entry[2])
+            for path, entry in cast(dict[str, Any], files).items()
+            if isinstance(entry, list) and len(cast(list[Any], entry)) == 3
+        }
 
-                app = QApplication.instance()
-                if app:
-                    app.processEvents()
-            except ImportError:
-                pass
+    def _save_mod_scan_cache(self) -> None:
+        """Store this run's mod scan results if they differ from the cache."""
+        if self.cache_dir is None:
+            return
+        fresh = self._mod_scan_fresh
+        old = self._mod_scan_cache
+        # Fresh entries equal to cached ones are reused objects; equal size
+        # then means the set of files is unchanged as well
+        if len(fresh) == len(old) and all(
+            old.get(path) is entry for path, entry in fresh.items()
+        ):
+            return
+        cache_file = self.cache_dir / _MOD_SCAN_CACHE_FILE
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix(".tmp")
+            tmp_file.write_bytes(
+                orjson.dumps({"version": _MOD_SCAN_CACHE_VERSION, "files": fresh})
+            )
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            self.logger.warning(f"Could not write mod scan cache {cache_file}: {e}")
 
     def _process_tileset_dir(self, ts_dir: Path, mod_id: str):
         """Process a base tileset directory and register all sheets.
@@ -147,29 +312,29 @@ class TilesetService:
         IMPORTANT: Preserves original sheet order for correct global sprite indexing.
         """
         tileset_info = self.tilesets.add_tileset(str(ts_dir))
+        self._iso_flags[tileset_info.folder_name] = tileset_info.is_iso
+        self._available_cache = None
+        self._by_iso = None
 
-        # Phase 1: Load all images in parallel, preserving order
+        # Phase 1: Load all images in parallel on the shared sheet pool
         loaded_sheets_with_index: list[tuple[int, Sheet, str, str]] = []
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            # Submit with index to preserve order
-            future_to_index = {
-                executor.submit(
-                    self._load_sheet_image, sheet_info, ts_dir, mod_id, tileset_info
-                ): idx
-                for idx, sheet_info in enumerate(tileset_info.objects_source)
-            }
+        # Submit with index to preserve order
+        future_to_index = {
+            self._sheet_pool.submit(
+                self._load_sheet_image, sheet_info, ts_dir, mod_id, tileset_info
+            ): idx
+            for idx, sheet_info in enumerate(tileset_info.objects_source)
+        }
 
-            # Collect all loaded sheets with their original indices
-            for future in as_completed(future_to_index):
-                idx = future_to_index[future]
-                try:
-                    sheet = future.result()
-                    if sheet:
-                        loaded_sheets_with_index.append(
-                            (idx, sheet, ts_dir.name, mod_id)
-                        )
-                except Exception as e:
-                    self.logger.error(f"Error loading sheet in {ts_dir.name}: {e}")
+        # Collect all loaded sheets with their original indices
+        for future in as_completed(future_to_index):
+            idx = future_to_index[future]
+            try:
+                sheet = future.result()
+                if sheet:
+                    loaded_sheets_with_index.append((idx, sheet, ts_dir.name, mod_id))
+            except Exception as e:
+                self.logger.error(f"Error loading sheet in {ts_dir.name}: {e}")
 
         # Sort by original index to preserve order
         loaded_sheets_with_index.sort(key=lambda x: x[0])
@@ -180,35 +345,88 @@ class TilesetService:
                 self._register_tiles_from_sheet(sheet, tileset_name, mod_id)
             self.sheets.add_sheet(tileset_name, sheet)
 
+        # Sheets are built and their tiles registered; together with the
+        # cleared Sheet.tiles_source this drops the last references to the
+        # parsed tiles-new tree
+        tileset_info.objects_source = []
+
         # Phase 3: Finalize tileset - rebuild global sprite index once
         self.sheets.finalize_tileset(ts_dir.name)
 
-    def _process_mod_dir(self, mod_dir: Path):
-        """Process a mod directory; scan JSON files for `mod_tileset` entries."""
+    @staticmethod
+    def _list_mod_json_files(mod_dir: Path) -> list[str]:
+        """Return paths of all JSON files under a mod directory, top-down."""
+        # Ищем все JSON файлы в моде (plain strings: no Path per entry)
+        return [
+            os.path.join(root, name)
+            for root, _, names in os.walk(mod_dir)
+            for name in names
+            if os.path.normcase(name).endswith(".json")
+        ]
+
+    def _read_mod_tilesets(self, json_file: str) -> list[dict[str, Any]]:
+        """Return the `mod_tileset` objects defined in one mod JSON file.
+
+        Only reads and parses; safe to run on a worker thread. Files whose
+        modification time and size match the mod scan cache are not read.
+        """
+        mod_tilesets: list[dict[str, Any]] = []
+        try:
+            stat = os.stat(json_file)
+            cached = self._mod_scan_cache.get(json_file)
+            if (
+                cached is not None
+                and cached[0] == stat.st_mtime_ns
+                and cached[1] == stat.st_size
+            ):
+                self._mod_scan_fresh[json_file] = cached
+                return cached[2]
+
+            with open(json_file, "rb") as f:
+                raw = f.read()
+            # Most mod JSON (items, recipes, ...) has no mod_tileset block;
+            # a bytes search is far cheaper than parsing it
+            if b'"mod_tileset"' not in raw:
+                self._mod_scan_fresh[json_file] = (
+                    stat.st_mtime_ns,
+                    stat.st_size,
+                    mod_tilesets,
+                )
+                return mod_tilesets
+            data = orjson.loads(raw)
+
+            # Single-object files are iterated as-is, without a wrapper list
+            objects: Sequence[Any] = (
+                cast(list[Any], data) if isinstance(data, list) else (data,)
+            )
+            for obj in objects:
+                if isinstance(obj, dict):
+                    obj_dict = cast(dict[str, Any], obj)
+                    if obj_dict.get("type") == "mod_tileset":
+                        mod_tilesets.append(obj_dict)
+            self._mod_scan_fresh[json_file] = (
+                stat.st_mtime_ns,
+                stat.st_size,
+                mod_tilesets,
+            )
+
+        except (orjson.JSONDecodeError, Exception) as e:
+            self.logger.warning(f"Error processing mod file {json_file}: {e}")
+        return mod_tilesets
+
+    def _process_mod_dir(self, mod_dir: Path, mod_tilesets: list[dict[str, Any]]):
+        """Register the `mod_tileset` objects read from a mod directory."""
         # Track unique messages to avoid duplicate logging
         not_found_tilesets: set[str] = set()
         loaded_mappings: set[tuple[str, str]] = set()  # (requested_name, actual_folder)
 
-        # Ищем все JSON файлы в моде
-        json_files = list(mod_dir.rglob("*.json"))
-        for json_file in json_files:
+        for obj_dict in mod_tilesets:
             try:
-                with json_file.open("rb") as f:
-                    data = orjson.loads(f.read())
-
-                objects: list[Any] = (
-                    cast(list[Any], data) if isinstance(data, list) else [data]
+                self._process_mod_tileset(
+                    obj_dict, mod_dir, not_found_tilesets, loaded_mappings
                 )
-                for obj in objects:
-                    if isinstance(obj, dict):
-                        obj_dict = cast(dict[str, Any], obj)
-                        if obj_dict.get("type") == "mod_tileset":
-                            self._process_mod_tileset(
-                                obj_dict, mod_dir, not_found_tilesets, loaded_mappings
-                            )
-
-            except (orjson.JSONDecodeError, Exception) as e:
-                self.logger.warning(f"Error processing mod file {json_file}: {e}")
+            except Exception as e:
+                self.logger.warning(f"Error processing mod tileset in {mod_dir}: {e}")
 
         # Log unique messages once per mod
         mod_id = mod_dir.name
@@ -334,6 +552,9 @@ class TilesetService:
             ),
             "pixelscale": int(sheet_info.get("pixelscale", tileset_info.pixelscale)),
             "tiles_source": list(sheet_info.get("tiles", [])),
+            # Regular sheets decode their pixels on first use; the fallback
+            # sheet indexes its glyphs right away
+            "image_path": "" if sheet_class is FallbackSheet else str(image_path),
         }
         return sheet_class.from_dict(sheet_data)
 
@@ -354,10 +575,8 @@ class TilesetService:
             sheet_id: Parent sheet identifier
             mod_id: Mod identifier
         """
-        tile_source_obj = source_obj.copy()
-        tile_source_obj["id"] = tile_id
-        allowed_keys = {f.name for f in fields(TileSource)}
-        filtered = {k: v for k, v in tile_source_obj.items() if k in allowed_keys}
+        filtered = {k: v for k, v in source_obj.items() if k in _TILE_SOURCE_FIELDS}
+        filtered["id"] = tile_id
         tile_source = TileSource.from_dict(filtered)
         tile_obj = Tile(
             tileid=str(tile_id), source=tile_source, sheet_id=sheet_id, mod_id=mod_id
@@ -388,6 +607,10 @@ class TilesetService:
                     tileset_name, source_obj_id, source_obj, sheet.sheet_id, mod_id
                 )
 
+        # Tiles keep their own TileSource copies; drop the raw JSON dicts so
+        # the parsed tiles-new tree can be freed
+        sheet.tiles_source = []
+
     def _load_sheet_image(
         self,
         sheet_info: dict[str, Any],
@@ -404,8 +627,8 @@ class TilesetService:
         if not sheet_file:
             return None
 
-        sheet_class = FallbackSheet if sheet_file == "fallback.png" else Sheet
-        is_fallback = sheet_class is FallbackSheet
+        is_fallback = sheet_file == _FALLBACK_SHEET
+        sheet_class = FallbackSheet if is_fallback else Sheet
 
         sheet_name = self._build_sheet_name(
             sheet_file, sheet_info, tileset_info, is_fallback
@@ -455,8 +678,8 @@ class TilesetService:
         if not sheet_file:
             return
 
-        sheet_class = FallbackSheet if sheet_file == "fallback.png" else Sheet
-        is_fallback = sheet_class is FallbackSheet
+        is_fallback = sheet_file == _FALLBACK_SHEET
+        sheet_class = FallbackSheet if is_fallback else Sheet
 
         sheet_name = self._build_sheet_name(
             sheet_file, sheet_info, tileset_info, is_fallback
@@ -488,52 +711,46 @@ class TilesetService:
                 f"Error processing sheet {sheet_file} from mod {mod_id}: {e}"
             )
 
-    def _collect_all_sprite_indices(self, ts: TileSource) -> list[int]:
+    def _collect_all_sprite_indices(self, ts: TileSource) -> tuple[int, ...]:
         """Collect all sprite indices referenced by a TileSource tree.
 
         Traverses fg, bg and nested additional_tiles, unfolding WeightedSprite
-        collections. Returns a flat list of integer indices.
+        collections. Returns a flat tuple of distinct integer indices,
+        memoized per TileSource object.
         """
-        result: list[int] = []
+        cached = self._sprite_indices_cache.get(id(ts))
+        if cached is not None and cached[0] is ts:
+            return cached[1]
 
-        def extract(
-            value: int | list[int] | list[WeightedSprite] | WeightedSprite | None,
-        ) -> None:
-            if value is None:
-                return
-            if isinstance(value, int):
-                result.append(value)
-            elif isinstance(value, list):
-                if not value:
-                    return
-                first = value[0]
-                if isinstance(first, int):
-                    result.extend(cast(list[int], value))
-                else:
-                    for ws in cast(list[WeightedSprite], value):
-                        if isinstance(ws.sprite, int):
-                            result.append(ws.sprite)
-                        else:
-                            result.extend(ws.sprite)
-            else:
-                ws = value
-                if isinstance(ws.sprite, int):
-                    result.append(ws.sprite)
-                else:
-                    result.extend(ws.sprite)
-
-        extract(ts.fg)
-        extract(ts.bg)
-
-        if ts.additional_tiles:
-            for subtile in ts.additional_tiles:
-                extract(subtile.fg)
-                extract(subtile.bg)
-                if subtile.additional_tiles:
-                    # recurse into deeper nested tiles
-                    result.extend(self._collect_all_sprite_indices(subtile))
-
-        return result
+        result: list[int] = []
+        # Iterative pre-order walk: same index order as a recursive descent
+        stack = [ts]
+        while stack:
+            node = stack.pop()
+            _extend_sprite_indices(node.fg, result)
+            _extend_sprite_indices(node.bg, result)
+            if node.additional_tiles:
+                stack.extend(reversed(node.additional_tiles))
+        # Callers key sprites by index, so each index is resolved only once
+        indices = tuple(dict.fromkeys(result))
+        self._sprite_indices_cache[id(ts)] = (ts, indices)
+        return indices
+
+    def _get_tile_sprites(
+        self, tileset_name: str, tile_obj: Tile
+    ) -> dict[int, Image.Image]:
+        """Resolve every sprite a tile references, keyed by its sprite index."""
+        sprite_indices = self._collect_all_sprite_indices(tile_obj.source)
+        # Различаем core и mod спрайты
+        if tile_obj.mod_id == "dda":
+            # Core спрайты - глобальные индексы
+            return self.sheets.get_sprites_by_global_indices(
+                tileset_name, sprite_indices
+            )
+        # Mod спрайты - локальные индексы в листах мода
+        return self.sheets.get_sprites_by_mod_indices(
+            tileset_name, tile_obj.mod_id, sprite_indices, tile_obj.sheet_id
+        )
 
     def _get_object_and_sprites(
         self,
@@ -551,30 +768,15 @@ class TilesetService:
         # Поиск по object_id с поддержкой сезонов
         tile_obj = self.tiles.get_tile_with_season(tileset_name, object_id, season)
         fb_sprite = self.sheets.get_ascii(
-            tileset_name, "fallback.png", fallback_color, fallback_symbol
+            tileset_name, _FALLBACK_SHEET, fallback_color, fallback_symbol
         )
 
         if tile_obj:
-            sprites_dict: dict[int, Image.Image] = {}
-            for sprite_index in self._collect_all_sprite_indices(tile_obj.source):
-                # Различаем core и mod спрайты
-                if tile_obj.mod_id == "dda":
-                    # Core спрайт - используем глобальный индекс
-                    sprite_image = self.sheets.get_sprite_by_global_index(
-                        tileset_name, sprite_index
-                    )
-                else:
-                    # Mod спрайт - используем локальный индекс в листе мода
-                    sprite_image = self.sheets.get_sprite_by_mod_index(
-                        tileset_name, tile_obj.mod_id, sprite_index, tile_obj.sheet_id
-                    )
-                if sprite_image:
-                    sprites_dict[sprite_index] = sprite_image
             return TileObject(
                 source=tile_obj.source,
                 style=self.sheets.get_sheet_info(tileset_name, tile_obj.sheet_id)
                 or SheetInfo(),
-                sprites=sprites_dict,
+                sprites=self._get_tile_sprites(tileset_name, tile_obj),
             )
         else:
             # Ensure fb_sprite is not None; if it is, create a blank image as fallback
@@ -582,16 +784,22 @@ class TilesetService:
                 fb_sprite = Image.new("RGBA", (32, 32), (0, 0, 0, 0))
             return TileObject(
                 source=TileSource(id=object_id, fg=-1),
-                style=self.sheets.get_sheet_info(tileset_name, "fallback.png")
+                style=self.sheets.get_sheet_info(tileset_name, _FALLBACK_SHEET)
                 or SheetInfo(),
                 sprites={-1: fb_sprite},
             )
 
     def get_available_mods(self, tileset_name: str) -> list[str]:
         """Return list of mods that contribute either sheets or tiles."""
-        sheet_mods = self.sheets.get_available_mods(tileset_name)
-        tile_mods = self.tiles.get_available_mods(tileset_name)
-        return list(set(sheet_mods + tile_mods))
+        # One pass, first-seen order (sheet mods first), no concatenated list
+        return list(
+            dict.fromkeys(
+                chain(
+                    self.sheets.get_available_mods(tileset_name),
+                    self.tiles.get_available_mods(tileset_name),
+                )
+            )
+        )
 
     def get_mod_statistics(self, tileset_name: str) -> dict[str, dict[str, int]]:
         """Return per-mod statistics: number of sheets and tiles."""
@@ -614,13 +822,9 @@ class TilesetService:
         """
         tile_obj = self.tiles.get_tile_from_mod(tileset_name, mod_id, object_id)
         if tile_obj:
-            sprites_dict: dict[int, Image.Image] = {}
-            for sprite_index in self._collect_all_sprite_indices(tile_obj.source):
-                sprite_image = self.sheets.get_sprite_by_global_index(
-                    tileset_name, sprite_index
-                )
-                if sprite_image:
-                    sprites_dict[sprite_index] = sprite_image
+            sprites_dict = self.sheets.get_sprites_by_global_indices(
+                tileset_name, self._collect_all_sprite_indices(tile_obj.source)
+            )
             return TileObject(
                 source=tile_obj.source,
                 style=self.sheets.get_sheet_info(tileset_name, tile_obj.sheet_id)
@@ -650,43 +854,59 @@ class TilesetService:
             season: Season variant to use (default: "spring")
         """
         # Get preferred_mods from settings
-        preferred_mods = self.settings.active_mods if self.settings else None
+        preferred_mods = self.settings.active_mods_tuple if self.settings else None
+
+        # Results are reused until the active mod list changes (settings hand
+        # out a new tuple then); everything else is fixed after loading
+        resolved = self._resolved_objects
+        if preferred_mods is not self._resolved_for_mods:
+            resolved.clear()
+            self._resolved_for_mods = preferred_mods
+        key = (tileset_name, object_id, season, fallback_color, fallback_symbol)
+        tile_object = resolved.get(key)
+        if tile_object is None:
+            if len(resolved) >= _RESOLVED_OBJECTS_MAX_ENTRIES:
+                resolved.clear()
+            tile_object = resolved[key] = self._resolve_object_and_sprites(
+                tileset_name,
+                object_id,
+                fallback_color,
+                fallback_symbol,
+                season,
+                preferred_mods,
+            )
+        return tile_object
 
+    def _resolve_object_and_sprites(
+        self,
+        tileset_name: str,
+        object_id: str,
+        fallback_color: str,
+        fallback_symbol: str,
+        season: str,
+        preferred_mods: tuple[str, ...] | None,
+    ) -> TileObject:
+        """Uncached lookup behind get_object_and_sprites_with_priority()."""
         tile_obj = self.tiles.get_tile_with_season_and_priority(
             tileset_name, object_id, season, preferred_mods
         )
         fb_sprite = self.sheets.get_ascii(
-            tileset_name, "fallback.png", fallback_color, fallback_symbol
+            tileset_name, _FALLBACK_SHEET, fallback_color, fallback_symbol
         )
 
         if tile_obj:
-            sprites_dict: dict[int, Image.Image] = {}
-            for sprite_index in self._collect_all_sprite_indices(tile_obj.source):
-                # Различаем core и mod спрайты
-                if tile_obj.mod_id == "dda":
-                    # Core спрайт - используем глобальный индекс
-                    sprite_image = self.sheets.get_sprite_by_global_index(
-                        tileset_name, sprite_index
-                    )
-                else:
-                    # Mod спрайт - используем локальный индекс в листе мода
-                    sprite_image = self.sheets.get_sprite_by_mod_index(
-                        tileset_name, tile_obj.mod_id, sprite_index, tile_obj.sheet_id
-                    )
-                if sprite_image:
-                    sprites_dict[sprite_index] = sprite_image
             return TileObject(
                 source=tile_obj.source,
                 style=self.sheets.get_sheet_info(tileset_name, tile_obj.sheet_id)
                 or SheetInfo(),
-                sprites=sprites_dict,
+                sprites=self._get_tile_sprites(tileset_name, tile_obj),
             )
         else:
             if fb_sprite is None:
                 fb_sprite = Image.new("RGBA", (32, 32), (0, 0, 0, 0))
             return TileObject(
                 source=TileSource(id=object_id, fg=-1),
-                style=self.sheets.get_sheet_info(tileset_name, "fallback.png")
+                style=self.sheets.get_sheet_info(tileset_name, _FALLBACK_SHEET)
                 or SheetInfo(),
                 sprites={-1: fb_sprite},
             )
@@ -694,7 +914,7 @@ class TilesetService:
     def _ensure_default_fallback(self, tileset_name: str):
         """Inject a default fallback sheet when tileset lacks `fallback.png`."""
         # Проверяем, есть ли уже fallback.png лист
-        if self.sheets.get_sheet_info(tileset_name, "fallback.png"):
+        if self.sheets.get_sheet_info(tileset_name, _FALLBACK_SHEET):
             return  # Уже есть собственный fallback
 
         # Получаем путь к default_fallback.png через importlib.resources
@@ -721,7 +941,7 @@ class TilesetService:
         try:
             # Create fallback sheet instance
             fallback_kwargs: dict[str, Any] = {
-                "name": "fallback.png",  # Имя должно быть fallback.png для правильного sheet_id
+                "name": _FALLBACK_SHEET,  # Имя должно быть fallback.png для правильного sheet_id
                 "file": "default_fallback.png",
                 "image": Image.open(default_fallback_path),
                 "sprite_width": 32,  # Обычный размер для fallback
@@ -760,7 +980,7 @@ class TilesetService:
         Returns:
             Name of a suitable tileset (guaranteed to exist)
         """
-        available = self.get_available_tilesets()
+        available = self._available_tileset_names()
         if not available:
             raise ValueError("No tilesets available")
 
@@ -769,17 +989,41 @@ class TilesetService:
             return preferred_name
 
         # Try to find a tileset of the preferred type (iso/ortho)
-        for tileset_name in available:
-            tileset = self.get_tileset(tileset_name)
-            if tileset.is_iso == is_iso:
-                return tileset_name
+        candidates = self._tilesets_by_iso()[is_iso]
+        if candidates:
+            return candidates[0]
 
         # Fallback to first available
         return available[0]
 
     def get_available_tilesets(self) -> list[str]:
         """Get list of available tileset names."""
-        return list(self.tilesets.tilesets.keys())
+        return list(self._available_tileset_names())
+
+    def _available_tileset_names(self) -> tuple[str, ...]:
+        """Get cached tuple of registered tileset names."""
+        if self._available_cache is None:
+            self._available_cache = tuple(self.tilesets.tilesets)
+        return self._available_cache
+
+    def _tilesets_by_iso(self) -> dict[bool, tuple[str, ...]]:
+        """Get cached is_iso -> tileset names mapping, in registration order."""
+        if self._by_iso is None:
+            self._by_iso = {
+                flag: tuple(
+                    name for name, is_iso in self._iso_flags.items() if is_iso == flag
+                )
+                for flag in (False, True)
+            }
+        return self._by_iso
+
+    def get_ortho_tileset_names(self) -> list[str]:
+        """Get names of orthogonal (iso: false) tilesets."""
+        return list(self._tilesets_by_iso()[False])
+
+    def get_iso_tileset_names(self) -> list[str]:
+        """Get names of isometric (iso: true) tilesets."""
+        return list(self._tilesets_by_iso()[True])
 
     def get_tileset(self, tileset_name: str) -> Tileset:
         """Get tileset metadata object.
@@ -797,7 +1041,7 @@ class TilesetService:
         tileset = self.tilesets.get_tileset(tileset_name)
         if not tileset:
             raise KeyError(
-                f"Tileset '{tileset_name}' not found. Available: {self.get_available_tilesets()}"
+                f"Tileset '{tileset_name}' not found. Available: {self._available_tileset_names()}"
             )
         return tileset
 
@@ -805,32 +1049,41 @@ class TilesetService:
         """Return True if any registered tile in this tileset has a
         non-fallback sprite.
 
-        We use the existing `_get_object_and_sprites` helper: if that
-        function returns a TileObject whose `sprites` mapping contains any
-        key other than -1, it means the tile resolved to a graphical
-        sprite (not the ASCII/fallback entry which uses index -1).
+        The answer is memoized per tileset: tiles are only registered while
+        the service is being constructed.
+        """
+        cached = self._has_real_sprites.get(tileset_name)
+        if cached is None:
+            cached = self._has_real_sprites[tileset_name] = self._find_real_sprite(
+                tileset_name
+            )
+        return cached
+
+    def _find_real_sprite(self, tileset_name: str) -> bool:
+        """Uncached scan behind tileset_has_real_sprites().
+
+        Checks sprite indices against the sheet sizes instead of resolving
+        TileObjects: an index resolves exactly when it is within the
+        tileset's global range (core tiles) or the mod's largest sheet
+        (mod tiles). No sheet pixels are decoded.
         """
         tiles_for_ts = self.tiles.tilesets.get(tileset_name, {})
         if not tiles_for_ts:
             return False
 
-        # Iterate through registered tiles and ask for their resolved sprites.
-        # Stop early when we find any non-fallback sprite.
-        for tileid in tiles_for_ts.keys():
-            try:
-                tile_obj: TileObject = self._get_object_and_sprites(
-                    tileset_name, tileid, "white", "?"
-                )
-            except Exception:
-                # Be robust: skip problematic tiles
-                self.logger.debug(
-                    f"tileset_has_real_sprites: failed to resolve {tileid}"
-                )
-                continue
-
-            # If any sprite index is not -1, it's a real sprite
-            for idx in tile_obj.sprites.keys():
-                if idx != -1:
+        global_count = self.sheets.get_global_sprite_count(tileset_name)
+        mod_counts: dict[str, int] = {}
+        for tile_obj in tiles_for_ts.values():
+            if tile_obj.mod_id == "dda":
+                count = global_count
+            else:
+                count = mod_counts.get(tile_obj.mod_id, -1)
+                if count < 0:
+                    count = mod_counts[tile_obj.mod_id] = (
+                        self.sheets.get_mod_sprite_count(tileset_name, tile_obj.mod_id)
+                    )
+            for idx in self._collect_all_sprite_indices(tile_obj.source):
+                if 0 <= idx < count:
                     return True
 
         return False
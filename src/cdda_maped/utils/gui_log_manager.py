@@ -6,13 +6,21 @@ pattern as console and file logging.
 """
 
 import logging
-from typing import Optional
-from PySide6.QtCore import QTimer
+import threading
+from typing import Optional, TYPE_CHECKING
 
-from .log_window import LogWindow
 from ..settings import AppSettings
 from .logging_config import GuiLogHandler
 
+if TYPE_CHECKING:
+    from .log_window import LogWindow
+
+logger = logging.getLogger(__name__)
+
+# The process-wide manager, created by GuiLogManager.initialize()
+_manager: Optional["GuiLogManager"] = None
+_manager_lock = threading.Lock()
+
 
 class GuiLogManager:
     """
@@ -20,20 +28,10 @@ class GuiLogManager:
     similar to how console and file logging work globally.
     """
 
-    _instance: Optional["GuiLogManager"] = None
-    _initialized: bool = False
-
-    def __new__(cls) -> "GuiLogManager":
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+    # __weakref__ is needed for Qt to connect signals to bound methods
+    __slots__ = ("gui_handler", "log_window", "_settings", "__weakref__")
 
     def __init__(self):
-        # Only initialize once
-        if GuiLogManager._initialized:
-            return
-        GuiLogManager._initialized = True
-
         self.gui_handler: Optional["GuiLogHandler"] = None
         self.log_window: Optional["LogWindow"] = None
         self._settings: Optional["AppSettings"] = None
@@ -46,7 +44,11 @@ class GuiLogManager:
         Initialize the singleton with settings and optional existing handler.
         Should be called once during application startup.
         """
-        instance = cls()
+        global _manager
+        with _manager_lock:
+            if _manager is None:
+                _manager = cls()
+            instance = _manager
         instance._settings = settings
 
         if settings.gui_logging:
@@ -57,7 +59,7 @@ class GuiLogManager:
     @classmethod
     def instance(cls) -> Optional["GuiLogManager"]:
         """Get the singleton instance. Returns None if not initialized."""
-        return cls._instance if cls._initialized else None
+        return _manager
 
     def _setup_gui_logging(self, existing_handler: Optional["GuiLogHandler"] = None):
         """Setup GUI logging components."""
@@ -95,14 +97,40 @@ class GuiLogManager:
         if not self.gui_handler or not self.log_window:
             return
 
-        buffer = self.gui_handler.get_buffer()
-        if buffer and self.gui_handler.formatter:
-            logger = logging.getLogger(__name__)
-            logger.debug(f"Loading {len(buffer)} messages from buffer to GUI window")
+        if not self.gui_handler.formatter:
+            return
 
-            for record in buffer:
-                formatted_msg = self.gui_handler.formatter.format(record)
-                self.log_window.add_log_message(record, formatted_msg)
+        handler = self.gui_handler
+        # Take the history under the handler lock, so records already queued
+        # for the window are dropped rather than delivered twice
+        handler.acquire()
+        try:
+            if handler.log_emitter:
+                handler.log_emitter.discard_pending()
+            items = handler.get_formatted_buffer()
+        finally:
+            handler.release()
+
+        if items:
+            logger.debug(f"Loading {len(items)} messages from buffer to GUI window")
+            self.log_window.add_log_messages(items)
+
+    def _on_filter_level_changed(self, level: int) -> None:
+        """Keep the handler's display level in sync with the window filter."""
+        if not self.gui_handler or not self.log_window:
+            return
+
+        previous = self.gui_handler.display_level
+        self.gui_handler.setLevel(level)
+        if level < previous:
+            # Records between the two levels were not sent to the window
+            self.log_window.merge_log_messages(
+                [
+                    (record, msg)
+                    for record, msg in self.gui_handler.get_formatted_buffer()
+                    if level <= record.levelno < previous
+                ]
+            )
 
     def show_window(self) -> None:
         """Show log window if available. Creates it on-demand if needed."""
@@ -119,14 +147,17 @@ class GuiLogManager:
 
                 # Connect handler to window
                 if self.gui_handler and self.gui_handler.log_emitter:
-                    self.gui_handler.log_emitter.log_received.connect(
-                        self.log_window.add_log_message
+                    self.gui_handler.log_emitter.logs_received.connect(
+                        self.log_window.add_log_messages
+                    )
+                    self.log_window.filter_level_changed.connect(
+                        self._on_filter_level_changed
                     )
+                    self.gui_handler.window_connected = True
 
                 # Load buffer history after window creation
                 self._load_buffer_history()
             except Exception as e:
-                logger = logging.getLogger(__name__)
                 logger.error(f"Failed to create log window: {e}")
                 return
 
@@ -146,7 +177,7 @@ class GuiLogManager:
     def toggle_window(self) -> None:
         """Toggle log window visibility."""
         if self.log_window:
-            if self.log_window.isVisible():
+            if self.log_window.is_shown:
                 self.hide_window()
             else:
                 self.show_window()
@@ -157,20 +188,21 @@ class GuiLogManager:
 
     def is_window_visible(self) -> bool:
         """Check if log window is visible."""
-        return self.log_window.isVisible() if self.log_window else False
+        return self.log_window.is_shown if self.log_window else False
 
     def show_on_startup(self) -> None:
         """Show log window on application startup if configured."""
         if not self._settings or not self._settings.gui_show_on_startup:
             return
 
-        logger = logging.getLogger(__name__)
         logger.debug("Showing log window on startup")
         self.show_window()
 
     def hide_after_startup(self, delay_ms: int = 3000) -> None:
         """Hide log window after startup delay."""
-        if self.log_window and self.log_window.isVisible():
+        if self.log_window and self.log_window.is_shown:
+            from PySide6.QtCore import QTimer
+
             QTimer.singleShot(delay_ms, self.hide_window)  # type: ignore
 
     def _on_error_occurred(
@@ -182,7 +214,7 @@ class GuiLogManager:
 
         if self.log_window:
             # Show window if it's hidden
-            if not self.log_window.isVisible():
+            if not self.log_window.is_shown:
                 self.show_window()
 
             # Focus window if configured
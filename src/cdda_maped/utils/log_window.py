@@ -17,14 +17,17 @@ from PySide6.QtWidgets import (
     QApplication,
     QFrame,
 )
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QTimer, Signal
 from PySide6.QtGui import (
     QFont,
     QTextCharFormat,
+    QTextCursor,
     QColor,
     QKeySequence,
     QShortcut,
     QCloseEvent,
+    QHideEvent,
+    QShowEvent,
 )
 
 from ..settings import AppSettings
@@ -50,6 +53,9 @@ class LogWindow(QWidget):
         "CRITICAL": QColor(139, 0, 139),  # DarkMagenta
     }
 
+    # Emitted with the new level before the display is refreshed for it
+    filter_level_changed = Signal(int)
+
     def __init__(self, settings: AppSettings, parent: Optional[QWidget] = None):
         super().__init__(parent)
 
@@ -57,6 +63,9 @@ class LogWindow(QWidget):
         self.auto_scroll = True
         self.current_filter_level = logging.INFO
         self.search_text = ""
+        # Mirrors isVisible(), kept up to date by showEvent/hideEvent so
+        # frequent polls don't go through Qt
+        self.is_shown = False
 
         # Store all log records for filtering/searching
         self.all_log_records: List[Tuple[logging.LogRecord, str]] = []
@@ -190,31 +199,72 @@ class LogWindow(QWidget):
         # Always store the message regardless of filters
         self.all_log_records.append((record, formatted_message))
 
-        # Check level filter
-        if record.levelno < self.current_filter_level:
-            return
-
-        # Check text filter
-        if (
-            self.search_text
-            and self.search_text.lower() not in formatted_message.lower()
-        ):
+        # Check filters
+        if not self._matches_filters(record, formatted_message):
             return
 
         # Display the message
         self._display_message(record, formatted_message)
 
-    def _display_message(
+    def add_log_messages(self, items: List[Tuple[logging.LogRecord, str]]) -> None:
+        """Add several log messages to the display with a single repaint."""
+        self.all_log_records.extend(items)
+
+        shown = [
+            (record, formatted_message)
+            for record, formatted_message in items
+            if self._matches_filters(record, formatted_message)
+        ]
+        if not shown:
+            return
+
+        self.log_display.setUpdatesEnabled(False)
+        try:
+            cursor = self.log_display.textCursor()
+            cursor.movePosition(cursor.MoveOperation.End)
+            # One edit block, so the document lays out once for the batch
+            cursor.beginEditBlock()
+            for record, formatted_message in shown:
+                self._insert_message(cursor, record, formatted_message)
+            cursor.endEditBlock()
+        finally:
+            self.log_display.setUpdatesEnabled(True)
+
+        self._after_display(shown[-1][0])
+
+    def merge_log_messages(self, items: List[Tuple[logging.LogRecord, str]]) -> None:
+        """Store messages the window has not seen yet, in creation order.
+
+        Does not refresh the display; callers are expected to do that.
+        """
+        known = {id(record) for record, _ in self.all_log_records}
+        missing = [item for item in items if id(item[0]) not in known]
+        if missing:
+            self.all_log_records = sorted(
+                self.all_log_records + missing, key=lambda item: item[0].created
+            )
+
+    def _matches_filters(
         self, record: logging.LogRecord, formatted_message: str
+    ) -> bool:
+        """Check a message against the current level and text filters."""
+        # Check level filter
+        if record.levelno < self.current_filter_level:
+            return False
+
+        # Check text filter
+        return (
+            not self.search_text
+            or self.search_text.lower() in formatted_message.lower()
+        )
+
+    def _insert_message(
+        self, cursor: QTextCursor, record: logging.LogRecord, formatted_message: str
     ) -> None:
-        """Display a single message in the log widget."""
+        """Insert a colored message line at the cursor."""
         # Get color for level
         color = self.LEVEL_COLORS.get(record.levelname, QColor(0, 0, 0))
 
-        # Create formatted text
-        cursor = self.log_display.textCursor()
-        cursor.movePosition(cursor.MoveOperation.End)
-
         # Set color
         format = QTextCharFormat()
         format.setForeground(color)
@@ -223,6 +273,18 @@ class LogWindow(QWidget):
         # Insert text
         cursor.insertText(formatted_message + "\n")
 
+    def _display_message(
+        self, record: logging.LogRecord, formatted_message: str
+    ) -> None:
+        """Display a single message in the log widget."""
+        # Create formatted text
+        cursor = self.log_display.textCursor()
+        cursor.movePosition(cursor.MoveOperation.End)
+        self._insert_message(cursor, record, formatted_message)
+        self._after_display(record)
+
+    def _after_display(self, record: logging.LogRecord) -> None:
+        """Scroll and refresh status after messages were displayed."""
         # Auto-scroll if enabled
         if self.auto_scroll:
             self.log_display.verticalScrollBar().setValue(
@@ -240,6 +302,7 @@ class LogWindow(QWidget):
     def on_level_filter_changed(self, level_text: str) -> None:
         """Handle level filter change."""
         self.current_filter_level = getattr(logging, level_text)
+        self.filter_level_changed.emit(self.current_filter_level)
         self.refresh_display()
 
     def on_search_changed(self, text: str) -> None:
@@ -321,6 +384,19 @@ class LogWindow(QWidget):
         event.ignore()
         self.hide()
 
+    def showEvent(self, event: QShowEvent) -> None:
+        """Track visibility when the window is shown."""
+        self.is_shown = True
+        super().showEvent(event)
+
+    def hideEvent(self, event: QHideEvent) -> None:
+        """Track visibility when the window is hidden."""
+        # Spontaneous hide events come from minimizing, which keeps the
+        # window visible as far as isVisible() is concerned
+        if not event.spontaneous():
+            self.is_shown = False
+        super().hideEvent(event)
+
     def show_and_raise(self) -> None:
         """Show window and bring it to front."""
         self.show()
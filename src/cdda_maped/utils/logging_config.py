@@ -4,13 +4,19 @@ Logging configuration for CDDA-maped.
 
 import logging
 import logging.handlers
+import re
 from pathlib import Path
 from collections import deque
-from typing import Optional, List, Callable, Union
+from typing import Any, Optional, List, Callable, Tuple, Union
 
-from PySide6.QtCore import QObject, Signal
 from ..settings import AppSettings
 
+logger = logging.getLogger(__name__)
+
+# Top-level loggers of chatty libraries, capped at INFO; their submodule
+# loggers (e.g. PIL.PngImagePlugin) inherit the level
+_NOISY_LOGGERS = ("PIL", "urllib3", "requests")
+
 
 class ColoredFormatter(logging.Formatter):
     """Форматтер с цветным выводом для консоли."""
@@ -25,21 +31,25 @@ class ColoredFormatter(logging.Formatter):
         "RESET": "\033[0m",  # Reset
     }
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # Ширина поля %(levelname)-Ns: ANSI-коды не должны сбивать выравнивание
+        match = re.search(r"%\(levelname\)-(\d+)s", self._fmt or "")
+        self._level_width = int(match.group(1)) if match else 0
+
     def format(self, record: logging.LogRecord) -> str:
         # Получаем цвет для уровня
-        color = self.COLORS.get(record.levelname, self.COLORS["RESET"])
+        levelname = record.levelname
+        color = self.COLORS.get(levelname, self.COLORS["RESET"])
         reset = self.COLORS["RESET"]
 
-        # Применяем базовое форматирование
-        formatted = super().format(record)
-
-        # Добавляем цвет только к уровню логирования
-        if record.levelname in formatted:
-            formatted = formatted.replace(
-                record.levelname, f"{color}{record.levelname}{reset}"
-            )
-
-        return formatted
+        # Красим только сам уровень, не сканируя готовую строку
+        padding = " " * (self._level_width - len(levelname))
+        record.levelname = f"{color}{levelname}{reset}{padding}"
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
 
 
 class CSVFormatter(logging.Formatter):
@@ -48,17 +58,30 @@ class CSVFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         # Получаем базовые значения
         timestamp = self.formatTime(record, self.datefmt)
-        level = record.levelname.ljust(8)  # Выравниваем по ширине
-        duration = f"{int(record.relativeCreated)} ms"
-        module = record.name
-        line_no = str(record.lineno)
+        duration = int(record.relativeCreated)
         message = record.getMessage()
 
         # Экранируем кавычки в сообщении (стандартный CSV способ)
-        message = message.replace('"', '""')
+        if '"' in message:
+            message = message.replace('"', '""')
 
-        # Формируем CSV строку с кавычками
-        return f'"{timestamp}";{level};"{duration}";"{module}";"{line_no}";"{message}"'
+        # Формируем CSV строку с кавычками, уровень выравниваем по ширине
+        return (
+            f'"{timestamp}";{record.levelname:<8};"{duration} ms";'
+            f'"{record.name}";"{record.lineno}";"{message}"'
+        )
+
+
+class _DeferredRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Rotating file handler that creates the log directory on first write.
+
+    Used with delay=True, so runs that never log to file touch neither the
+    directory nor the file.
+    """
+
+    def _open(self):
+        Path(self.baseFilename).parent.mkdir(exist_ok=True)
+        return super()._open()
 
 
 class GuiLogFormatter(logging.Formatter):
@@ -67,15 +90,15 @@ class GuiLogFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         """Format the log record similar to CSV format."""
         # Получаем базовые значения
-        timestamp = self.formatTime(record, "%Y-%m-%d %H:%M:%S").ljust(20)
-        level = record.levelname.ljust(8)  # Выравниваем по ширине
-        duration = f"{int(record.relativeCreated)} ms".ljust(15)
-        message = record.getMessage().ljust(100)
-        line_no = str(record.lineno)
-        module = record.name
+        timestamp = self.formatTime(record, "%Y-%m-%d %H:%M:%S")
+        duration = f"{int(record.relativeCreated)} ms"
 
-        # Формируем строку: timestamp, level, duration, message, module, line
-        return f"{timestamp}: {level}: {duration}: {message}: {module}:{line_no}"
+        # Формируем строку: timestamp, level, duration, message, module, line;
+        # колонки выравниваются спецификаторами формата за один проход
+        return (
+            f"{timestamp:<20}: {record.levelname:<8}: {duration:<15}: "
+            f"{record.getMessage():<100}: {record.name}:{record.lineno}"
+        )
 
 
 class GuiLogHandler(logging.Handler):
@@ -87,51 +110,73 @@ class GuiLogHandler(logging.Handler):
     def __init__(self, max_lines: int = 1000):
         super().__init__()
         self.max_lines = max_lines
-        self.buffer: deque[logging.LogRecord] = deque(maxlen=max_lines)
-        self.log_emitter: Optional["LogEmitter"] = None
+        # Records with their formatted message, or None if nothing consumed
+        # the record when it was emitted
+        self.buffer: deque[Tuple[logging.LogRecord, Optional[str]]] = deque(
+            maxlen=max_lines
+        )
+        self.log_emitter: Optional[Any] = None
         self.log_callback: Optional[Callable[[logging.LogRecord, str], None]] = None
         self.error_callback: Optional[Callable[[logging.LogRecord, str], None]] = None
+        # Set once a log window listens to log_emitter.logs_received
+        self.window_connected = False
 
         # Always capture DEBUG and above for buffer, but let GUI decide what to show
         super().setLevel(logging.DEBUG)
-        self.display_level = logging.INFO  # Default display level
+        self.display_level: int = logging.INFO  # Default display level
 
         # Lazy-create LogEmitter (requires QApplication)
         try:
-            self.log_emitter = LogEmitter()
+            self.log_emitter = _get_log_emitter_cls()()
         except Exception:
             # QApplication not available yet - will be created lazily later
             pass
 
     def setLevel(self, level: Union[int, str]) -> None:
         """Override setLevel to always capture DEBUG+ but store display level preference."""
-        # Always capture everything for buffer
-        super().setLevel(logging.DEBUG)
-        # Store the requested level for GUI display (but don't use it here)
-        self.display_level = level  # type: ignore[assignment]
+        # The capture level stays at DEBUG from __init__; only the display
+        # level changes here. Only records at or above it are sent to the
+        # window as they arrive, so it is kept numeric for that comparison
+        if isinstance(level, str):
+            number = logging.getLevelName(level.upper())
+            if not isinstance(number, int):
+                raise ValueError(f"Unknown level: {level!r}")
+            level = number
+        self.display_level = level
 
     def emit(self, record: logging.LogRecord) -> None:
         """Emit a log record for GUI display."""
         try:
-            # Format the record
+            # Buffered records are formatted on demand, so skip formatting
+            # while nothing consumes the message
+            is_error = record.levelno >= logging.ERROR
+            if not (
+                self.log_callback
+                or self.window_connected
+                or (is_error and (self.error_callback or self.log_emitter))
+            ):
+                self.buffer.append((record, None))
+                return
+
+            # Format the record and keep the message for buffer replay
             msg = self.format(record)
-
-            # Add to buffer
-            self.buffer.append(record)
+            self.buffer.append((record, msg))
 
             # Use callbacks if Qt not available
             if self.log_callback:
                 self.log_callback(record, msg)
 
             # Check for ERROR level
-            if record.levelno >= logging.ERROR and self.error_callback:
+            if is_error and self.error_callback:
                 self.error_callback(record, msg)
 
-            # Emit Qt signal if available
+            # Queue for the Qt side if available; records below the display
+            # level stay in the buffer and are replayed if the window lowers it
             if self.log_emitter:
-                self.log_emitter.log_received.emit(record, msg)  # type: ignore
+                if self.window_connected and record.levelno >= self.display_level:
+                    self.log_emitter.post(record, msg)
 
-                if record.levelno >= logging.ERROR:
+                if is_error:
                     self.log_emitter.error_occurred.emit(record, msg)  # type: ignore
 
         except Exception:
@@ -140,7 +185,27 @@ class GuiLogHandler(logging.Handler):
 
     def get_buffer(self) -> List[logging.LogRecord]:
         """Get current log buffer as a list."""
-        return list(self.buffer)
+        # emit() appends under the handler lock, so holding it lets us read
+        # the deque directly instead of copying it first
+        self.acquire()
+        try:
+            return [record for record, _ in self.buffer]
+        finally:
+            self.release()
+
+    def get_formatted_buffer(self) -> List[Tuple[logging.LogRecord, str]]:
+        """Get current log buffer with formatted messages.
+
+        Reuses messages formatted at emit time and formats the rest.
+        """
+        self.acquire()
+        try:
+            return [
+                (record, self.format(record) if msg is None else msg)
+                for record, msg in self.buffer
+            ]
+        finally:
+            self.release()
 
     def clear_buffer(self) -> None:
         """Clear the log buffer."""
@@ -159,11 +224,60 @@ class GuiLogHandler(logging.Handler):
         self.error_callback = callback
 
 
-class LogEmitter(QObject):
-    """Qt object for emitting log signals safely across threads."""
+# LogEmitter class, defined on first use so importing this module does not
+# pull in PySide6
+_log_emitter_cls: Optional[type] = None
+
+
+def _get_log_emitter_cls() -> type:
+    """Get the LogEmitter Qt class, defining it on first call."""
+    global _log_emitter_cls
+    if _log_emitter_cls is None:
+        from PySide6.QtCore import QObject, Qt, Signal
+
+        class LogEmitter(QObject):
+            """Qt object for emitting log signals safely across threads.
+
+            Posted records are collected and delivered in batches through
+            logs_received, one per pass of the emitter's event loop.
+            """
 
-    log_received = Signal(logging.LogRecord, str)
-    error_occurred = Signal(logging.LogRecord, str)
+            logs_received = Signal(list)
+            error_occurred = Signal(logging.LogRecord, str)
+            _flush_requested = Signal()
+
+            def __init__(self) -> None:
+                super().__init__()
+                self._pending: deque[Tuple[logging.LogRecord, str]] = deque()
+                self._flush_scheduled = False
+                self._flush_requested.connect(
+                    self._flush, Qt.ConnectionType.QueuedConnection
+                )
+
+            def post(self, record: logging.LogRecord, msg: str) -> None:
+                """Queue a record for the next logs_received batch."""
+                self._pending.append((record, msg))
+                if not self._flush_scheduled:
+                    self._flush_scheduled = True
+                    self._flush_requested.emit()
+
+            def discard_pending(self) -> None:
+                """Drop records that were posted but not delivered yet."""
+                self._pending.clear()
+
+            def _flush(self) -> None:
+                # Reset first: records posted while draining schedule a new
+                # flush instead of being left behind
+                self._flush_scheduled = False
+                items: List[Tuple[logging.LogRecord, str]] = []
+                pending = self._pending
+                while pending:
+                    items.append(pending.popleft())
+                if items:
+                    self.logs_received.emit(items)
+
+        _log_emitter_cls = LogEmitter
+    return _log_emitter_cls
 
 
 def setup_logging(settings: "AppSettings") -> None:
@@ -217,14 +331,14 @@ def setup_logging(settings: "AppSettings") -> None:
         try:
             # CSV formatter for file - structured data with semicolon separator
             log_path = Path(log_file)
-            log_path.parent.mkdir(exist_ok=True)
             detailed_formatter = CSVFormatter(datefmt="%Y-%m-%d %H:%M:%S")
 
-            file_handler = logging.handlers.RotatingFileHandler(
+            file_handler = _DeferredRotatingFileHandler(
                 log_file,
                 maxBytes=10 * 1024 * 1024,  # 10MB
                 backupCount=5,
                 encoding="utf-8",  # Fix encoding for Russian text
+                delay=True,  # Open the file on first record
             )
             file_handler.setLevel(logging.DEBUG)  # File always captures DEBUG
             file_handler.setFormatter(detailed_formatter)
@@ -234,23 +348,22 @@ def setup_logging(settings: "AppSettings") -> None:
             root_logger.warning(f"Could not setup file logging: {e}")
 
     # Suppress DEBUG logs from noisy libraries
-    logging.getLogger("PIL").setLevel(logging.INFO)
-    logging.getLogger("PIL.PngImagePlugin").setLevel(logging.INFO)
-    logging.getLogger("PIL.JpegImagePlugin").setLevel(logging.INFO)
-    logging.getLogger("urllib3").setLevel(logging.INFO)
-    logging.getLogger("requests").setLevel(logging.INFO)
+    for name in _NOISY_LOGGERS:
+        logging.getLogger(name).setLevel(logging.INFO)
 
-    # GUI handler - always enabled
+    # GUI handler - only if enabled, so headless runs don't buffer and format
+    # every record for a window that never shows
     gui_handler = None
-    try:
-        gui_handler = GuiLogHandler(max_lines=gui_max_lines)
-        gui_formatter = GuiLogFormatter()
-        gui_handler.setFormatter(gui_formatter)
-        gui_handler.setLevel(getattr(logging, gui_level.upper(), logging.INFO))
-        root_logger.addHandler(gui_handler)
-    except Exception as e:
-        # If GUI logging fails, continue without it
-        logging.getLogger(__name__).warning(f"Could not setup GUI logging: {e}")
+    if settings.gui_logging:
+        try:
+            gui_handler = GuiLogHandler(max_lines=gui_max_lines)
+            gui_formatter = GuiLogFormatter()
+            gui_handler.setFormatter(gui_formatter)
+            gui_handler.setLevel(getattr(logging, gui_level.upper(), logging.INFO))
+            root_logger.addHandler(gui_handler)
+        except Exception as e:
+            # If GUI logging fails, continue without it
+            logger.warning(f"Could not setup GUI logging: {e}")
 
     # Initialize singleton GUI logging
     if gui_handler:
@@ -258,17 +371,16 @@ def setup_logging(settings: "AppSettings") -> None:
             from .gui_log_manager import GuiLogManager
 
             GuiLogManager.initialize(settings, gui_handler)
-            logger = logging.getLogger(__name__)
             logger.debug("Singleton GUI logging initialized")
         except ImportError:
             # GUI components not available
             pass
 
     # Log startup message
-    logger = logging.getLogger(__name__)
     logger.info("Logging initialized")
     if console_enabled:
         logger.debug(f"Console logging: {console_level} (colors: {use_colors})")
     if file_enabled and log_path:
         logger.debug(f"File logging: DEBUG at {log_path.absolute()}")
-    logger.debug(f"GUI logging: {gui_level}")
+    if gui_handler:
+        logger.debug(f"GUI logging: {gui_level}")
@@ -0,0 +1,152 @@
+import builtins
+import os
+from pathlib import Path
+from typing import Any
+
+import orjson
+import pytest
+from PIL import Image
+
+from cdda_maped.tilesets.service import TilesetService
+
+MOD_TILES = [
+    {
+        "type": "mod_tileset",
+        "compatibility": ["TestSet"],
+        "tiles-new": [{"file": "m.png", "tiles": [{"id": "t_grass", "fg": 0}]}],
+    }
+]
+
+
+@pytest.fixture
+def game_path(tmp_path: Path) -> Path:
+    """Minimal game tree: one base tileset and one mod with a mod_tileset."""
+    game = tmp_path / "game"
+    ts_dir = game / "gfx" / "TS"
+    ts_dir.mkdir(parents=True)
+    (ts_dir / "tileset.txt").write_text(
+        "NAME: TestSet\nVIEW: Test Set\nJSON: tile_config.json\n"
+    )
+    (ts_dir / "tile_config.json").write_bytes(
+        orjson.dumps(
+            {
+                "tile_info": [{"width": 32, "height": 32, "pixelscale": 1}],
+                "tiles-new": [{"file": "a.png", "tiles": [{"id": "t_dirt", "fg": 0}]}],
+            }
+        )
+    )
+    Image.new("RGBA", (32, 32), (255, 0, 0, 255)).save(ts_dir / "a.png")
+
+    mod_dir = game / "data" / "mods" / "mymod"
+    mod_dir.mkdir(parents=True)
+    (mod_dir / "tiles.json").write_bytes(orjson.dumps(MOD_TILES))
+    (mod_dir / "items.json").write_bytes(orjson.dumps([{"type": "GENERIC"}]))
+    Image.new("RGBA", (32, 32), (0, 255, 0, 255)).save(mod_dir / "m.png")
+    return game
+
+
+def load(game_path: Path, cache_dir: Path) -> TilesetService:
+    return TilesetService(game_path=str(game_path), cache_dir=str(cache_dir))
+
+
+def cache_file(cache_dir: Path) -> Path:
+    return cache_dir / "mod_tilesets.json"
+
+
+def assert_mod_loaded(service: TilesetService) -> None:
+    assert "mymod" in service.get_available_mods("TS")
+
+
+def record_opened_json(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Record every mod .json file opened through builtins.open."""
+    opened: list[str] = []
+    real_open = builtins.open
+
+    def spy(file: Any, *args: Any, **kwargs: Any) -> Any:
+        if str(file).endswith(".json") and "mods" in str(file):
+            opened.append(os.path.basename(str(file)))
+        return real_open(file, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "open", spy)
+    return opened
+
+
+def test_cache_hit_skips_reading_mod_files(
+    game_path: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    cache_dir = tmp_path / "cache"
+    assert_mod_loaded(load(game_path, cache_dir))
+    assert cache_file(cache_dir).exists()
+
+    opened = record_opened_json(monkeypatch)
+    assert_mod_loaded(load(game_path, cache_dir))
+    assert opened == []
+
+
+def test_changed_file_is_reread(
+    game_path: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    cache_dir = tmp_path / "cache"
+    load(game_path, cache_dir)
+
+    tiles = game_path / "data" / "mods" / "mymod" / "tiles.json"
+    changed = [dict(MOD_TILES[0], compatibility=["TestSet", "Other"])]
+    tiles.write_bytes(orjson.dumps(changed))
+
+    opened = record_opened_json(monkeypatch)
+    assert_mod_loaded(load(game_path, cache_dir))
+    assert opened == ["tiles.json"]
+
+    entries = orjson.loads(cache_file(cache_dir).read_bytes())["files"]
+    assert entries[str(tiles)][2] == changed
+
+
+def test_cache_rewritten_only_when_entries_change(
+    game_path: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    cache_dir = tmp_path / "cache"
+    load(game_path, cache_dir)
+
+    replaced: list[str] = []
+    real_replace = os.replace
+
+    def spy(src: Any, dst: Any) -> None:
+        replaced.append(str(dst))
+        real_replace(src, dst)
+
+    monkeypatch.setattr(os, "replace", spy)
+    load(game_path, cache_dir)
+    assert replaced == []
+
+    (game_path / "data" / "mods" / "mymod" / "extra.json").write_bytes(b"[]")
+    load(game_path, cache_dir)
+    assert replaced == [str(cache_file(cache_dir))]
+
+
+def test_version_mismatch_is_ignored(
+    game_path: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    cache_dir = tmp_path / "cache"
+    load(game_path, cache_dir)
+
+    # Entries matching the files on disk but with no tilesets in them: a
+    # cache of another version must not be trusted
+    data = orjson.loads(cache_file(cache_dir).read_bytes())
+    data["version"] = -1
+    data["files"] = {path: [e[0], e[1], []] for path, e in data["files"].items()}
+    cache_file(cache_dir).write_bytes(orjson.dumps(data))
+
+    opened = record_opened_json(monkeypatch)
+    assert_mod_loaded(load(game_path, cache_dir))
+    assert "tiles.json" in opened
+    assert orjson.loads(cache_file(cache_dir).read_bytes())["version"] != -1
+
+
+def test_corrupt_cache_is_ignored(game_path: Path, tmp_path: Path):
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    cache_file(cache_dir).write_bytes(b"{not json")
+
+    assert_mod_loaded(load(game_path, cache_dir))
+    data = orjson.loads(cache_file(cache_dir).read_bytes())
+    assert len(data["files"]) == 2
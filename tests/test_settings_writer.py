@@ -0,0 +1,113 @@
+"""Tests for the background settings writer."""
+
+from pathlib import Path
+from typing import Any, Iterator
+
+import pytest
+from PySide6.QtCore import QSettings
+
+from cdda_maped.settings import writer as writer_module
+from cdda_maped.settings.writer import SettingsWriter
+
+ORGANIZATION = "vetall812"
+APPLICATION = "cdda_maped"
+
+
+@pytest.fixture(autouse=True)
+def isolated_settings(tmp_path: Path) -> Iterator[None]:
+    """Point QSettings storage at a temporary directory."""
+    for fmt in (QSettings.Format.NativeFormat, QSettings.Format.IniFormat):
+        QSettings.setPath(fmt, QSettings.Scope.UserScope, str(tmp_path))
+    yield
+
+
+def read_stored(profile: str, key: str) -> Any:
+    """Read a value from storage through a fresh QSettings instance."""
+    settings = QSettings(ORGANIZATION, APPLICATION)
+    settings.beginGroup(profile)
+    return settings.value(key)
+
+
+class TestSettingsWriter:
+    """Test ordering and shutdown of SettingsWriter."""
+
+    def test_flush_applies_writes_in_order(self) -> None:
+        """Test later writes to a key win once flush() returns."""
+        writer = SettingsWriter(ORGANIZATION, APPLICATION, "writer_order")
+        try:
+            writer.put("a", "1")
+            writer.put("b", "2")
+            writer.put("a", "3")
+            writer.flush(timeout=5.0)
+
+            assert read_stored("writer_order", "a") == "3"
+            assert read_stored("writer_order", "b") == "2"
+        finally:
+            writer.stop()
+
+    def test_stop_persists_pending_writes(self) -> None:
+        """Test stop() applies everything still queued before returning."""
+        writer = SettingsWriter(ORGANIZATION, APPLICATION, "writer_stop")
+        for i in range(100):
+            writer.put(f"key{i}", str(i))
+        writer.stop()
+
+        assert read_stored("writer_stop", "key0") == "0"
+        assert read_stored("writer_stop", "key99") == "99"
+        # Stopping twice, or flushing a stopped writer, returns immediately
+        writer.stop()
+        writer.flush(timeout=1.0)
+
+    def test_failed_write_keeps_thread_alive(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a write that raises is logged and later writes still land."""
+
+        class FailingSettings(QSettings):
+            def setValue(self, key: str, value: Any) -> None:
+                if key == "bad":
+                    raise TypeError("unconvertible value")
+                super().setValue(key, value)
+
+        monkeypatch.setattr(writer_module, "QSettings", FailingSettings)
+        writer = SettingsWriter(ORGANIZATION, APPLICATION, "writer_fail")
+        try:
+            writer.put("bad", "x")
+            writer.put("good", "y")
+            writer.flush(timeout=5.0)
+
+            assert read_stored("writer_fail", "good") == "y"
+            assert read_stored("writer_fail", "bad") is None
+        finally:
+            writer.stop()
+
+
+class TestAppSettingsWrites:
+    """Test AppSettings writes going through the writer thread."""
+
+    def test_set_value_is_visible_before_and_after_sync(self) -> None:
+        """Test the shared cache serves a write at once and sync() stores it."""
+        from cdda_maped.settings import AppSettings
+
+        settings_obj = AppSettings(profile="writer_cache")
+        settings_obj.set_value("tests/value", "cached")
+        assert settings_obj.cached_value("tests/value") == "cached"
+
+        settings_obj.sync()
+        assert read_stored("writer_cache", "tests/value") == "cached"
+
+    def test_out_of_range_animation_timeout_is_fixed_on_first_read(self) -> None:
+        """Test a hand-edited timeout is clamped once and written back."""
+        from cdda_maped.settings import AppSettings
+
+        stored = QSettings(ORGANIZATION, APPLICATION)
+        stored.beginGroup("writer_timeout")
+        stored.setValue("editor/animation_timeout", "50000")
+        stored.sync()
+
+        settings_obj = AppSettings(profile="writer_timeout")
+        assert settings_obj.editor.animation_timeout == 1000
+        assert settings_obj.editor.animation_timeout == 1000
+
+        settings_obj.sync()
+        assert int(read_stored("writer_timeout", "editor/animation_timeout")) == 1000